@@ -2,13 +2,15 @@
 Garage domain model
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from decimal import Decimal
 from datetime import date
 from typing import Optional
 
+from .money import to_cents
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Garage:
     """
     Represents a garage rental unit with its payment details
@@ -17,6 +19,8 @@ class Garage:
     monthly_rent: Decimal
     start_date: date
     payment_day: int
+    # Monthly rent in kopecks, derived once so matching compares ints instead of Decimals
+    rent_cents: int = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate garage data after initialization"""
@@ -28,6 +32,8 @@ class Garage:
         
         if not (1 <= self.payment_day <= 31):
             raise ValueError("Payment day must be between 1 and 31")
+        
+        object.__setattr__(self, 'rent_cents', to_cents(self.monthly_rent))
     
     @property
     def display_name(self) -> str:
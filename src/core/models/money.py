@@ -0,0 +1,21 @@
+"""
+Money representation helpers
+"""
+
+from decimal import Decimal, ROUND_HALF_UP
+
+
+def to_cents(amount: Decimal) -> int:
+    """
+    Convert ruble amount to integer kopecks
+    
+    Amounts in statements and registries carry at most two decimal places,
+    so integer kopecks represent them exactly and compare as plain ints.
+    
+    Args:
+        amount: Amount in rubles
+        
+    Returns:
+        Amount in kopecks, rounded half up
+    """
+    return int((Decimal(amount) * 100).to_integral_value(rounding=ROUND_HALF_UP))
@@ -18,7 +18,7 @@ class PaymentStatus(Enum):
     UNCLEAR = "unclear"
 
 
-@dataclass
+@dataclass(slots=True)
 class Payment:
     """
     Represents a payment for garage rental
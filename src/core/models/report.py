@@ -82,25 +82,25 @@ class PaymentReport:
         """Calculate summary statistics from payments"""
         from .payment import PaymentStatus
         
-        total_garages = len(payments)
-        received_count = sum(1 for p in payments if p.status == PaymentStatus.RECEIVED)
-        overdue_count = sum(1 for p in payments if p.status == PaymentStatus.OVERDUE)
-        pending_count = sum(1 for p in payments if p.status == PaymentStatus.PENDING)
-        not_due_count = sum(1 for p in payments if p.status == PaymentStatus.NOT_DUE)
-        unclear_count = sum(1 for p in payments if p.status == PaymentStatus.UNCLEAR)
-        
-        total_expected = float(sum(p.amount for p in payments))
-        total_received = float(sum(p.amount for p in payments if p.status == PaymentStatus.RECEIVED))
+        # Single pass over payments: status counts and both totals together
+        status_counts = dict.fromkeys(PaymentStatus, 0)
+        total_expected = 0
+        total_received = 0
+        for p in payments:
+            status_counts[p.status] += 1
+            total_expected += p.amount
+            if p.status is PaymentStatus.RECEIVED:
+                total_received += p.amount
         
         return PaymentSummary(
-            total_garages=total_garages,
-            received_count=received_count,
-            overdue_count=overdue_count,
-            pending_count=pending_count,
-            not_due_count=not_due_count,
-            unclear_count=unclear_count,
-            total_expected=total_expected,
-            total_received=total_received
+            total_garages=len(payments),
+            received_count=status_counts[PaymentStatus.RECEIVED],
+            overdue_count=status_counts[PaymentStatus.OVERDUE],
+            pending_count=status_counts[PaymentStatus.PENDING],
+            not_due_count=status_counts[PaymentStatus.NOT_DUE],
+            unclear_count=status_counts[PaymentStatus.UNCLEAR],
+            total_expected=float(total_expected),
+            total_received=float(total_received)
         )
     
     def get_overdue_payments(self) -> List[Payment]:
@@ -2,13 +2,15 @@
 Transaction domain model
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from decimal import Decimal
 from datetime import date
 from typing import Optional
 
+from .money import to_cents
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Transaction:
     """
     Represents a bank transaction from statement
@@ -18,6 +20,8 @@ class Transaction:
     category: str
     source: str = "bank_statement"
     description: Optional[str] = None
+    # Amount in kopecks, derived once so matching compares ints instead of Decimals
+    amount_cents: int = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate transaction data after initialization"""
@@ -26,6 +30,8 @@ class Transaction:
         
         if not self.category:
             raise ValueError("Transaction category cannot be empty")
+        
+        object.__setattr__(self, 'amount_cents', to_cents(self.amount))
     
     @property
     def is_incoming(self) -> bool:
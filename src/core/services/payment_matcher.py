@@ -2,9 +2,12 @@
 Payment matching service
 """
 
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from dataclasses import fields
 from typing import List, Optional, Tuple, Dict
 from decimal import Decimal
-from datetime import date, timedelta
+from datetime import date
 import logging
 
 from ..models.garage import Garage
@@ -13,6 +16,59 @@ from ..models.transaction import Transaction
 from ...infrastructure.localization.i18n import LocalizationManager
 
 
+# Same tolerance Transaction.matches_amount applies by default (0.01 RUB), in kopecks
+AMOUNT_TOLERANCE_CENTS = 1
+
+# Payment fields in declaration order, as returned column-wise by match_payments_arrays
+PAYMENT_COLUMNS = tuple(field.name for field in fields(Payment))
+
+
+def _index_by_amount(tx_cents: List[int], tx_ordinals: List[int]) -> Dict[int, Tuple[List[int], List[int]]]:
+    """
+    Group transactions by amount in kopecks into date-sorted buckets
+    
+    Each bucket is a pair of parallel lists (ordinals, indices) ordered by date,
+    so a date window inside a bucket is located by bisection.
+    """
+    grouped = defaultdict(list)
+    for i, cents in enumerate(tx_cents):
+        grouped[cents].append((tx_ordinals[i], i))
+    
+    index = {}
+    for cents, entries in grouped.items():
+        entries.sort()
+        index[cents] = ([ordinal for ordinal, _ in entries], [i for _, i in entries])
+    return index
+
+
+def _scan_candidates(tx_by_amount: Dict[int, Tuple[List[int], List[int]]],
+                     used: bytearray,
+                     amount_cents: int,
+                     start_ordinal: int,
+                     end_ordinal: int) -> List[int]:
+    """
+    Collect indices of unused transactions matching amount_cents within [start_ordinal; end_ordinal]
+    
+    Only the amount buckets within tolerance are visited, and only the date
+    window of each bucket, so each garage looks at the few transactions that
+    can actually match. Indices are returned in statement order.
+    """
+    candidates = []
+    for cents in range(amount_cents - AMOUNT_TOLERANCE_CENTS, amount_cents + AMOUNT_TOLERANCE_CENTS + 1):
+        bucket = tx_by_amount.get(cents)
+        if bucket is None:
+            continue
+        
+        ordinals, indices = bucket
+        first = bisect_left(ordinals, start_ordinal)
+        last = bisect_right(ordinals, end_ordinal)
+        candidates.extend(i for i in indices[first:last] if not used[i])
+    
+    # Statement order keeps tie-breaking between equally close transactions stable
+    candidates.sort()
+    return candidates
+
+
 class PaymentMatcher:
     """
     Service for matching bank transactions to garage rental payments
@@ -49,58 +105,102 @@ class PaymentMatcher:
         Returns:
             List of payments with matched transactions and statuses
         """
-        payments = []
-        used_transactions = set()
+        columns = self.match_payments_arrays(garages, transactions, analysis_date, target_month)
+        return [Payment(*row) for row in zip(*(columns[name] for name in PAYMENT_COLUMNS))]
+    
+    def match_payments_arrays(self,
+                              garages: List[Garage],
+                              transactions: List[Transaction],
+                              analysis_date: date,
+                              target_month: Optional[date] = None) -> Dict[str, list]:
+        """
+        Match transactions to garage payments, returning payment fields column-wise
+        
+        Same matching as match_payments, for consumers that read fields
+        in bulk and do not need Payment objects.
+        
+        Returns:
+            Dict of PAYMENT_COLUMNS names to lists, one entry per garage in input order
+        """
+        columns = {name: [] for name in PAYMENT_COLUMNS}
         amount_conflicts = self._find_amount_conflicts(garages)
         
         # Use target_month if provided, otherwise use analysis_date month
         if target_month is None:
             target_month = date(analysis_date.year, analysis_date.month, 1)
         
+        # Struct-of-arrays view of the statement: transaction dates as ordinals,
+        # an amount -> indices lookup and a used flag per transaction, so each
+        # garage only compares plain ints of the transactions carrying its rent
+        tx_ordinals = [t.date.toordinal() for t in transactions]
+        tx_by_amount = _index_by_amount([t.amount_cents for t in transactions], tx_ordinals)
+        used = bytearray(len(transactions))
+        analysis_ordinal = analysis_date.toordinal()
+        
+        from .date_calculator import DateCalculator
+        from .status_determiner import StatusDeterminer
+        date_calc = DateCalculator()
+        status_determiner = StatusDeterminer(grace_period_days=self.grace_period_days)
+        matched_note = self.i18n.get("notes.payment_matched", default="Payment matched")
+        unmatched_note = self.i18n.get("notes.no_payment", default="No matching payment found")
+        
         for garage in garages:
             # Calculate expected payment date for target month
-            from .date_calculator import DateCalculator
-            date_calc = DateCalculator()
             expected_date = date_calc.calculate_expected_date(garage, target_month)
             
             # Find matching transaction with fallback to wider search
             transaction, conflict_info = self._find_best_match(
-                garage.monthly_rent,
+                garage,
                 expected_date,
-                transactions,
-                used_transactions,
+                tx_ordinals,
+                tx_by_amount,
+                used,
                 amount_conflicts.get(garage.monthly_rent, []),
-                analysis_date
+                analysis_ordinal
             )
             
             # If no transaction found in narrow window, try wider search within statement period
             if transaction is None:
                 transaction, conflict_info = self._find_fallback_match(
-                    garage.monthly_rent,
+                    garage,
                     transactions,
-                    used_transactions,
+                    tx_ordinals,
+                    tx_by_amount,
+                    used,
                     amount_conflicts.get(garage.monthly_rent, []),
-                    analysis_date
+                    analysis_ordinal
                 )
             
-            # Create payment record
-            payment = Payment(
-                garage_id=garage.id,
-                amount=garage.monthly_rent,
-                expected_date=expected_date
-            )
-            
-            if transaction:
+            if transaction is not None:
                 # Mark transaction as used
-                used_transactions.add(id(transaction))
-                payment = self._create_matched_payment(payment, transaction, conflict_info)
+                used[transaction] = 1
+                # For matched payments, status should be RECEIVED regardless of timing
+                # Days difference: positive if late, negative if early
+                actual_date = transactions[transaction].date
+                status = PaymentStatus.RECEIVED
+                days_overdue = tx_ordinals[transaction] - expected_date.toordinal()
+                notes = conflict_info or matched_note
             else:
                 # No matching transaction found
-                payment = self._create_unmatched_payment(payment, analysis_date)
+                actual_date = None
+                status, days_overdue = status_determiner.determine_status(
+                    expected_date=expected_date,
+                    analysis_date=analysis_date,
+                    has_payment=False,
+                    actual_payment_date=None,
+                    has_multiple_payments=False
+                )
+                notes = unmatched_note
             
-            payments.append(payment)
+            columns['garage_id'].append(garage.id)
+            columns['amount'].append(garage.monthly_rent)
+            columns['expected_date'].append(expected_date)
+            columns['actual_date'].append(actual_date)
+            columns['status'].append(status)
+            columns['days_overdue'].append(days_overdue)
+            columns['notes'].append(notes)
         
-        return payments
+        return columns
     
     def _find_amount_conflicts(self, garages: List[Garage]) -> Dict[Decimal, List[str]]:
         """Identify garages with duplicate rental amounts"""
@@ -114,30 +214,27 @@ class PaymentMatcher:
         return {amount: garage_ids for amount, garage_ids in amount_map.items() if len(garage_ids) > 1}
     
     def _find_best_match(self, 
-                        amount: Decimal, 
+                        garage: Garage, 
                         expected_date: date,
-                        transactions: List[Transaction],
-                        used_transactions: set,
+                        tx_ordinals: List[int],
+                        tx_by_amount: Dict[int, Tuple[List[int], List[int]]],
+                        used: bytearray,
                         conflicting_garages: List[str],
-                        analysis_date: date) -> Tuple[Optional[Transaction], str]:
+                        analysis_ordinal: int) -> Tuple[Optional[int], str]:
         """
         Find the best matching transaction for a payment
         
         Returns:
-            Tuple of (transaction, conflict_info)
+            Tuple of (transaction index, conflict_info)
         """
-        # Define search window
-        start_date = expected_date - timedelta(days=self.search_window_days)
-        end_date = expected_date + timedelta(days=self.grace_period_days)
+        # Define search window, capped at the analysis date
+        expected_ordinal = expected_date.toordinal()
+        start_ordinal = expected_ordinal - self.search_window_days
+        end_ordinal = min(expected_ordinal + self.grace_period_days, analysis_ordinal)
         
         # Find all matching transactions
-        candidates = []
-        for transaction in transactions:
-            if (id(transaction) not in used_transactions and
-                transaction.matches_amount(amount) and
-                start_date <= transaction.date <= end_date and
-                transaction.date <= analysis_date):  # Only consider transactions up to analysis date
-                candidates.append(transaction)
+        candidates = _scan_candidates(tx_by_amount, used,
+                                      garage.rent_cents, start_ordinal, end_ordinal)
         
         if not candidates:
             return None, ""
@@ -149,81 +246,35 @@ class PaymentMatcher:
             return candidates[0], conflict_info
         
         # Multiple candidates - choose closest to expected date
-        best_transaction = min(candidates, 
-                             key=lambda t: abs((t.date - expected_date).days))
+        best_index = min(candidates, key=lambda i: abs(tx_ordinals[i] - expected_ordinal))
         
         conflict_info = self.i18n.get("notes.multiple_matches", default="Multiple matches found") + ", " + self.i18n.get("notes.closest_match", default="selected closest to expected date")
         if conflicting_garages:
             conflict_info += ". " + self.i18n.get("notes.amount_shared", garages=", ".join(conflicting_garages), default="Amount conflict with garages: {garages}")
         
-        return best_transaction, conflict_info
-    
-    def _create_matched_payment(self, payment: Payment, transaction: Transaction, conflict_info: str) -> Payment:
-        """Create payment record for matched transaction"""
-        from .status_determiner import StatusDeterminer
-        status_determiner = StatusDeterminer(grace_period_days=self.grace_period_days)
-        
-        # For matched payments, status should be RECEIVED regardless of timing
-        # If we found a matching payment by amount, it's received
-        status = PaymentStatus.RECEIVED
-        
-        # Calculate days difference: positive if late, negative if early  
-        days_overdue = (transaction.date - payment.expected_date).days
-        
-        return Payment(
-            garage_id=payment.garage_id,
-            amount=payment.amount,
-            expected_date=payment.expected_date,
-            actual_date=transaction.date,
-            status=status,
-            days_overdue=days_overdue,
-            notes=conflict_info if conflict_info else self.i18n.get("notes.payment_matched", default="Payment matched")
-        )
-    
-    def _create_unmatched_payment(self, payment: Payment, analysis_date: date) -> Payment:
-        """Create payment record for unmatched payment"""
-        from .status_determiner import StatusDeterminer
-        status_determiner = StatusDeterminer(grace_period_days=self.grace_period_days)
-        
-        status, days_overdue = status_determiner.determine_status(
-            expected_date=payment.expected_date,
-            analysis_date=analysis_date,
-            has_payment=False,
-            actual_payment_date=None,
-            has_multiple_payments=False
-        )
-        
-        return Payment(
-            garage_id=payment.garage_id,
-            amount=payment.amount,
-            expected_date=payment.expected_date,
-            actual_date=None,
-            status=status,
-            days_overdue=days_overdue,
-            notes=self.i18n.get("notes.no_payment", default="No matching payment found")
-        )
+        return best_index, conflict_info
     
     def _find_fallback_match(self, 
-                           amount: Decimal, 
+                           garage: Garage, 
                            transactions: List[Transaction],
-                           used_transactions: set,
+                           tx_ordinals: List[int],
+                           tx_by_amount: Dict[int, Tuple[List[int], List[int]]],
+                           used: bytearray,
                            conflicting_garages: List[str],
-                           analysis_date: date) -> Tuple[Optional[Transaction], str]:
+                           analysis_ordinal: int) -> Tuple[Optional[int], str]:
         """
         Fallback search for transactions anywhere in the statement period
         
         Used when narrow window search fails - searches by amount only
         
         Returns:
-            Tuple of (transaction, conflict_info)
+            Tuple of (transaction index, conflict_info)
         """
+        amount = garage.monthly_rent
+        
         # Find all matching transactions by amount only (but still within analysis date limit)
-        candidates = []
-        for transaction in transactions:
-            if (id(transaction) not in used_transactions and
-                transaction.matches_amount(amount) and
-                transaction.date <= analysis_date):  # Only consider transactions up to analysis date
-                candidates.append(transaction)
+        candidates = _scan_candidates(tx_by_amount, used,
+                                      garage.rent_cents, 0, analysis_ordinal)
         
         if not candidates:
             self.logger.debug(f"Fallback search: No transactions found for amount {amount}")
@@ -235,14 +286,14 @@ class PaymentMatcher:
             else:
                 conflict_info = self.i18n.get("notes.wide_search", default="Wide search match")
             
-            self.logger.info(f"Fallback match found for amount {amount}: {candidates[0].date}")
+            self.logger.info(f"Fallback match found for amount {amount}: {transactions[candidates[0]].date}")
             return candidates[0], conflict_info
         
         # Multiple candidates - prefer the earliest transaction
-        best_transaction = min(candidates, key=lambda t: t.date)
+        best_index = min(candidates, key=tx_ordinals.__getitem__)
         conflict_info = self.i18n.get("notes.wide_search_earliest", count=len(candidates), default="Wide search - earliest of {count} matches")
         if conflicting_garages:
             conflict_info += " (" + self.i18n.get("notes.amount_shared", garages=", ".join(conflicting_garages), default="amount shared with garages: {garages}") + ")"
         
-        self.logger.warning(f"Fallback search found {len(candidates)} candidates for amount {amount}, using earliest: {best_transaction.date}")
-        return best_transaction, conflict_info
+        self.logger.warning(f"Fallback search found {len(candidates)} candidates for amount {amount}, using earliest: {transactions[best_index].date}")
+        return best_index, conflict_info
@@ -2,7 +2,7 @@
 Payment status determination service
 """
 
-from datetime import date, timedelta
+from datetime import date
 from typing import Tuple, Optional
 import logging
 
@@ -55,39 +55,35 @@ class StatusDeterminer:
         if has_multiple_payments:
             return PaymentStatus.UNCLEAR, 0
         
+        # Даты сравниваются как порядковые номера дней: одно вычитание int вместо timedelta
+        expected_ordinal = expected_date.toordinal()
+        
         # Если найден точный платеж в окне [расчетная_дата - 7 дней; расчетная_дата + 3 дня] - получен
         if has_payment:
             if actual_payment_date:
+                # Разность дат: положительные = опоздание, отрицательные = досрочно
+                days_difference = actual_payment_date.toordinal() - expected_ordinal
                 # Проверяем, что платеж в допустимом окне
-                earliest_acceptable = expected_date - timedelta(days=7)
-                latest_acceptable = expected_date + timedelta(days=self.grace_period_days)
-                if earliest_acceptable <= actual_payment_date <= latest_acceptable:
-                    # Рассчитываем разность дат: положительные = опоздание, отрицательные = досрочно
-                    days_difference = (actual_payment_date - expected_date).days
+                if -7 <= days_difference <= self.grace_period_days:
                     return PaymentStatus.RECEIVED, days_difference
-                else:
-                    # Платеж найден, но вне допустимого окна - может быть неопределенно
-                    return PaymentStatus.UNCLEAR, 0
-            else:
-                return PaymentStatus.RECEIVED, 0
+                # Платеж найден, но вне допустимого окна - может быть неопределенно
+                return PaymentStatus.UNCLEAR, 0
+            return PaymentStatus.RECEIVED, 0
         
         # Если платеж не найден, определяем статус по датам
-        grace_end = expected_date + timedelta(days=self.grace_period_days)
+        days_since_expected = analysis_date.toordinal() - expected_ordinal
         
         # Срок не наступил: текущая дата < расчетная_дата
-        if analysis_date < expected_date:
+        if days_since_expected < 0:
             return PaymentStatus.NOT_DUE, 0
         
         # Ожидается оплата: расчетная_дата ≤ текущая дата ≤ расчетная_дата + 3 дня
-        elif expected_date <= analysis_date <= grace_end:
-            days_pending = (analysis_date - expected_date).days
-            return PaymentStatus.PENDING, days_pending
+        if days_since_expected <= self.grace_period_days:
+            return PaymentStatus.PENDING, days_since_expected
         
         # Просрочен: текущая дата > расчетная_дата + 3 дня
-        else:
-            # Для неполученных платежей: разница между датой анализа и ожидаемой датой
-            days_overdue = (analysis_date - expected_date).days
-            return PaymentStatus.OVERDUE, days_overdue
+        # Для неполученных платежей: разница между датой анализа и ожидаемой датой
+        return PaymentStatus.OVERDUE, days_since_expected
     
     def is_payment_timely(self, expected_date: date, actual_date: date, early_days: int = 7) -> bool:
         """
@@ -101,10 +97,8 @@ class StatusDeterminer:
         Returns:
             True if payment is timely
         """
-        earliest_acceptable = expected_date - timedelta(days=early_days)
-        latest_acceptable = expected_date + timedelta(days=self.grace_period_days)
-        
-        return earliest_acceptable <= actual_date <= latest_acceptable
+        delay = actual_date.toordinal() - expected_date.toordinal()
+        return -early_days <= delay <= self.grace_period_days
     
     def calculate_payment_delay(self, expected_date: date, actual_date: date) -> int:
         """
@@ -117,4 +111,4 @@ class StatusDeterminer:
         Returns:
             Number of days (positive = late, negative = early)
         """
-        return (actual_date - expected_date).days
+        return actual_date.toordinal() - expected_date.toordinal()
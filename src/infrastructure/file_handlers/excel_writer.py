@@ -5,9 +5,10 @@ Excel report writer
 import logging
 from pathlib import Path
 from datetime import datetime
-from typing import List
+from typing import Any, Dict, List, Sequence
 
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.utils import get_column_letter
 
@@ -17,6 +18,28 @@ from ...infrastructure.localization.i18n import LocalizationManager
 from ...core.exceptions import FileProcessingError
 
 
+# Style objects are immutable in openpyxl, so they are built once and shared by every cell
+BOLD_FONT = Font(bold=True)
+TITLE_FONT = Font(size=16, bold=True)
+HEADER_FILL = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
+HEADER_ALIGNMENT = Alignment(horizontal="center")
+THIN_BORDER = Border(
+    left=Side(style='thin'),
+    right=Side(style='thin'),
+    top=Side(style='thin'),
+    bottom=Side(style='thin')
+)
+STATUS_FILLS = {
+    PaymentStatus.RECEIVED: PatternFill(start_color="90EE90", end_color="90EE90", fill_type="solid"),  # Light green
+    PaymentStatus.OVERDUE: PatternFill(start_color="FFB6C1", end_color="FFB6C1", fill_type="solid"),   # Light red
+    PaymentStatus.PENDING: PatternFill(start_color="FFFFE0", end_color="FFFFE0", fill_type="solid"),   # Light yellow
+    PaymentStatus.NOT_DUE: PatternFill(start_color="E6E6FA", end_color="E6E6FA", fill_type="solid"),   # Light purple
+    PaymentStatus.UNCLEAR: PatternFill(start_color="FFA500", end_color="FFA500", fill_type="solid")    # Orange
+}
+NO_FILL = PatternFill()
+MAX_COLUMN_WIDTH = 50
+
+
 class ExcelReportWriter:
     """
     Writer for generating Excel payment reports
@@ -41,7 +64,8 @@ class ExcelReportWriter:
             FileProcessingError: If writing fails
         """
         try:
-            workbook = Workbook()
+            # Write-only workbooks stream rows to the sheet XML instead of keeping cell objects
+            workbook = Workbook(write_only=True)
             
             # Create main report worksheet
             self._create_payments_worksheet(workbook, report, i18n)
@@ -62,29 +86,15 @@ class ExcelReportWriter:
                                  i18n: LocalizationManager):
         """Create main payments worksheet"""
         
-        # Use default worksheet
-        ws = workbook.active
-        ws.title = i18n.get("report.worksheet.payments", default="Payments")
+        ws = workbook.create_sheet(title=i18n.get("report.worksheet.payments", default="Payments"))
         
-        # Add report metadata at the top
-        current_row = 1
-        
-        # Report generation date
+        # Report metadata at the top
         generation_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        ws.cell(row=current_row, column=1, value="Report date:")
-        ws.cell(row=current_row, column=2, value=generation_date)
-        ws.cell(row=current_row, column=1).font = Font(bold=True)
-        current_row += 1
-        
-        # Analysis date
         analysis_date_str = report.analysis_date.strftime("%Y-%m-%d") if report.analysis_date else "Not specified"
-        ws.cell(row=current_row, column=1, value="Analysis date:")
-        ws.cell(row=current_row, column=2, value=analysis_date_str)
-        ws.cell(row=current_row, column=1).font = Font(bold=True)
-        current_row += 1
-        
-        # Empty row for separation
-        current_row += 1
+        metadata = [
+            ["Report date:", generation_date],
+            ["Analysis date:", analysis_date_str],
+        ]
         
         # Define headers
         headers = [
@@ -97,52 +107,46 @@ class ExcelReportWriter:
             i18n.get("report.header.notes", default="Notes")
         ]
         
-        # Write headers
-        header_row = current_row
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=header_row, column=col, value=header)
-            cell.font = Font(bold=True)
-            cell.fill = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
-            cell.alignment = Alignment(horizontal="center")
-        
-        # Write payment data (starting from row after headers)
-        data_start_row = header_row + 1
-        for i, payment in enumerate(report.payments):
-            row = data_start_row + i
-            # Garage ID
-            ws.cell(row=row, column=1, value=payment.garage_id)
-            
-            # Amount
-            ws.cell(row=row, column=2, value=float(payment.amount))
-            
-            # Expected date
-            ws.cell(row=row, column=3, value=payment.expected_date.strftime("%Y-%m-%d"))
-            
-            # Actual date
-            actual_date_str = payment.actual_date.strftime("%Y-%m-%d") if payment.actual_date else ""
-            ws.cell(row=row, column=4, value=actual_date_str)
-            
-            # Status
-            status_text = self._get_status_text(payment.status, i18n)
-            status_cell = ws.cell(row=row, column=5, value=status_text)
-            status_cell.fill = self._get_status_color(payment.status)
-            
+        # Payment data, one row array per payment
+        status_texts = self._get_status_texts(i18n)
+        data_rows = []
+        for payment in report.payments:
             # Days overdue - show for received, overdue, and pending payments
-            if payment.status in [PaymentStatus.RECEIVED, PaymentStatus.OVERDUE, PaymentStatus.PENDING]:
+            if payment.status in (PaymentStatus.RECEIVED, PaymentStatus.OVERDUE, PaymentStatus.PENDING):
                 overdue_value = payment.days_overdue if payment.days_overdue is not None else 0
             else:
                 overdue_value = ""
-            ws.cell(row=row, column=6, value=overdue_value)
             
-            # Notes
-            ws.cell(row=row, column=7, value=payment.notes)
-        
-        # Auto-size columns
-        self._auto_size_columns(ws)
+            data_rows.append([
+                payment.garage_id,
+                float(payment.amount),
+                payment.expected_date.strftime("%Y-%m-%d"),
+                payment.actual_date.strftime("%Y-%m-%d") if payment.actual_date else "",
+                status_texts.get(payment.status, payment.status.value),
+                overdue_value,
+                payment.notes
+            ])
+        
+        # Column widths must be known before the first row is streamed
+        self._set_column_widths(ws, metadata + [headers] + data_rows)
+        
+        for label, value in metadata:
+            ws.append([self._styled_cell(ws, label, font=BOLD_FONT), value])
         
-        # Add borders for data table only (excluding metadata at top)
-        total_data_rows = len(report.payments) + 1  # +1 for header
-        self._add_borders(ws, total_data_rows, len(headers), header_row)
+        # Empty row for separation
+        ws.append([])
+        
+        # Headers and data table, bordered (metadata at top stays unbordered)
+        ws.append([
+            self._styled_cell(ws, header, font=BOLD_FONT, fill=HEADER_FILL,
+                              alignment=HEADER_ALIGNMENT, border=THIN_BORDER)
+            for header in headers
+        ])
+        
+        for payment, row in zip(report.payments, data_rows):
+            cells = [self._styled_cell(ws, value, border=THIN_BORDER) for value in row]
+            cells[4].fill = self._get_status_color(payment.status)
+            ws.append(cells)
     
     def _create_summary_worksheet(self, 
                                 workbook: Workbook, 
@@ -155,12 +159,13 @@ class ExcelReportWriter:
         summary = report.summary
         
         # Report header
-        ws.cell(row=1, column=1, value=i18n.get("summary.title", default="Payment Summary")).font = Font(size=16, bold=True)
-        ws.cell(row=2, column=1, value=f"Generated: {report.generated_at.strftime('%Y-%m-%d %H:%M')}")
-        ws.cell(row=3, column=1, value=f"Analysis Date: {report.analysis_date.strftime('%Y-%m-%d')}")
+        title = i18n.get("summary.title", default="Payment Summary")
+        header_lines = [
+            f"Generated: {report.generated_at.strftime('%Y-%m-%d %H:%M')}",
+            f"Analysis Date: {report.analysis_date.strftime('%Y-%m-%d')}"
+        ]
         
         # Statistics
-        row = 5
         stats = [
             (i18n.get("summary.total_garages", default="Total Garages"), summary.total_garages),
             (i18n.get("summary.received", default="Received"), summary.received_count),
@@ -174,73 +179,70 @@ class ExcelReportWriter:
             (i18n.get("summary.received_amount", default="Received Amount"), f"{summary.total_received:.2f} RUB")
         ]
         
-        for label, value in stats:
-            ws.cell(row=row, column=1, value=label).font = Font(bold=True)
-            ws.cell(row=row, column=2, value=value)
-            row += 1
-        
         # Notes section
-        if report.notes:
-            row += 1
-            ws.cell(row=row, column=1, value=i18n.get("summary.notes_header", default="Notes")).font = Font(bold=True)
-            row += 1
-            
-            for note in report.notes:
-                ws.cell(row=row, column=1, value=f"• {note}")
-                row += 1
+        notes_header = i18n.get("summary.notes_header", default="Notes")
+        note_lines = [f"• {note}" for note in report.notes]
+        
+        # Column widths must be known before the first row is streamed
+        width_rows = [[title]] + [[line] for line in header_lines] + stats
+        if note_lines:
+            width_rows += [[notes_header]] + [[line] for line in note_lines]
+        self._set_column_widths(ws, width_rows)
         
-        # Auto-size columns
-        self._auto_size_columns(ws)
+        ws.append([self._styled_cell(ws, title, font=TITLE_FONT)])
+        for line in header_lines:
+            ws.append([line])
+        ws.append([])
+        
+        for label, value in stats:
+            ws.append([self._styled_cell(ws, label, font=BOLD_FONT), value])
+        
+        if note_lines:
+            ws.append([])
+            ws.append([self._styled_cell(ws, notes_header, font=BOLD_FONT)])
+            for line in note_lines:
+                ws.append([line])
     
-    def _get_status_text(self, status: PaymentStatus, i18n: LocalizationManager) -> str:
-        """Get localized status text"""
-        status_map = {
+    def _get_status_texts(self, i18n: LocalizationManager) -> Dict[PaymentStatus, str]:
+        """Get localized text for every status, looked up once per report"""
+        return {
             PaymentStatus.RECEIVED: i18n.get("status.received", default="Received"),
             PaymentStatus.OVERDUE: i18n.get("status.overdue", default="Overdue"),
             PaymentStatus.PENDING: i18n.get("status.pending", default="Pending"),
             PaymentStatus.NOT_DUE: i18n.get("status.not_due", default="Not Due"),
             PaymentStatus.UNCLEAR: i18n.get("status.unclear", default="Unclear")
         }
-        return status_map.get(status, status.value)
     
     def _get_status_color(self, status: PaymentStatus) -> PatternFill:
         """Get color for status cell"""
-        color_map = {
-            PaymentStatus.RECEIVED: PatternFill(start_color="90EE90", end_color="90EE90", fill_type="solid"),  # Light green
-            PaymentStatus.OVERDUE: PatternFill(start_color="FFB6C1", end_color="FFB6C1", fill_type="solid"),   # Light red
-            PaymentStatus.PENDING: PatternFill(start_color="FFFFE0", end_color="FFFFE0", fill_type="solid"),   # Light yellow
-            PaymentStatus.NOT_DUE: PatternFill(start_color="E6E6FA", end_color="E6E6FA", fill_type="solid"),   # Light purple
-            PaymentStatus.UNCLEAR: PatternFill(start_color="FFA500", end_color="FFA500", fill_type="solid")    # Orange
-        }
-        return color_map.get(status, PatternFill())
+        return STATUS_FILLS.get(status, NO_FILL)
     
-    def _auto_size_columns(self, worksheet):
-        """Auto-size worksheet columns"""
-        for column in worksheet.columns:
-            max_length = 0
-            column_letter = get_column_letter(column[0].column)
-            
-            for cell in column:
-                try:
-                    cell_length = len(str(cell.value or ''))
-                    if cell_length > max_length:
-                        max_length = cell_length
-                except:
-                    pass
-            
+    def _set_column_widths(self, worksheet, rows: List[Sequence[Any]]):
+        """Size worksheet columns to the longest value written in each of them"""
+        widths: List[int] = []
+        for row in rows:
+            for col, value in enumerate(row):
+                value_length = len(str(value or ''))
+                if col == len(widths):
+                    widths.append(value_length)
+                elif value_length > widths[col]:
+                    widths[col] = value_length
+        
+        for col, max_length in enumerate(widths, 1):
             # Set column width with some padding
-            adjusted_width = min(max_length + 2, 50)  # Cap at 50 characters
-            worksheet.column_dimensions[column_letter].width = adjusted_width
+            adjusted_width = min(max_length + 2, MAX_COLUMN_WIDTH)  # Cap at 50 characters
+            worksheet.column_dimensions[get_column_letter(col)].width = adjusted_width
     
-    def _add_borders(self, worksheet, num_rows: int, num_cols: int, start_row: int = 1):
-        """Add borders to table"""
-        thin_border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
-        
-        for row in range(start_row, start_row + num_rows):
-            for col in range(1, num_cols + 1):
-                worksheet.cell(row=row, column=col).border = thin_border
+    def _styled_cell(self, worksheet, value: Any, font: Font = None, fill: PatternFill = None,
+                     alignment: Alignment = None, border: Border = None) -> WriteOnlyCell:
+        """Create a write-only cell carrying the given shared style objects"""
+        cell = WriteOnlyCell(worksheet, value=value)
+        if font is not None:
+            cell.font = font
+        if fill is not None:
+            cell.fill = fill
+        if alignment is not None:
+            cell.alignment = alignment
+        if border is not None:
+            cell.border = border
+        return cell
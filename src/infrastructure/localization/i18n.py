@@ -4,6 +4,7 @@ Internationalization and localization manager
 
 import json
 import logging
+import sys
 from pathlib import Path
 from typing import Dict, Any, Optional
 
@@ -13,6 +14,10 @@ class LocalizationManager:
     Manager for application localization and internationalization
     """
     
+    # Parsed message files by language code, shared by all managers in the process
+    # so switching languages or creating another manager does not re-read JSON
+    _catalogs: Dict[str, Dict[str, str]] = {}
+    
     def __init__(self, language: str = "en"):
         """
         Initialize localization manager
@@ -27,13 +32,23 @@ class LocalizationManager:
     
     def _load_messages(self):
         """Load messages for current language"""
+        catalog = self._catalogs.get(self.language)
+        if catalog is not None:
+            self.messages = catalog
+            return
+        
         try:
             # Try to load language-specific messages
             messages_file = Path(__file__).parent / f"messages_{self.language}.json"
             
             if messages_file.exists():
                 with open(messages_file, 'r', encoding='utf-8') as f:
-                    self.messages = json.load(f)
+                    # Interned once per process: status labels repeat on every report row
+                    self.messages = {
+                        key: sys.intern(value) if isinstance(value, str) else value
+                        for key, value in json.load(f).items()
+                    }
+                self._catalogs[self.language] = self.messages
                 self.logger.info(f"Loaded messages for language: {self.language}")
             else:
                 # Fallback to English
@@ -95,6 +110,11 @@ class LocalizationManager:
         """
         self.set_language(language)
     
+    @classmethod
+    def clear_cache(cls):
+        """Forget loaded message catalogs so the next manager reads files again"""
+        cls._catalogs.clear()
+    
     def get_available_languages(self) -> list:
         """Get list of available languages"""
         localization_dir = Path(__file__).parent
@@ -0,0 +1,10 @@
+"""
+Cell helpers shared by worksheet parsers
+"""
+
+from typing import Any
+
+
+def plain_value(cell: Any) -> Any:
+    """Plain value of a row item; openpyxl cells are unwrapped via .value, values_only items pass through"""
+    return getattr(cell, 'value', cell)
@@ -3,7 +3,7 @@ Abstract parser interface
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Any
+from typing import Collection, List, Any
 from pathlib import Path
 
 from ...core.models.transaction import Transaction
@@ -44,12 +44,12 @@ class StatementParser(ABC):
         pass
     
     @abstractmethod
-    def get_supported_formats(self) -> List[str]:
+    def get_supported_formats(self) -> Collection[str]:
         """
-        Get list of supported file formats
+        Get supported file formats
         
         Returns:
-            List of supported file extensions
+            Collection of supported file extensions (lowercase, with dot)
         """
         pass
 
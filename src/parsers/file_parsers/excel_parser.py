@@ -3,18 +3,124 @@ Excel garage registry parser
 """
 
 import logging
+import re
+import sys
+import zipfile
+from collections.abc import Mapping
+from dataclasses import dataclass, fields
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any
-from decimal import Decimal
-from datetime import datetime
+from typing import FrozenSet, Iterator, List, Any, Optional, Tuple
+from decimal import Decimal, ROUND_HALF_UP
+from datetime import date, datetime
 
 from openpyxl import load_workbook
 from openpyxl.utils.exceptions import InvalidFileException
 
+from ..base.cells import plain_value
 from ..base.parser_interface import GarageRegistryParser
 from ...core.exceptions import ParseError, ValidationError
 
 
+# File extensions accepted by validate_source
+SUPPORTED_FORMATS = frozenset(('.xlsx', '.xls'))
+
+# Workbook part every .xlsx package carries
+WORKBOOK_PART = 'xl/workbook.xml'
+
+# Registry rents are whole kopecks
+CENTS = Decimal('0.01')
+
+# Common date formats
+DATE_FORMATS = ('%d.%m.%Y', '%d/%m/%Y', '%Y-%m-%d', '%d-%m-%Y')
+
+# Registry header keywords (Гараж / Сумма / Первоначальная дата), one compiled scan per row.
+# IGNORECASE covers Cyrillic, so cells are matched without lowercasing them first.
+HEADER_PATTERN = re.compile(r'гараж|сумма|дата|первоначальная', re.IGNORECASE)
+
+# Header is expected within the first rows, later rows are parsed as data without the keyword scan
+HEADER_SCAN_ROWS = 20
+
+
+# Registries repeat the same rents and start dates across rows,
+# so each distinct raw value is converted once
+@lru_cache(maxsize=4096)
+def _to_decimal(raw: str) -> Decimal:
+    """Parse amount text, accepting a comma as the decimal separator"""
+    return Decimal(raw.replace(',', '.').strip())
+
+
+def _split_fixed_width_date(date_str: str) -> Optional[Tuple[int, int, int]]:
+    """Year, month and day of a zero-padded YYYY-MM-DD or DD.MM.YYYY (./-) date"""
+    if len(date_str) != 10 or not date_str.isascii():
+        return None
+    
+    if date_str[4] == '-' == date_str[7]:
+        year, month, day = date_str[:4], date_str[5:7], date_str[8:]
+    elif date_str[2] == date_str[5] and date_str[2] in './-':
+        day, month, year = date_str[:2], date_str[3:5], date_str[6:]
+    else:
+        return None
+    
+    if not (year + month + day).isdigit():
+        return None
+    
+    return int(year), int(month), int(day)
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_str(raw: str) -> Optional[date]:
+    """Parse date text in one of DATE_FORMATS, None if none matches"""
+    date_str = raw.strip()
+    
+    # Zero-padded dates (2025-01-15, 15.01.2025) are sliced by position,
+    # strptime is left for the rare unpadded ones like 5.1.2025
+    fixed = _split_fixed_width_date(date_str)
+    if fixed is not None:
+        year, month, day = fixed
+        try:
+            return date(year, month, day)
+        except ValueError:
+            return None
+    
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+# eq=False keeps Mapping.__eq__, so rows compare equal to dicts with the same items
+@dataclass(slots=True, eq=False)
+class GarageRow(Mapping):
+    """
+    Garage data parsed from one registry row
+    
+    Slotted instead of a dict per row, which keeps large registries compact.
+    Read-only mapping over its fields, so callers written against dict rows
+    ('id' in row, row['id'], row.get(...), dict(row)) keep working.
+    """
+    id: str
+    monthly_rent: Decimal
+    start_date: date
+    payment_day: int
+    
+    def __getitem__(self, key: str) -> Any:
+        if key not in GARAGE_ROW_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(GARAGE_ROW_FIELDS)
+    
+    def __len__(self) -> int:
+        return len(GARAGE_ROW_FIELDS)
+
+
+GARAGE_ROW_FIELDS = tuple(field.name for field in fields(GarageRow))
+
+
 class ExcelGarageParser(GarageRegistryParser):
     """
     Parser for garage registry in Excel format
@@ -23,7 +129,7 @@ class ExcelGarageParser(GarageRegistryParser):
     def __init__(self):
         self.logger = logging.getLogger(__name__)
     
-    def parse_garages(self, source: Path) -> List[Dict[str, Any]]:
+    def parse_garages(self, source: Path) -> List[GarageRow]:
         """
         Parse garage registry from Excel file
         
@@ -36,30 +142,53 @@ class ExcelGarageParser(GarageRegistryParser):
             source: Path to Excel file
             
         Returns:
-            List of garage data dictionaries
+            List of parsed garage rows
             
         Raises:
             ParseError: If parsing fails
         """
-        if not self.validate_source(source):
-            raise ParseError(f"Invalid Excel file: {source}")
+        garages = list(self.iter_garages(source))
+        
+        if not garages:
+            raise ParseError("No valid garage data found in file", str(source))
+        
+        self.logger.info(f"Successfully parsed {len(garages)} garages from {source}")
+        return garages
+    
+    def iter_garages(self, source: Path) -> Iterator[GarageRow]:
+        """
+        Stream garage data from Excel file row by row
+        
+        Rows are parsed as the worksheet is read, so consumers that process
+        garages one at a time never hold the whole registry in memory.
         
+        Args:
+            source: Path to Excel file
+            
+        Yields:
+            Parsed garage rows
+            
+        Raises:
+            ParseError: If parsing fails
+        """
         workbook = None
         try:
+            # Opening the workbook is the validity check, a separate
+            # validate_source pass would read the package twice
             workbook = load_workbook(source, read_only=True, data_only=True)
             worksheet = workbook.active
             
-            garages = []
             headers_found = False
             
-            for row_num, row in enumerate(worksheet.iter_rows(min_row=1), 1):
+            # values_only rows skip creating a cell object per cell
+            for row_num, row in enumerate(worksheet.iter_rows(min_row=1, values_only=True), 1):
                 try:
                     # Skip empty rows
-                    if all(cell.value is None for cell in row):
+                    if all(plain_value(cell) is None for cell in row):
                         continue
                     
-                    # Look for headers first
-                    if not headers_found:
+                    # Look for headers first, only near the top of the sheet
+                    if not headers_found and row_num <= HEADER_SCAN_ROWS:
                         if self._is_header_row(row):
                             headers_found = True
                             self.logger.debug(f"Found headers at row {row_num}")
@@ -70,21 +199,16 @@ class ExcelGarageParser(GarageRegistryParser):
                     
                     # Parse data row
                     garage_data = self._parse_garage_row(row, row_num)
-                    if garage_data:
-                        garages.append(garage_data)
                 
                 except Exception as e:
                     self.logger.warning(f"Error parsing row {row_num}: {e}")
                     continue
+                
+                if garage_data:
+                    yield garage_data
             
-            if not garages:
-                raise ParseError("No valid garage data found in file", str(source))
-            
-            self.logger.info(f"Successfully parsed {len(garages)} garages from {source}")
-            return garages
-            
-        except InvalidFileException as e:
-            raise ParseError(f"Invalid Excel file format: {e}", str(source))
+        except (InvalidFileException, zipfile.BadZipFile, OSError) as e:
+            raise ParseError(f"Invalid Excel file format: {e}", str(source)) from e
         except Exception as e:
             raise ParseError(f"Failed to parse Excel file: {e}", str(source))
         finally:
@@ -107,15 +231,15 @@ class ExcelGarageParser(GarageRegistryParser):
         if not source.exists():
             return False
         
-        if source.suffix.lower() not in ['.xlsx', '.xls']:
+        if source.suffix.lower() not in SUPPORTED_FORMATS:
             return False
         
         try:
-            # Try to open the file
-            workbook = load_workbook(source, read_only=True)
-            workbook.close()
-            return True
-        except Exception:
+            # Reading the zip directory is enough to tell a workbook package,
+            # the sheets themselves are parsed only in parse_garages
+            with zipfile.ZipFile(source) as archive:
+                return WORKBOOK_PART in archive.namelist()
+        except (OSError, zipfile.BadZipFile):
             return False
     
     def _is_header_row(self, row) -> bool:
@@ -124,47 +248,45 @@ class ExcelGarageParser(GarageRegistryParser):
             return False
         
         # Look for expected header keywords
-        header_keywords = ['гараж', 'сумма', 'дата', 'первоначальная']
-        row_text = ' '.join(str(cell.value or '').lower() for cell in row[:3])
+        row_text = ' '.join(str(plain_value(cell) or '') for cell in row[:3])
         
-        return any(keyword in row_text for keyword in header_keywords)
+        return HEADER_PATTERN.search(row_text) is not None
     
-    def _parse_garage_row(self, row, row_num: int) -> Dict[str, Any]:
+    def _parse_garage_row(self, row, row_num: int) -> Optional[GarageRow]:
         """
         Parse a single garage data row
         
         Args:
-            row: Excel row cells
+            row: Excel row cells or plain cell values
             row_num: Row number for error reporting
             
         Returns:
-            Garage data dictionary or None if invalid
+            Parsed garage row or None if invalid
         """
         if len(row) < 3:
             return None
         
         # Extract cell values
-        garage_id_cell = row[0].value
-        amount_cell = row[1].value
-        date_cell = row[2].value
+        garage_id_cell = plain_value(row[0])
+        amount_cell = plain_value(row[1])
+        date_cell = plain_value(row[2])
         
         # Skip if essential data is missing
         if garage_id_cell is None or amount_cell is None or date_cell is None:
             return None
         
         try:
-            # Parse garage ID
-            garage_id = str(garage_id_cell).strip()
+            # Parse garage ID, interned since the same garages repeat across rows and sheets
+            garage_id = sys.intern(str(garage_id_cell).strip())
             if not garage_id:
                 return None
             
             # Parse amount
-            if isinstance(amount_cell, (int, float)):
-                amount = Decimal(str(amount_cell))
+            if isinstance(amount_cell, float):
+                # Numeric cells are binary floats, round them to kopecks without a str round-trip
+                amount = Decimal(amount_cell).quantize(CENTS, rounding=ROUND_HALF_UP)
             else:
-                # Try to parse string amount
-                amount_str = str(amount_cell).replace(',', '.').strip()
-                amount = Decimal(amount_str)
+                amount = _to_decimal(str(amount_cell))
             
             if amount <= 0:
                 self.logger.warning(f"Invalid amount {amount} at row {row_num}")
@@ -175,29 +297,22 @@ class ExcelGarageParser(GarageRegistryParser):
                 start_date = date_cell.date()
             else:
                 # Try to parse string date
-                date_str = str(date_cell).strip()
-                # Common date formats
-                for fmt in ['%d.%m.%Y', '%d/%m/%Y', '%Y-%m-%d']:
-                    try:
-                        start_date = datetime.strptime(date_str, fmt).date()
-                        break
-                    except ValueError:
-                        continue
-                else:
-                    self.logger.warning(f"Could not parse date '{date_str}' at row {row_num}")
+                start_date = _parse_date_str(str(date_cell))
+                if start_date is None:
+                    self.logger.warning(f"Could not parse date '{str(date_cell).strip()}' at row {row_num}")
                     return None
             
-            return {
-                'id': garage_id,
-                'monthly_rent': amount,
-                'start_date': start_date,
-                'payment_day': start_date.day
-            }
+            return GarageRow(
+                id=garage_id,
+                monthly_rent=amount,
+                start_date=start_date,
+                payment_day=start_date.day
+            )
             
         except (ValueError, TypeError) as e:
             self.logger.warning(f"Error parsing garage data at row {row_num}: {e}")
             return None
     
-    def get_supported_formats(self) -> List[str]:
-        """Get list of supported file formats"""
-        return ['.xlsx', '.xls']
+    def get_supported_formats(self) -> FrozenSet[str]:
+        """Get supported file formats"""
+        return SUPPORTED_FORMATS
@@ -4,20 +4,85 @@ Sberbank statement parser for Excel format
 
 import logging
 import re
+import zipfile
 from pathlib import Path
-from typing import List, Optional
+from typing import BinaryIO, FrozenSet, Iterator, List, Optional, Tuple, Union
 from decimal import Decimal
 from datetime import datetime, date
+from xml.etree import ElementTree
 
 from openpyxl import load_workbook
 from openpyxl.utils.exceptions import InvalidFileException
 
+from ..base.cells import plain_value
 from ..base.parser_interface import StatementParser
 from ...core.models.transaction import Transaction
 from ...core.models.payment_period import PaymentPeriod
 from ...core.exceptions import ParseError
 
 
+# File extensions accepted by validate_source
+SUPPORTED_FORMATS = frozenset(('.xlsx', '.xls'))
+
+# Statement summary line, e.g. "Итого по операциям с 01.05.2025 по 12.06.2025".
+# IGNORECASE covers Cyrillic, so cells are matched without lowercasing them first.
+PERIOD_PATTERN = re.compile(
+    r'итого\s+по\s+операциям\s+с\s+(\d{2}\.\d{2}\.\d{4})\s+по\s+(\d{2}\.\d{2}\.\d{4})',
+    re.IGNORECASE
+)
+
+# Operation date in the first columns, e.g. "15.01.2025 14:30"
+DATE_PATTERN = re.compile(r'(\d{2}\.\d{2}\.\d{4})')
+
+# Incoming amount, e.g. "+3 500,00"
+AMOUNT_PATTERN = re.compile(r'\+.*?(\d[\d\s,]*\d|\d),\d{2}')
+
+# Bare number left after stripping "+" and spaces from an amount cell
+PLAIN_AMOUNT_PATTERN = re.compile(r'^\d+\.?\d*$')
+
+# Category keywords of incoming transfers, matched together in one case-insensitive scan
+INCOMING_KEYWORDS = ('перевод', 'сбп', 'карту')
+INCOMING_PATTERN = re.compile('|'.join(map(re.escape, INCOMING_KEYWORDS)), re.IGNORECASE)
+
+# Rows probed by validate_source, operations start right below the statement heading
+VALIDATION_SCAN_ROWS = 20
+
+# Leading word of the statement summary line
+SUMMARY_PREFIX = 'Итого'
+
+# Shared string item inside xl/sharedStrings.xml of an .xlsx package
+SHARED_STRINGS_PART = 'xl/sharedStrings.xml'
+SHARED_STRING_TAG = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}si'
+
+
+def _fast_amount(text: str) -> Optional[Decimal]:
+    """Amount of a plain "+1 234,56" cell, None for any other shape"""
+    if not text.startswith('+'):
+        return None
+    
+    body = text[1:].replace(' ', '').replace(',', '.')
+    if len(body) < 4 or body[-3] != '.' or not body.isascii():
+        return None
+    
+    if not (body[:-3].isdigit() and body[-2:].isdigit()):
+        return None
+    
+    return Decimal(body)
+
+
+def _split_leading_date(text: str) -> Optional[Tuple[int, int, int]]:
+    """Day, month and year of a "дд.мм.гггг" date at the start of text, read by position"""
+    if len(text) < 10 or text[2] != '.' or text[5] != '.':
+        return None
+    
+    day, month, year = text[:2], text[3:5], text[6:10]
+    digits = day + month + year
+    if not (digits.isascii() and digits.isdigit()):
+        return None
+    
+    return int(day), int(month), int(year)
+
+
 class SberbankStatementParser(StatementParser):
     """
     Parser for Sberbank bank statements in Excel format
@@ -33,13 +98,13 @@ class SberbankStatementParser(StatementParser):
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         
-        # Regex patterns for parsing
-        self.date_pattern = re.compile(r'(\d{2}\.\d{2}\.\d{4})')
-        self.amount_pattern = re.compile(r'\+.*?(\d[\d\s,]*\d|\d),\d{2}')
-        self.incoming_keywords = ['перевод', 'сбп', 'карту']
+        # Regex patterns for parsing, compiled once at import
+        self.date_pattern = DATE_PATTERN
+        self.amount_pattern = AMOUNT_PATTERN
+        self.incoming_keywords = INCOMING_KEYWORDS
         
         # Pattern for period detection
-        self.period_pattern = re.compile(r'итого\s+по\s+операциям\s+с\s+(\d{2}\.\d{2}\.\d{4})\s+по\s+(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+        self.period_pattern = PERIOD_PATTERN
     
     def parse_transactions(self, source: Path) -> List[Transaction]:
         """
@@ -51,6 +116,27 @@ class SberbankStatementParser(StatementParser):
         Returns:
             List of parsed transactions
             
+        Raises:
+            ParseError: If parsing fails
+        """
+        transactions = list(self.iter_transactions(source))
+        
+        self.logger.info(f"Parsed {len(transactions)} incoming transactions from {source}")
+        return transactions
+    
+    def iter_transactions(self, source: Path) -> Iterator[Transaction]:
+        """
+        Stream incoming transactions from Sberbank Excel statement
+        
+        Each transaction is produced as soon as its row is read, rows after
+        the statement summary line are never loaded.
+        
+        Args:
+            source: Path to Excel file
+            
+        Yields:
+            Parsed incoming transactions in statement order
+            
         Raises:
             ParseError: If parsing fails
         """
@@ -62,28 +148,36 @@ class SberbankStatementParser(StatementParser):
             workbook = load_workbook(source, read_only=True, data_only=True)
             worksheet = workbook.active
             
-            transactions = []
+            found_transactions = False
             
-            for row_num, row in enumerate(worksheet.iter_rows(min_row=1), 1):
+            # values_only rows are plain tuples, no cell object per cell
+            for row_num, row in enumerate(worksheet.iter_rows(min_row=1, values_only=True), 1):
                 try:
                     # Skip empty rows
-                    if all(cell.value is None for cell in row):
+                    if all(plain_value(cell) is None for cell in row):
+                        continue
+                    
+                    # Summary lines are never operations. Only the closing summary
+                    # after the operations ends the statement, per-day or per-page
+                    # subtotals ("Итого за ...") are skipped
+                    if self._is_summary_row(row):
+                        if found_transactions and self._is_closing_summary_row(row):
+                            self.logger.debug(f"Statement summary reached at row {row_num}")
+                            break
                         continue
                     
                     # Parse transaction from row
                     transaction = self._parse_transaction_row(row, row_num)
-                    if transaction:
-                        transactions.append(transaction)
                 
                 except Exception as e:
                     self.logger.debug(f"Error parsing row {row_num}: {e}")
                     continue
-            
-            # Filter for incoming transactions only
-            incoming_transactions = [t for t in transactions if t.amount > 0]
-            
-            self.logger.info(f"Parsed {len(incoming_transactions)} incoming transactions from {len(transactions)} total")
-            return incoming_transactions
+                
+                # Only incoming transactions are reported
+                if transaction:
+                    found_transactions = True
+                    if transaction.amount > 0:
+                        yield transaction
             
         except InvalidFileException as e:
             raise ParseError(f"Invalid Excel file format: {e}", str(source))
@@ -96,29 +190,30 @@ class SberbankStatementParser(StatementParser):
                 except Exception as e:
                     self.logger.warning(f"Error closing workbook: {e}")
     
-    def validate_source(self, source: Path) -> bool:
+    def validate_source(self, source: Union[Path, BinaryIO]) -> bool:
         """
         Validate if source file can be parsed
         
         Args:
-            source: Path to source file
+            source: Path to source file or binary file-like object with workbook data
             
         Returns:
             True if file can be parsed
         """
-        if not source.exists():
-            return False
-        
-        if source.suffix.lower() not in ['.xlsx', '.xls']:
-            return False
+        if isinstance(source, Path):
+            if not source.exists():
+                return False
+            
+            if source.suffix.lower() not in SUPPORTED_FORMATS:
+                return False
         
         try:
             # Try to open the file and look for Sberbank patterns
             workbook = load_workbook(source, read_only=True, data_only=True)
             worksheet = workbook.active
             
-            # Check first few rows for expected patterns
-            for row in worksheet.iter_rows(min_row=1, max_row=20):
+            # Check first few rows for expected patterns, stopping at the first match
+            for row in worksheet.iter_rows(min_row=1, max_row=VALIDATION_SCAN_ROWS, values_only=True):
                 if self._looks_like_sberbank_row(row):
                     workbook.close()
                     return True
@@ -128,10 +223,14 @@ class SberbankStatementParser(StatementParser):
             
         except Exception:
             return False
+        finally:
+            # Leave in-memory sources ready to be read again
+            if not isinstance(source, Path):
+                source.seek(0)
     
-    def get_supported_formats(self) -> List[str]:
-        """Get list of supported file formats"""
-        return ['.xlsx', '.xls']
+    def get_supported_formats(self) -> FrozenSet[str]:
+        """Get supported file formats"""
+        return SUPPORTED_FORMATS
     
     def _looks_like_sberbank_row(self, row) -> bool:
         """Check if row looks like a Sberbank transaction row"""
@@ -139,33 +238,45 @@ class SberbankStatementParser(StatementParser):
             return False
         
         # Check for date pattern in first column
-        first_cell = str(row[0].value or '')
-        if self.date_pattern.search(first_cell):
+        first_cell = str(plain_value(row[0]) or '')
+        if _split_leading_date(first_cell) is not None or self.date_pattern.search(first_cell):
             return True
         
-        # Check for amount pattern in any column
-        for cell in row:
-            cell_text = str(cell.value or '')
-            if '+' in cell_text and (',' in cell_text or '.' in cell_text):
-                return True
-        
-        return False
+        # Check for amount pattern in any column, amounts are "+X XXX,XX" text cells
+        return any(
+            isinstance(value, str) and '+' in value and (',' in value or '.' in value)
+            for value in map(plain_value, row)
+        )
+    
+    def _is_summary_row(self, row) -> bool:
+        """Check if row holds a summary line ("Итого ..."), closing summary or subtotal"""
+        return any(
+            isinstance(value, str) and value.lstrip().startswith(SUMMARY_PREFIX)
+            for value in map(plain_value, row)
+        )
+    
+    def _is_closing_summary_row(self, row) -> bool:
+        """Check if row holds the closing statement summary ("Итого по операциям с ... по ...")"""
+        return any(
+            isinstance(value, str)
+            and value.lstrip().startswith(SUMMARY_PREFIX)
+            and self.period_pattern.search(value) is not None
+            for value in map(plain_value, row)
+        )
     
     def _parse_transaction_row(self, row, row_num: int) -> Optional[Transaction]:
         """
         Parse a single transaction row
         
         Args:
-            row: Excel row cells
+            row: Excel row cells or plain cell values
             row_num: Row number for error reporting
             
         Returns:
             Transaction object or None if invalid
         """
         # Extract data from row
-        transaction_date = self._extract_date(row)
-        amount = self._extract_amount(row)
-        category = self._extract_category(row)
+        transaction_date, amount, category = self._scan_row(row)
         
         # Must have date and amount
         if not transaction_date or not amount:
@@ -176,7 +287,7 @@ class SberbankStatementParser(StatementParser):
             return None
         
         # Must be transfer-related transaction
-        if not self._is_transfer_category(category):
+        if category is None:
             return None
         
         return Transaction(
@@ -187,27 +298,83 @@ class SberbankStatementParser(StatementParser):
             description=f"Parsed from row {row_num}"
         )
     
+    def _scan_row(self, row) -> Tuple[Optional[date], Optional[Decimal], Optional[str]]:
+        """
+        Extract date, amount and transfer category in one pass over the row cells
+        
+        Each field is taken from the first cell that yields it, exactly as
+        _extract_date, _extract_amount and _extract_category do separately.
+        
+        Args:
+            row: Excel row cells or plain cell values
+            
+        Returns:
+            Tuple of date, amount and category, None for a field not found
+            (category is None unless a cell holds an incoming-transfer keyword)
+        """
+        transaction_date = None
+        amount = None
+        category = None
+        
+        for i, cell in enumerate(row):
+            cell_value = plain_value(cell)
+            if not cell_value:
+                continue
+            
+            # Date is looked for in the first few columns only
+            if transaction_date is None and i < 3:
+                transaction_date = self._date_from_value(cell_value)
+            
+            cell_text = str(cell_value)
+            
+            if amount is None and '+' in cell_text:
+                amount = self._amount_from_text(cell_text)
+            
+            if category is None and self._has_incoming_keyword(cell_text):
+                category = cell_text
+            
+            if transaction_date is not None and amount is not None and category is not None:
+                break
+        
+        return transaction_date, amount, category
+    
     def _extract_date(self, row) -> Optional[date]:
         """Extract date from row"""
         # Look in first few columns for date
         for i in range(min(3, len(row))):
-            cell_value = row[i].value
+            cell_value = plain_value(row[i])
             if not cell_value:
                 continue
             
-            # Handle datetime objects
-            if isinstance(cell_value, datetime):
-                return cell_value.date()
-            
-            # Handle string dates
-            cell_text = str(cell_value)
-            date_match = self.date_pattern.search(cell_text)
-            if date_match:
-                try:
-                    date_str = date_match.group(1)
-                    return datetime.strptime(date_str, '%d.%m.%Y').date()
-                except ValueError:
-                    continue
+            transaction_date = self._date_from_value(cell_value)
+            if transaction_date is not None:
+                return transaction_date
+        
+        return None
+    
+    def _date_from_value(self, cell_value) -> Optional[date]:
+        """Date held by a single cell value, None if there is none"""
+        # Handle datetime objects
+        if isinstance(cell_value, datetime):
+            return cell_value.date()
+        
+        # Handle string dates, statement cells normally start with "дд.мм.гггг"
+        cell_text = str(cell_value)
+        leading_date = _split_leading_date(cell_text)
+        if leading_date is not None:
+            day, month, year = leading_date
+            try:
+                return date(year, month, day)
+            except ValueError:
+                return None
+        
+        date_match = self.date_pattern.search(cell_text)
+        if date_match:
+            try:
+                date_str = date_match.group(1)
+                return datetime.strptime(date_str, '%d.%m.%Y').date()
+            except ValueError:
+                return None
         
         return None
     
@@ -215,35 +382,49 @@ class SberbankStatementParser(StatementParser):
         """Extract amount from row"""
         # Look in all columns for amount (usually column E, but be flexible)
         for cell in row:
-            if not cell.value:
+            cell_value = plain_value(cell)
+            if not cell_value:
                 continue
             
-            cell_text = str(cell.value)
+            cell_text = str(cell_value)
             
             # Look for positive amount pattern
             if '+' not in cell_text:
                 continue
             
-            amount_match = self.amount_pattern.search(cell_text)
-            if amount_match:
-                try:
-                    # Extract numeric part
-                    amount_str = amount_match.group(0)
-                    # Clean up: remove +, spaces, replace comma with dot
-                    amount_str = amount_str.replace('+', '').replace(' ', '').replace(',', '.')
-                    return Decimal(amount_str)
-                except (ValueError, TypeError):
-                    continue
-            
-            # Fallback: try to parse directly if it looks like a positive number
-            if cell_text.startswith('+'):
-                try:
-                    clean_amount = cell_text.replace('+', '').replace(' ', '').replace(',', '.')
-                    # Check if it's a valid number
-                    if re.match(r'^\d+\.?\d*$', clean_amount):
-                        return Decimal(clean_amount)
-                except (ValueError, TypeError):
-                    continue
+            amount = self._amount_from_text(cell_text)
+            if amount is not None:
+                return amount
+        
+        return None
+    
+    def _amount_from_text(self, cell_text: str) -> Optional[Decimal]:
+        """Positive amount held by a single cell text, None if there is none"""
+        # Typical statement amount "+3 500,00" is read without the regex
+        amount = _fast_amount(cell_text)
+        if amount is not None:
+            return amount
+        
+        amount_match = self.amount_pattern.search(cell_text)
+        if amount_match:
+            try:
+                # Extract numeric part
+                amount_str = amount_match.group(0)
+                # Clean up: remove +, spaces, replace comma with dot
+                amount_str = amount_str.replace('+', '').replace(' ', '').replace(',', '.')
+                return Decimal(amount_str)
+            except (ValueError, TypeError):
+                return None
+        
+        # Fallback: try to parse directly if it looks like a positive number
+        if cell_text.startswith('+'):
+            try:
+                clean_amount = cell_text.replace('+', '').replace(' ', '').replace(',', '.')
+                # Check if it's a valid number
+                if PLAIN_AMOUNT_PATTERN.match(clean_amount):
+                    return Decimal(clean_amount)
+            except (ValueError, TypeError):
+                return None
         
         return None
     
@@ -251,15 +432,15 @@ class SberbankStatementParser(StatementParser):
         """Extract transaction category from row"""
         # Look for category in column D or nearby columns
         for i in range(len(row)):
-            cell_value = row[i].value
+            cell_value = plain_value(row[i])
             if not cell_value:
                 continue
             
-            cell_text = str(cell_value).lower()
+            cell_text = str(cell_value)
             
             # Check if this looks like a category
-            if any(keyword in cell_text for keyword in self.incoming_keywords):
-                return str(row[i].value)
+            if self._has_incoming_keyword(cell_text):
+                return cell_text
         
         return "Unknown Transfer"
     
@@ -268,17 +449,20 @@ class SberbankStatementParser(StatementParser):
         if not category:
             return False
         
-        category_lower = category.lower()
-        return any(keyword in category_lower for keyword in self.incoming_keywords)
+        return self._has_incoming_keyword(category)
+    
+    def _has_incoming_keyword(self, text: str) -> bool:
+        """Check if text contains an incoming-transfer keyword, in any case"""
+        return INCOMING_PATTERN.search(text) is not None
     
-    def extract_payment_period(self, source: Path) -> Optional[PaymentPeriod]:
+    def extract_payment_period(self, source: Union[Path, BinaryIO]) -> Optional[PaymentPeriod]:
         """
         Extract payment period from Sberbank statement
         
         Looks for lines like "Итого по операциям с 01.05.2025 по 12.06.2025"
         
         Args:
-            source: Path to Excel file
+            source: Path to Excel file or binary file-like object with workbook data
             
         Returns:
             PaymentPeriod if found, None otherwise
@@ -286,38 +470,35 @@ class SberbankStatementParser(StatementParser):
         if not self.validate_source(source):
             return None
         
+        # Fast path: the summary line is a plain string, so it normally sits in the
+        # shared strings table, which can be streamed without loading the sheet
+        try:
+            period = self._find_period_in_shared_strings(source)
+        except (KeyError, zipfile.BadZipFile, ElementTree.ParseError) as e:
+            self.logger.debug(f"Shared strings scan not possible for {source}: {e}")
+            period = None
+        finally:
+            if not isinstance(source, Path):
+                source.seek(0)
+        
+        if period:
+            self.logger.info(f"Found payment period: {period}")
+            return period
+        
         workbook = None
         try:
             workbook = load_workbook(source, read_only=True, data_only=True)
             worksheet = workbook.active
             
-            for row_num, row in enumerate(worksheet.iter_rows(min_row=1), 1):
-                for cell in row:
-                    if cell.value and isinstance(cell.value, str):
-                        cell_text = cell.value.strip().lower()
-                        
-                        # Search for period pattern
-                        match = self.period_pattern.search(cell_text)
-                        if match:
-                            start_date_str = match.group(1)
-                            end_date_str = match.group(2)
-                            
-                            try:
-                                start_date = datetime.strptime(start_date_str, '%d.%m.%Y').date()
-                                end_date = datetime.strptime(end_date_str, '%d.%m.%Y').date()
-                                
-                                period = PaymentPeriod(
-                                    start_date=start_date,
-                                    end_date=end_date,
-                                    source_text=cell.value.strip()
-                                )
-                                
-                                self.logger.info(f"Found payment period: {period}")
-                                return period
-                                
-                            except ValueError as e:
-                                self.logger.warning(f"Failed to parse dates from '{cell.value}': {e}")
-                                continue
+            for row in worksheet.iter_rows(min_row=1, values_only=True):
+                for value in row:
+                    if not value or not isinstance(value, str):
+                        continue
+                    
+                    period = self._period_from_text(value)
+                    if period:
+                        self.logger.info(f"Found payment period: {period}")
+                        return period
             
             self.logger.warning(f"No payment period found in {source}")
             return None
@@ -331,3 +512,58 @@ class SberbankStatementParser(StatementParser):
                     workbook.close()
                 except Exception as e:
                     self.logger.warning(f"Error closing workbook: {e}")
+    
+    def _find_period_in_shared_strings(self, source: Union[Path, BinaryIO]) -> Optional[PaymentPeriod]:
+        """
+        Stream the shared strings table of an .xlsx package looking for the period line
+        
+        The table is shared by all sheets of the workbook, so a period is returned
+        only when it is the single one there; otherwise the caller has to scan
+        the active sheet.
+        
+        Raises:
+            KeyError: If the package has no shared strings table
+            zipfile.BadZipFile: If source is not an .xlsx package
+        """
+        found = None
+        with zipfile.ZipFile(source) as archive:
+            with archive.open(SHARED_STRINGS_PART) as shared_strings:
+                for _, element in ElementTree.iterparse(shared_strings, events=('end',)):
+                    if element.tag != SHARED_STRING_TAG:
+                        continue
+                    
+                    # Rich text items split the string into several runs
+                    text = ''.join(element.itertext())
+                    element.clear()
+                    
+                    period = self._period_from_text(text)
+                    if not period:
+                        continue
+                    
+                    if found and (found.start_date, found.end_date) != (period.start_date, period.end_date):
+                        self.logger.debug("Several periods in shared strings, falling back to the active sheet")
+                        return None
+                    found = found or period
+        
+        return found
+    
+    def _period_from_text(self, text: str) -> Optional[PaymentPeriod]:
+        """Build payment period from a summary line, or None if text is not one"""
+        match = self.period_pattern.search(text)
+        if not match:
+            return None
+        
+        source_text = text.strip()
+        try:
+            start_date = datetime.strptime(match.group(1), '%d.%m.%Y').date()
+            end_date = datetime.strptime(match.group(2), '%d.%m.%Y').date()
+            
+            return PaymentPeriod(
+                start_date=start_date,
+                end_date=end_date,
+                source_text=source_text
+            )
+            
+        except ValueError as e:
+            self.logger.warning(f"Failed to parse dates from '{source_text}': {e}")
+            return None
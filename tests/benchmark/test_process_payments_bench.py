@@ -0,0 +1,101 @@
+"""
+Performance benchmarks for ProcessPaymentsUseCase
+
+Skipped by a plain pytest run (see pytest_collection_modifyitems in tests/conftest.py).
+Run separately and keep the results to compare across commits:
+    python -m pytest tests/benchmark --benchmark-only --benchmark-min-rounds=5
+    python -m pytest tests/benchmark --benchmark-only --benchmark-json=benchmark-results.json
+"""
+
+import pytest
+from types import SimpleNamespace
+from decimal import Decimal
+from datetime import date
+
+from src.application.use_cases.process_payments import ProcessPaymentsUseCase
+from src.application.dto.payment_request import PaymentProcessRequest
+from src.core.models.garage import Garage
+from src.core.models.transaction import Transaction
+from src.core.services.payment_matcher import PaymentMatcher
+
+
+GARAGE_COUNT = 300
+# Rents repeat every DISTINCT_RENTS garages so duplicate detection has work to do
+DISTINCT_RENTS = 150
+
+
+def _garage_rows():
+    """Raw garage rows as returned by the garage parser"""
+    return [
+        {
+            'id': str(i),
+            'monthly_rent': Decimal(2000 + (i % DISTINCT_RENTS) * 10),
+            'start_date': date(2024, 1, 1),
+            'payment_day': i % 31 + 1,
+        }
+        for i in range(1, GARAGE_COUNT + 1)
+    ]
+
+
+def _transactions(garage_rows):
+    """Incoming transfers paying every other garage on its payment day"""
+    return [
+        Transaction(date(2025, 1, row['payment_day']), row['monthly_rent'], "Перевод СБП")
+        for row in garage_rows[::2]
+    ]
+
+
+@pytest.fixture(scope="module")
+def garage_rows():
+    """Create synthetic garage registry"""
+    return _garage_rows()
+
+
+@pytest.fixture(scope="module")
+def use_case(garage_rows):
+    """Create use case with in-memory parsers and a real payment matcher"""
+    transactions = _transactions(garage_rows)
+    parser_factory = SimpleNamespace(
+        create_garage_parser=lambda **kwargs: SimpleNamespace(parse_garages=lambda source: garage_rows),
+        create_statement_parser=lambda **kwargs: SimpleNamespace(parse_transactions=lambda source: transactions),
+    )
+    return ProcessPaymentsUseCase(
+        parser_factory=parser_factory,
+        payment_matcher=PaymentMatcher()
+    )
+
+
+@pytest.fixture(scope="module")
+def payment_request(tmp_path_factory):
+    """Create request pointing at placeholder files (parsers never read them)"""
+    directory = tmp_path_factory.mktemp("bench")
+    garage_file = directory / "garages.xlsx"
+    statement_file = directory / "statement.xlsx"
+    garage_file.touch()
+    statement_file.touch()
+    
+    return PaymentProcessRequest(
+        garage_file=garage_file,
+        statement_file=statement_file,
+        analysis_date=date(2025, 1, 31)
+    )
+
+
+@pytest.mark.benchmark(group="use_case")
+def test_execute_bench(benchmark, use_case, payment_request):
+    """Benchmark full payment processing without file I/O"""
+    response = benchmark(use_case.execute, payment_request)
+    
+    assert response.success is True
+    assert len(response.report.payments) == GARAGE_COUNT
+
+
+@pytest.mark.benchmark(group="use_case")
+def test_validate_data_integrity_bench(benchmark, use_case, garage_rows):
+    """Benchmark data integrity validation in isolation"""
+    garages = [Garage(**row) for row in garage_rows]
+    
+    warnings = benchmark.pedantic(use_case._validate_data_integrity, args=(garages,), rounds=20, iterations=3)
+    
+    assert any("Duplicate rental amount" in warning for warning in warnings)
+    assert any("payment days > 28" in warning for warning in warnings)
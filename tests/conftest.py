@@ -3,9 +3,7 @@ Pytest configuration and shared fixtures
 """
 
 import pytest
-import tempfile
 import logging
-from pathlib import Path
 from decimal import Decimal
 from datetime import date
 from unittest.mock import Mock
@@ -19,6 +17,7 @@ from src.core.services.payment_matcher import PaymentMatcher
 from src.core.services.date_calculator import DateCalculator
 from src.core.services.status_determiner import StatusDeterminer
 from src.infrastructure.localization.i18n import LocalizationManager
+from src.infrastructure.file_handlers.excel_writer import ExcelReportWriter
 from tests.fixtures.mock_data import MockDataProvider
 
 
@@ -27,10 +26,9 @@ logging.basicConfig(level=logging.DEBUG)
 
 
 @pytest.fixture(scope="session")
-def temp_dir():
-    """Create temporary directory for test session"""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        yield Path(temp_dir)
+def temp_dir(tmp_path_factory):
+    """Create temporary directory for test session (separate per xdist worker)"""
+    return tmp_path_factory.mktemp("session")
 
 
 @pytest.fixture
@@ -123,9 +121,9 @@ def amount_matching_scenarios():
     return MockDataProvider.create_amount_matching_scenarios()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def parser_factory():
-    """Fixture providing ParserFactory instance"""
+    """Fixture providing ParserFactory instance shared by the whole session (stateless)"""
     return ParserFactory()
 
 
@@ -135,9 +133,9 @@ def payment_matcher():
     return PaymentMatcher(search_window_days=7, grace_period_days=3)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def date_calculator():
-    """Fixture providing DateCalculator instance"""
+    """Fixture providing DateCalculator instance (stateless, shared by the session)"""
     return DateCalculator()
 
 
@@ -147,12 +145,24 @@ def status_determiner():
     return StatusDeterminer(grace_period_days=3)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def localization_manager():
-    """Fixture providing LocalizationManager instance"""
+    """Fixture providing English LocalizationManager shared by the whole session"""
     return LocalizationManager("en")
 
 
+@pytest.fixture(scope="session")
+def ru_localization_manager():
+    """Fixture providing Russian LocalizationManager shared by the whole session"""
+    return LocalizationManager("ru")
+
+
+@pytest.fixture(scope="session")
+def excel_writer():
+    """Fixture providing ExcelReportWriter instance shared by the whole session (stateless)"""
+    return ExcelReportWriter()
+
+
 @pytest.fixture
 def mock_parser_factory():
     """Fixture providing mock ParserFactory"""
@@ -249,11 +259,23 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "cli: mark test as CLI-related"
     )
+    config.addinivalue_line(
+        "markers", "benchmark: mark test as a benchmark, run only with --benchmark-only"
+    )
 
 
 def pytest_collection_modifyitems(config, items):
     """Modify test collection to add markers automatically"""
+    # Benchmarks are opt-in; the option is absent when pytest-benchmark is not installed
+    run_benchmarks = config.getoption("benchmark_only", default=False)
+    skip_benchmark = pytest.mark.skip(reason="benchmark, run with --benchmark-only")
+    
     for item in items:
+        if "benchmark" in getattr(item, "fixturenames", ()):
+            item.add_marker(pytest.mark.benchmark)
+        if not run_benchmarks and item.get_closest_marker("benchmark"):
+            item.add_marker(skip_benchmark)
+        
         # Add markers based on test file location
         if "unit" in str(item.fspath):
             item.add_marker(pytest.mark.unit)
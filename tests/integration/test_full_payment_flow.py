@@ -3,8 +3,6 @@ Integration tests for full payment processing flow
 """
 
 import pytest
-import tempfile
-from pathlib import Path
 from decimal import Decimal
 from datetime import date, datetime
 from openpyxl import Workbook
@@ -12,21 +10,36 @@ from openpyxl import Workbook
 from src.application.use_cases.process_payments import ProcessPaymentsUseCase
 from src.application.use_cases.generate_report import GenerateReportUseCase
 from src.application.dto.payment_request import PaymentProcessRequest
-from src.parsers.base.parser_factory import ParserFactory
 from src.core.services.payment_matcher import PaymentMatcher
-from src.infrastructure.file_handlers.excel_writer import ExcelReportWriter
-from src.infrastructure.localization.i18n import LocalizationManager
 from src.core.models.payment import PaymentStatus
 
 
+@pytest.fixture(scope="class")
+def use_cases(parser_factory, excel_writer, localization_manager):
+    """Create configured use cases for testing (stateless, shared by the class)"""
+    payment_matcher = PaymentMatcher(search_window_days=7, grace_period_days=3,
+                                     i18n=localization_manager)
+    
+    process_use_case = ProcessPaymentsUseCase(
+        parser_factory=parser_factory,
+        payment_matcher=payment_matcher
+    )
+    
+    report_use_case = GenerateReportUseCase(
+        excel_writer=excel_writer,
+        localization_manager=localization_manager
+    )
+    
+    return process_use_case, report_use_case
+
+
 class TestFullPaymentFlow:
     """Integration tests for complete payment processing flow"""
     
     @pytest.fixture
-    def temp_dir(self):
-        """Create temporary directory for test files"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield Path(temp_dir)
+    def temp_dir(self, tmp_path):
+        """Per-test temporary directory (unique per xdist worker as well)"""
+        return tmp_path
     
     @pytest.fixture
     def garage_file(self, temp_dir):
@@ -38,9 +51,7 @@ class TestFullPaymentFlow:
         ws = wb.active
         
         # Headers
-        ws['A1'] = "Гараж"
-        ws['B1'] = "Сумма"
-        ws['C1'] = "Первоначальная дата"
+        ws.append(["Гараж", "Сумма", "Первоначальная дата"])
         
         # Data rows
         garage_data = [
@@ -51,10 +62,8 @@ class TestFullPaymentFlow:
             ("5", 2600.00, "05.01.2025"),  # No matching payment
         ]
         
-        for row, (garage_id, amount, start_date) in enumerate(garage_data, 2):
-            ws[f'A{row}'] = garage_id
-            ws[f'B{row}'] = amount
-            ws[f'C{row}'] = start_date
+        for row in garage_data:
+            ws.append(row)
         
         wb.save(file_path)
         return file_path
@@ -78,32 +87,22 @@ class TestFullPaymentFlow:
             ("20.01.2025 19:00", "19:00", "", "Перевод СБП", "+1 500,00"),  # No matching garage
         ]
         
-        for row, data in enumerate(transaction_data, 1):
-            for col, value in enumerate(data, 1):
-                ws.cell(row=row, column=col, value=value)
+        for row in transaction_data:
+            ws.append(row)
         
         wb.save(file_path)
         return file_path
     
     @pytest.fixture
-    def use_cases(self):
-        """Create configured use cases for testing"""
-        parser_factory = ParserFactory()
-        payment_matcher = PaymentMatcher(search_window_days=7, grace_period_days=3)
-        excel_writer = ExcelReportWriter()
-        i18n = LocalizationManager("en")
-        
-        process_use_case = ProcessPaymentsUseCase(
-            parser_factory=parser_factory,
-            payment_matcher=payment_matcher
-        )
-        
-        report_use_case = GenerateReportUseCase(
-            excel_writer=excel_writer,
-            localization_manager=i18n
-        )
+    def empty_statement_file(self, temp_dir):
+        """Create bank statement Excel file without any transactions"""
+        file_path = temp_dir / "empty_statement.xlsx"
         
-        return process_use_case, report_use_case
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet()
+        ws.append(["No data"])
+        wb.save(file_path)
+        return file_path
     
     def test_complete_payment_processing_flow(self, garage_file, statement_file, use_cases, temp_dir):
         """Test complete flow from file input to report generation"""
@@ -130,19 +129,19 @@ class TestFullPaymentFlow:
         assert len(report.payments) == 5  # 5 garages
         
         # Verify payment matching results
-        payment_statuses = {p.garage_id: p.status for p in report.payments}
+        payments_by_id = {p.garage_id: p for p in report.payments}
         
         # Should have received payments for garages with matching transactions
         received_garages = [p.garage_id for p in report.payments if p.status == PaymentStatus.RECEIVED]
         assert len(received_garages) >= 3  # At least 3 should match
         
         # Garage 5 should be overdue (no matching transaction for 2600.00)
-        garage_5_payment = next(p for p in report.payments if p.garage_id == "5")
+        garage_5_payment = payments_by_id["5"]
         assert garage_5_payment.status == PaymentStatus.OVERDUE
         
         # Verify duplicate amount handling
-        garage_1_payment = next(p for p in report.payments if p.garage_id == "1")
-        garage_4_payment = next(p for p in report.payments if p.garage_id == "4")
+        garage_1_payment = payments_by_id["1"]
+        garage_4_payment = payments_by_id["4"]
         
         # Both should have amount 3500, but only one can match each transaction
         assert garage_1_payment.amount == Decimal("3500.00")
@@ -173,81 +172,45 @@ class TestFullPaymentFlow:
         assert summary.overdue_count >= 1
         assert summary.total_expected == 16600.00  # Sum of all garage amounts
     
-    def test_payment_flow_with_empty_statement(self, garage_file, temp_dir, use_cases):
-        """Test payment processing with empty bank statement"""
-        process_use_case, _ = use_cases
-        
-        # Create empty statement file
-        empty_statement = temp_dir / "empty_statement.xlsx"
-        wb = Workbook()
-        ws = wb.active
-        ws['A1'] = "No data"
-        wb.save(empty_statement)
-        
-        request = PaymentProcessRequest(
-            garage_file=garage_file,
-            statement_file=empty_statement,
-            analysis_date=date(2025, 1, 20)
-        )
-        
-        response = process_use_case.execute(request)
-        
-        # Should succeed but all payments should be overdue
-        assert response.success is True
-        assert all(p.status == PaymentStatus.OVERDUE for p in response.report.payments)
-        assert response.report.summary.received_count == 0
-        assert response.report.summary.overdue_count == 5
-    
-    def test_payment_flow_with_early_analysis_date(self, garage_file, statement_file, use_cases):
-        """Test payment processing with analysis date before expected payments"""
-        process_use_case, _ = use_cases
-        
-        # Analysis date before any expected payments
-        early_date = date(2024, 12, 15)
-        
-        request = PaymentProcessRequest(
-            garage_file=garage_file,
-            statement_file=statement_file,
-            analysis_date=early_date
-        )
-        
-        response = process_use_case.execute(request)
-        
-        # Should succeed but all payments should be not due
-        assert response.success is True
-        # Most payments should be not due (since expected dates are in January 2025)
-        not_due_count = sum(1 for p in response.report.payments if p.status == PaymentStatus.NOT_DUE)
-        assert not_due_count >= 4  # Most should be not due yet
-    
-    def test_payment_flow_with_pending_payments(self, garage_file, statement_file, use_cases):
-        """Test payment processing with some payments in pending status"""
+    @pytest.mark.parametrize("statement_fixture, analysis_date, min_counts, max_counts", [
+        # Empty statement: nothing can match, every payment is overdue
+        pytest.param("empty_statement_file", date(2025, 1, 20),
+                     {PaymentStatus.OVERDUE: 5}, {PaymentStatus.RECEIVED: 0},
+                     id="empty_statement"),
+        # Analysis date before any expected payments: most should be not due yet
+        pytest.param("statement_file", date(2024, 12, 15),
+                     {PaymentStatus.NOT_DUE: 4}, {},
+                     id="early_analysis_date"),
+        # Analysis date within grace period for some payments: some received,
+        # the rest pending or overdue depending on exact timing
+        pytest.param("statement_file", date(2025, 1, 17),
+                     {PaymentStatus.RECEIVED: 1}, {},
+                     id="pending_payments"),
+    ])
+    def test_payment_flow_status_distribution(self, request, garage_file, use_cases,
+                                              statement_fixture, analysis_date,
+                                              min_counts, max_counts):
+        """Test payment status distribution for different statements and analysis dates"""
         process_use_case, _ = use_cases
         
-        # Analysis date within grace period for some payments
-        analysis_date = date(2025, 1, 17)  # Some payments should be pending
-        
-        request = PaymentProcessRequest(
+        request_dto = PaymentProcessRequest(
             garage_file=garage_file,
-            statement_file=statement_file,
+            statement_file=request.getfixturevalue(statement_fixture),
             analysis_date=analysis_date
         )
         
-        response = process_use_case.execute(request)
+        response = process_use_case.execute(request_dto)
         
         assert response.success is True
         
-        # Should have mix of received and pending payments
         status_counts = {}
         for payment in response.report.payments:
             status_counts[payment.status] = status_counts.get(payment.status, 0) + 1
         
-        # Should have some received payments
-        assert status_counts.get(PaymentStatus.RECEIVED, 0) > 0
-        
-        # Might have pending or overdue depending on exact timing
-        pending_or_overdue = (status_counts.get(PaymentStatus.PENDING, 0) + 
-                             status_counts.get(PaymentStatus.OVERDUE, 0))
-        assert pending_or_overdue >= 0
+        for status, minimum in min_counts.items():
+            assert status_counts.get(status, 0) >= minimum, status_counts
+        for status, maximum in max_counts.items():
+            assert status_counts.get(status, 0) <= maximum, status_counts
     
     def test_payment_flow_with_corrupted_garage_file(self, statement_file, use_cases, temp_dir):
         """Test payment processing with corrupted garage file"""
@@ -270,10 +233,8 @@ class TestFullPaymentFlow:
         assert len(response.errors) > 0
         assert response.report is None
     
-    def test_payment_flow_with_missing_files(self, use_cases, temp_dir):
+    def test_payment_flow_with_missing_files(self, temp_dir):
         """Test payment processing with missing files"""
-        process_use_case, _ = use_cases
-        
         nonexistent_garage = temp_dir / "nonexistent_garage.xlsx"
         nonexistent_statement = temp_dir / "nonexistent_statement.xlsx"
         
@@ -294,28 +255,18 @@ class TestFullPaymentFlow:
         wb = Workbook()
         ws = wb.active
         
-        ws['A1'] = "Гараж"
-        ws['B1'] = "Сумма"
-        ws['C1'] = "Первоначальная дата"
+        ws.append(["Гараж", "Сумма", "Первоначальная дата"])
         
         # Garage with payment day 29 (edge case for February)
-        ws['A2'] = "1"
-        ws['B2'] = 3500.00
-        ws['C2'] = "29.01.2024"  # Payment day 29
+        ws.append(["1", 3500.00, "29.01.2024"])  # Payment day 29
         
         wb.save(garage_file)
         
         # Create statement with payment on February 28 (since Feb 29 doesn't exist in 2025)
         statement_file = temp_dir / "edge_statement.xlsx"
-        wb = Workbook()
-        ws = wb.active
-        
-        ws['A1'] = "28.02.2025 14:30"
-        ws['B1'] = "14:30"
-        ws['C1'] = ""
-        ws['D1'] = "Перевод СБП"
-        ws['E1'] = "+3 500,00"
-        
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet()
+        ws.append(["28.02.2025 14:30", "14:30", "", "Перевод СБП", "+3 500,00"])
         wb.save(statement_file)
         
         request = PaymentProcessRequest(
@@ -335,15 +286,10 @@ class TestFullPaymentFlow:
         assert payment.expected_date.day <= 28
         assert payment.expected_date.month == 2
     
-    def test_full_flow_performance(self, garage_file, statement_file, use_cases, temp_dir):
-        """Test that full flow completes in reasonable time"""
-        import time
-        
+    def _run_full_flow(self, use_cases, garage_file, statement_file, output_path):
+        """Process payments and write the Excel report, returning both responses"""
         process_use_case, report_use_case = use_cases
         
-        start_time = time.time()
-        
-        # Process payments
         request = PaymentProcessRequest(
             garage_file=garage_file,
             statement_file=statement_file,
@@ -351,18 +297,30 @@ class TestFullPaymentFlow:
         )
         
         process_response = process_use_case.execute(request)
-        assert process_response.success is True
-        
-        # Generate report
-        output_path = temp_dir / "performance_report.xlsx"
         report_response = report_use_case.generate_excel_report(process_response.report, output_path)
+        return process_response, report_response
+    
+    def test_full_flow_process_and_report(self, garage_file, statement_file, use_cases, temp_dir):
+        """Test that full flow processes payments and writes the report"""
+        output_path = temp_dir / "full_flow_report.xlsx"
+        
+        process_response, report_response = self._run_full_flow(use_cases, garage_file, statement_file, output_path)
+        
+        assert process_response.success is True
         assert report_response.success is True
+        assert output_path.exists()
+    
+    def test_full_flow_performance(self, benchmark, garage_file, statement_file, use_cases, temp_dir):
+        """Test that full flow completes in reasonable time"""
+        output_path = temp_dir / "performance_report.xlsx"
         
-        end_time = time.time()
+        benchmark.pedantic(
+            self._run_full_flow, args=(use_cases, garage_file, statement_file, output_path), rounds=5, iterations=1
+        )
         
-        # Should complete within reasonable time (adjust threshold as needed)
-        processing_time = end_time - start_time
-        assert processing_time < 5.0  # Should complete within 5 seconds
+        # Stats are absent when benchmarking is disabled (e.g. under xdist)
+        if benchmark.stats:
+            assert benchmark.stats.stats.median < 5.0  # Should complete within 5 seconds
     
     def test_report_content_verification(self, garage_file, statement_file, use_cases, temp_dir):
         """Test that generated report contains expected content"""
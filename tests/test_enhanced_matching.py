@@ -14,6 +14,11 @@ from src.core.models.garage import Garage
 from src.core.models.transaction import Transaction
 
 
+# Shared amounts, parsed once at import instead of in every test
+AMOUNT_4295 = Decimal("4295.00")
+AMOUNT_3500 = Decimal("3500.00")
+
+
 class TestEnhancedMatching(unittest.TestCase):
     """Test enhanced payment matching with fallback search"""
     
@@ -23,7 +28,7 @@ class TestEnhancedMatching(unittest.TestCase):
         # Create test garage
         self.garage = Garage(
             id="1",
-            monthly_rent=Decimal("4295.00"),
+            monthly_rent=AMOUNT_4295,
             start_date=date(2025, 1, 1),
             payment_day=1
         )
@@ -37,7 +42,7 @@ class TestEnhancedMatching(unittest.TestCase):
         transactions = [
             Transaction(
                 date=date(2025, 4, 28),  # 3 days before expected
-                amount=Decimal("4295.00"),
+                amount=AMOUNT_4295,
                 category="Transfer",
                 source="test"
             )
@@ -58,7 +63,7 @@ class TestEnhancedMatching(unittest.TestCase):
         transactions = [
             Transaction(
                 date=date(2025, 5, 31),  # 30 days after expected (outside normal window)
-                amount=Decimal("4295.00"),
+                amount=AMOUNT_4295,
                 category="Transfer",
                 source="test"
             )
@@ -76,25 +81,14 @@ class TestEnhancedMatching(unittest.TestCase):
         analysis_date = date(2025, 5, 1)
         
         # Multiple transactions with same amount, outside normal window
+        candidate_dates = [
+            date(2025, 5, 31),  # Later transaction
+            date(2025, 5, 15),  # Earlier transaction (should be selected)
+            date(2025, 6, 1),   # Latest transaction
+        ]
         transactions = [
-            Transaction(
-                date=date(2025, 5, 31),  # Later transaction
-                amount=Decimal("4295.00"),
-                category="Transfer",
-                source="test1"
-            ),
-            Transaction(
-                date=date(2025, 5, 15),  # Earlier transaction (should be selected)
-                amount=Decimal("4295.00"),
-                category="Transfer",
-                source="test2"
-            ),
-            Transaction(
-                date=date(2025, 6, 1),   # Latest transaction
-                amount=Decimal("4295.00"),
-                category="Transfer",
-                source="test3"
-            )
+            Transaction(date=tx_date, amount=AMOUNT_4295, category="Transfer", source=f"test{i}")
+            for i, tx_date in enumerate(candidate_dates, 1)
         ]
         
         payments = self.matcher.match_payments([self.garage], transactions, analysis_date)
@@ -112,7 +106,7 @@ class TestEnhancedMatching(unittest.TestCase):
         transactions = [
             Transaction(
                 date=date(2025, 5, 15),
-                amount=Decimal("3500.00"),  # Different amount
+                amount=AMOUNT_3500,  # Different amount
                 category="Transfer",
                 source="test"
             )
@@ -133,13 +127,13 @@ class TestEnhancedMatching(unittest.TestCase):
         transactions = [
             Transaction(
                 date=date(2025, 4, 28),  # Within normal window
-                amount=Decimal("4295.00"),
+                amount=AMOUNT_4295,
                 category="Transfer",
                 source="normal"
             ),
             Transaction(
                 date=date(2025, 5, 31),  # Outside normal window
-                amount=Decimal("4295.00"),
+                amount=AMOUNT_4295,
                 category="Transfer",
                 source="fallback"
             )
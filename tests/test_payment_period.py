@@ -2,10 +2,11 @@
 Tests for payment period functionality
 """
 
+import io
 import unittest
+import zipfile
 from datetime import date
 from pathlib import Path
-from tempfile import NamedTemporaryFile
 
 from openpyxl import Workbook
 
@@ -63,61 +64,83 @@ class TestSberbankPeriodExtraction(unittest.TestCase):
     def setUp(self):
         self.parser = SberbankStatementParser()
     
+    def _workbook_buffer(self, period_text=None):
+        """Build statement workbook in memory with an optional period summary line"""
+        workbook = Workbook()
+        worksheet = workbook.active
+        
+        # Add some dummy transaction data to make it look like Sberbank file
+        worksheet['A1'] = '01.05.2025 10:30'
+        worksheet['B1'] = 'Перевод на карту'
+        worksheet['C1'] = '+3500,00'
+        
+        if period_text:
+            worksheet['A5'] = period_text
+        
+        buffer = io.BytesIO()
+        workbook.save(buffer)
+        workbook.close()
+        buffer.seek(0)
+        return buffer
+    
+    def _with_shared_strings(self, buffer, *texts):
+        """Copy workbook package adding a shared strings table with the given texts"""
+        items = ''.join(f'<si><t>{text}</t></si>' for text in texts)
+        result = io.BytesIO()
+        with zipfile.ZipFile(buffer) as source, zipfile.ZipFile(result, 'w') as target:
+            for item in source.infolist():
+                target.writestr(item, source.read(item.filename))
+            target.writestr(
+                'xl/sharedStrings.xml',
+                f'<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">{items}</sst>'
+            )
+        result.seek(0)
+        return result
+    
     def test_extract_period_from_text(self):
         """Test period extraction from Excel file with period text"""
-        # Create temporary Excel file with period text
-        with NamedTemporaryFile(suffix='.xlsx', delete=False) as tmp_file:
-            workbook = Workbook()
-            worksheet = workbook.active
-            
-            # Add some dummy data
-            worksheet['A1'] = '01.05.2025 10:30'
-            worksheet['B1'] = 'Перевод на карту'
-            worksheet['C1'] = '+3500,00'
-            
-            # Add period summary line
-            worksheet['A5'] = 'Итого по операциям с 01.05.2025 по 12.06.2025'
-            
-            workbook.save(tmp_file.name)
-            workbook.close()
-            
-            tmp_path = Path(tmp_file.name)
-            
-            try:
-                period = self.parser.extract_payment_period(tmp_path)
-                
-                self.assertIsNotNone(period)
-                self.assertEqual(period.start_date, date(2025, 5, 1))
-                self.assertEqual(period.end_date, date(2025, 6, 12))
-                self.assertIn("01.05.2025", period.source_text)
-                self.assertIn("12.06.2025", period.source_text)
-                
-            finally:
-                tmp_path.unlink()  # Clean up
+        source = self._workbook_buffer('Итого по операциям с 01.05.2025 по 12.06.2025')
+        
+        period = self.parser.extract_payment_period(source)
+        
+        self.assertIsNotNone(period)
+        self.assertEqual(period.start_date, date(2025, 5, 1))
+        self.assertEqual(period.end_date, date(2025, 6, 12))
+        self.assertIn("01.05.2025", period.source_text)
+        self.assertIn("12.06.2025", period.source_text)
     
     def test_extract_period_not_found(self):
         """Test period extraction when no period text exists"""
-        # Create temporary Excel file without period text
-        with NamedTemporaryFile(suffix='.xlsx', delete=False) as tmp_file:
-            workbook = Workbook()
-            worksheet = workbook.active
-            
-            # Add some dummy data without period summary
-            worksheet['A1'] = '01.05.2025 10:30'
-            worksheet['B1'] = 'Перевод на карту'
-            worksheet['C1'] = '+3500,00'
-            
-            workbook.save(tmp_file.name)
-            workbook.close()
-            
-            tmp_path = Path(tmp_file.name)
-            
-            try:
-                period = self.parser.extract_payment_period(tmp_path)
-                self.assertIsNone(period)
-                
-            finally:
-                tmp_path.unlink()  # Clean up
+        source = self._workbook_buffer()
+        
+        period = self.parser.extract_payment_period(source)
+        self.assertIsNone(period)
+    
+    def test_extract_period_from_shared_strings(self):
+        """Test period is read from the shared strings table without loading the sheet"""
+        source = self._with_shared_strings(
+            self._workbook_buffer(), 'Перевод на карту', 'Итого по операциям с 01.05.2025 по 12.06.2025'
+        )
+        
+        period = self.parser.extract_payment_period(source)
+        
+        self.assertIsNotNone(period)
+        self.assertEqual(period.start_date, date(2025, 5, 1))
+        self.assertEqual(period.end_date, date(2025, 6, 12))
+    
+    def test_extract_period_ambiguous_shared_strings(self):
+        """Test active sheet is scanned when shared strings hold periods of several sheets"""
+        source = self._with_shared_strings(
+            self._workbook_buffer('Итого по операциям с 01.05.2025 по 12.06.2025'),
+            'Итого по операциям с 01.04.2025 по 30.04.2025',
+            'Итого по операциям с 01.05.2025 по 12.06.2025'
+        )
+        
+        period = self.parser.extract_payment_period(source)
+        
+        self.assertIsNotNone(period)
+        self.assertEqual(period.start_date, date(2025, 5, 1))
+        self.assertEqual(period.end_date, date(2025, 6, 12))
     
     def test_extract_period_invalid_file(self):
         """Test period extraction with invalid file"""
@@ -127,33 +150,13 @@ class TestSberbankPeriodExtraction(unittest.TestCase):
     
     def test_extract_period_case_insensitive(self):
         """Test period extraction is case insensitive"""
-        # Create temporary Excel file with uppercase period text
-        with NamedTemporaryFile(suffix='.xlsx', delete=False) as tmp_file:
-            workbook = Workbook()
-            worksheet = workbook.active
-            
-            # Add some dummy transaction data first to make it look like Sberbank file
-            worksheet['A1'] = '01.05.2025 10:30'
-            worksheet['B1'] = 'Перевод на карту'
-            worksheet['C1'] = '+3500,00'
-            
-            # Add period summary line in uppercase
-            worksheet['A5'] = 'ИТОГО ПО ОПЕРАЦИЯМ С 01.05.2025 ПО 12.06.2025'
-            
-            workbook.save(tmp_file.name)
-            workbook.close()
-            
-            tmp_path = Path(tmp_file.name)
-            
-            try:
-                period = self.parser.extract_payment_period(tmp_path)
-                
-                self.assertIsNotNone(period)
-                self.assertEqual(period.start_date, date(2025, 5, 1))
-                self.assertEqual(period.end_date, date(2025, 6, 12))
-                
-            finally:
-                tmp_path.unlink()  # Clean up
+        source = self._workbook_buffer('ИТОГО ПО ОПЕРАЦИЯМ С 01.05.2025 ПО 12.06.2025')
+        
+        period = self.parser.extract_payment_period(source)
+        
+        self.assertIsNotNone(period)
+        self.assertEqual(period.start_date, date(2025, 5, 1))
+        self.assertEqual(period.end_date, date(2025, 6, 12))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,91 @@
+"""
+Shared fixtures for application layer tests
+"""
+
+import pytest
+from unittest.mock import MagicMock, Mock
+
+from src.application.use_cases.process_payments import ProcessPaymentsUseCase
+
+
+class StubParserFactory:
+    """
+    Parser factory double exposing only the methods the use case calls
+    
+    Each method returns its own parser mock, available as garage_parser and
+    statement_parser, so tests configure parsing results directly.
+    """
+    
+    def __init__(self):
+        self.create_garage_parser = MagicMock()
+        self.create_statement_parser = MagicMock()
+        self._wire_parsers()
+    
+    def _wire_parsers(self):
+        """Return fresh garage and statement parser mocks from the factory methods"""
+        self.garage_parser, self.statement_parser = Mock(), Mock()
+        self.create_garage_parser.return_value = self.garage_parser
+        self.create_statement_parser.return_value = self.statement_parser
+    
+    def reset_mock(self):
+        """Forget calls, overrides and side effects of both methods and rewire parsers"""
+        self.create_garage_parser.reset_mock(return_value=True, side_effect=True)
+        self.create_statement_parser.reset_mock(return_value=True, side_effect=True)
+        self._wire_parsers()
+
+
+class StubPaymentMatcher:
+    """Payment matcher double exposing only match_payments"""
+    
+    def __init__(self):
+        self.match_payments = MagicMock()
+    
+    def reset_mock(self):
+        """Forget calls, return value and side effect of match_payments"""
+        self.match_payments.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture
+def mock_parser_factory():
+    """Create fresh mock parser factory for tests asserting on calls"""
+    return StubParserFactory()
+
+
+@pytest.fixture
+def mock_payment_matcher():
+    """Create fresh mock payment matcher for tests asserting on calls"""
+    return StubPaymentMatcher()
+
+
+@pytest.fixture(scope="session")
+def wired_parser_factory():
+    """Create mock parser factory shared by tests that do not assert on calls"""
+    return StubParserFactory()
+
+
+@pytest.fixture(scope="session")
+def wired_payment_matcher():
+    """Create mock payment matcher shared by tests that do not assert on calls"""
+    return StubPaymentMatcher()
+
+
+@pytest.fixture(scope="session")
+def default_use_case(wired_parser_factory, wired_payment_matcher):
+    """Create ProcessPaymentsUseCase instance shared across the session"""
+    return ProcessPaymentsUseCase(
+        parser_factory=wired_parser_factory,
+        payment_matcher=wired_payment_matcher,
+        search_window_days=7,
+        grace_period_days=3
+    )
+
+
+@pytest.fixture(autouse=True)
+def reset_default_use_case(request):
+    """Give tests using the shared use case clean mocks"""
+    if "default_use_case" not in request.fixturenames:
+        return
+    
+    use_case = request.getfixturevalue("default_use_case")
+    use_case.parser_factory.reset_mock()
+    use_case.payment_matcher.reset_mock()
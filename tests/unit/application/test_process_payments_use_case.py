@@ -3,10 +3,12 @@ Unit tests for ProcessPaymentsUseCase
 """
 
 import pytest
+from dataclasses import replace
 from pathlib import Path
+from types import SimpleNamespace
 from decimal import Decimal
-from datetime import date
-from unittest.mock import Mock, patch, MagicMock
+from datetime import date, datetime
+from unittest.mock import Mock
 
 from src.application.use_cases.process_payments import ProcessPaymentsUseCase
 from src.application.dto.payment_request import PaymentProcessRequest
@@ -14,24 +16,56 @@ from src.core.models.garage import Garage
 from src.core.models.transaction import Transaction
 from src.core.models.payment import Payment, PaymentStatus
 from src.core.models.report import PaymentReport
-from src.parsers.base.parser_factory import ParserFactory
-from src.core.services.payment_matcher import PaymentMatcher
 from src.core.exceptions import ParseError, ValidationError, DataIntegrityError
 
 
+AMOUNT_3500 = Decimal("3500.00")
+AMOUNT_2800 = Decimal("2800.00")
+AMOUNT_4200 = Decimal("4200.00")
+
+TEST_XLSX = Path("test.xlsx")
+TEST_GARAGE_XLSX = Path("test_garage.xlsx")
+TEST_STATEMENT_XLSX = Path("test_statement.xlsx")
+# Report stores source files as strings
+TEST_GARAGE_FILE = str(TEST_GARAGE_XLSX)
+TEST_STATEMENT_FILE = str(TEST_STATEMENT_XLSX)
+
+# Raw garage rows as returned by the garage parser, built once at import
+GARAGE_DATA_3 = [
+    {'id': '1', 'monthly_rent': AMOUNT_3500, 'start_date': date(2025, 1, 1), 'payment_day': 15},
+    {'id': '2', 'monthly_rent': AMOUNT_2800, 'start_date': date(2025, 1, 2), 'payment_day': 16},
+    {'id': '3', 'monthly_rent': AMOUNT_4200, 'start_date': date(2025, 1, 3), 'payment_day': 17},
+]
+GARAGE_DATA_2 = GARAGE_DATA_3[:2]
+GARAGE_DATA_1 = GARAGE_DATA_3[:1]
+
+# Garage is frozen, so prebuilt instances are shared between tests
+BASE_GARAGE = Garage("1", AMOUNT_3500, date(2025, 1, 1), 15)
+GARAGES_OK = [
+    BASE_GARAGE,
+    replace(BASE_GARAGE, id="2", monthly_rent=AMOUNT_2800, start_date=date(2025, 1, 2), payment_day=16),
+    replace(BASE_GARAGE, id="3", monthly_rent=AMOUNT_4200, start_date=date(2025, 1, 3), payment_day=17),
+]
+GARAGES_DUP_AMOUNTS = [
+    BASE_GARAGE,
+    GARAGES_OK[1],
+    replace(BASE_GARAGE, id="3", start_date=date(2025, 1, 3), payment_day=17),  # Duplicate amount
+]
+GARAGES_UNUSUAL_DAYS = [
+    BASE_GARAGE,
+    replace(GARAGES_OK[1], payment_day=29),  # Unusual day
+    replace(GARAGES_OK[2], payment_day=31),  # Unusual day
+]
+GARAGES_MIXED = [
+    replace(BASE_GARAGE, payment_day=31),  # Unusual day
+    replace(BASE_GARAGE, id="2", start_date=date(2025, 1, 2), payment_day=29),  # Duplicate amount + unusual day
+    replace(GARAGES_OK[2], payment_day=30),  # Unusual day
+]
+
+
 class TestProcessPaymentsUseCase:
     """Test cases for ProcessPaymentsUseCase"""
     
-    @pytest.fixture
-    def mock_parser_factory(self):
-        """Create mock parser factory"""
-        return Mock(spec=ParserFactory)
-    
-    @pytest.fixture
-    def mock_payment_matcher(self):
-        """Create mock payment matcher"""
-        return Mock(spec=PaymentMatcher)
-    
     @pytest.fixture
     def use_case(self, mock_parser_factory, mock_payment_matcher):
         """Create ProcessPaymentsUseCase instance for testing"""
@@ -42,54 +76,50 @@ class TestProcessPaymentsUseCase:
             grace_period_days=3
         )
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_request(self):
         """Create sample payment process request"""
         return PaymentProcessRequest(
-            garage_file=Path("test_garage.xlsx"),
-            statement_file=Path("test_statement.xlsx"),
+            garage_file=TEST_GARAGE_XLSX,
+            statement_file=TEST_STATEMENT_XLSX,
             analysis_date=date(2025, 1, 20)
         )
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_garages(self):
         """Create sample garage data"""
-        return [
-            Garage("1", Decimal("3500.00"), date(2025, 1, 1), 15),
-            Garage("2", Decimal("2800.00"), date(2025, 1, 2), 16),
-            Garage("3", Decimal("4200.00"), date(2025, 1, 3), 17),
-        ]
+        return GARAGES_OK
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_transactions(self):
         """Create sample transaction data"""
         return [
-            Transaction(date(2025, 1, 15), Decimal("3500.00"), "Перевод СБП"),
-            Transaction(date(2025, 1, 16), Decimal("2800.00"), "Перевод на карту"),
-            Transaction(date(2025, 1, 18), Decimal("4200.00"), "Перевод СБП"),
+            Transaction(date(2025, 1, 15), AMOUNT_3500, "Перевод СБП"),
+            Transaction(date(2025, 1, 16), AMOUNT_2800, "Перевод на карту"),
+            Transaction(date(2025, 1, 18), AMOUNT_4200, "Перевод СБП"),
         ]
     
-    @pytest.fixture
-    def sample_payments(self, sample_garages):
+    @pytest.fixture(scope="module")
+    def sample_payments(self):
         """Create sample payment data"""
         return [
             Payment(
                 garage_id="1",
-                amount=Decimal("3500.00"),
+                amount=AMOUNT_3500,
                 expected_date=date(2025, 1, 15),
                 actual_date=date(2025, 1, 15),
                 status=PaymentStatus.RECEIVED
             ),
             Payment(
                 garage_id="2",
-                amount=Decimal("2800.00"),
+                amount=AMOUNT_2800,
                 expected_date=date(2025, 1, 16),
                 actual_date=date(2025, 1, 16),
                 status=PaymentStatus.RECEIVED
             ),
             Payment(
                 garage_id="3",
-                amount=Decimal("4200.00"),
+                amount=AMOUNT_4200,
                 expected_date=date(2025, 1, 17),
                 actual_date=None,
                 status=PaymentStatus.OVERDUE,
@@ -102,18 +132,10 @@ class TestProcessPaymentsUseCase:
                                          mock_parser_factory, mock_payment_matcher):
         """Test successful payment processing"""
         # Setup mocks
-        mock_garage_parser = Mock()
-        mock_statement_parser = Mock()
-        
-        mock_parser_factory.create_garage_parser.return_value = mock_garage_parser
-        mock_parser_factory.create_statement_parser.return_value = mock_statement_parser
+        mock_garage_parser, mock_statement_parser = mock_parser_factory.garage_parser, mock_parser_factory.statement_parser
         
         # Mock garage data (raw format from parser)
-        garage_data = [
-            {'id': '1', 'monthly_rent': Decimal('3500.00'), 'start_date': date(2025, 1, 1), 'payment_day': 15},
-            {'id': '2', 'monthly_rent': Decimal('2800.00'), 'start_date': date(2025, 1, 2), 'payment_day': 16},
-            {'id': '3', 'monthly_rent': Decimal('4200.00'), 'start_date': date(2025, 1, 3), 'payment_day': 17},
-        ]
+        garage_data = GARAGE_DATA_3
         
         mock_garage_parser.parse_garages.return_value = garage_data
         mock_statement_parser.parse_transactions.return_value = sample_transactions
@@ -138,8 +160,7 @@ class TestProcessPaymentsUseCase:
     def test_execute_garage_parsing_error(self, use_case, sample_request, mock_parser_factory):
         """Test handling of garage parsing error"""
         # Setup mock to raise exception
-        mock_garage_parser = Mock()
-        mock_garage_parser.parse_garages.side_effect = Exception("Failed to parse garage file")
+        mock_garage_parser = SimpleNamespace(parse_garages=Mock(side_effect=Exception("Failed to parse garage file")))
         mock_parser_factory.create_garage_parser.return_value = mock_garage_parser
         
         # Execute use case
@@ -155,19 +176,13 @@ class TestProcessPaymentsUseCase:
                                            mock_parser_factory, mock_payment_matcher):
         """Test handling of statement parsing error"""
         # Setup mocks
-        mock_garage_parser = Mock()
-        mock_statement_parser = Mock()
+        mock_garage_parser, mock_statement_parser = mock_parser_factory.garage_parser, mock_parser_factory.statement_parser
         
-        garage_data = [
-            {'id': '1', 'monthly_rent': Decimal('3500.00'), 'start_date': date(2025, 1, 1), 'payment_day': 15}
-        ]
+        garage_data = GARAGE_DATA_1
         
         mock_garage_parser.parse_garages.return_value = garage_data
         mock_statement_parser.parse_transactions.side_effect = Exception("Failed to parse statement file")
         
-        mock_parser_factory.create_garage_parser.return_value = mock_garage_parser
-        mock_parser_factory.create_statement_parser.return_value = mock_statement_parser
-        
         # Execute use case
         response = use_case.execute(sample_request)
         
@@ -177,134 +192,81 @@ class TestProcessPaymentsUseCase:
         assert len(response.errors) == 1
         assert "Failed to parse statement file" in response.errors[0]
     
-    def test_parse_garage_registry_successful(self, use_case, mock_parser_factory):
+    def test_parse_garage_registry_successful(self, default_use_case, wired_parser_factory):
         """Test successful garage registry parsing"""
-        mock_parser = Mock()
-        garage_data = [
-            {'id': '1', 'monthly_rent': Decimal('3500.00'), 'start_date': date(2025, 1, 1), 'payment_day': 15},
-            {'id': '2', 'monthly_rent': Decimal('2800.00'), 'start_date': date(2025, 1, 2), 'payment_day': 16},
-        ]
-        mock_parser.parse_garages.return_value = garage_data
-        mock_parser_factory.create_garage_parser.return_value = mock_parser
+        wired_parser_factory.garage_parser.parse_garages.return_value = GARAGE_DATA_2
         
-        test_file = Path("test.xlsx")
-        garages = use_case._parse_garage_registry(test_file)
+        garages = default_use_case._parse_garage_registry(TEST_XLSX)
         
         assert len(garages) == 2
         assert isinstance(garages[0], Garage)
         assert garages[0].id == "1"
-        assert garages[0].monthly_rent == Decimal("3500.00")
+        assert garages[0].monthly_rent == AMOUNT_3500
         assert garages[1].id == "2"
-        assert garages[1].monthly_rent == Decimal("2800.00")
+        assert garages[1].monthly_rent == AMOUNT_2800
     
-    def test_parse_garage_registry_parse_error(self, use_case, mock_parser_factory):
+    def test_parse_garage_registry_parse_error(self, default_use_case, wired_parser_factory):
         """Test garage registry parsing with parse error"""
-        mock_parser = Mock()
-        mock_parser.parse_garages.side_effect = Exception("Parse failed")
-        mock_parser_factory.create_garage_parser.return_value = mock_parser
-        
-        test_file = Path("test.xlsx")
+        mock_parser = SimpleNamespace(parse_garages=Mock(side_effect=Exception("Parse failed")))
+        wired_parser_factory.create_garage_parser.return_value = mock_parser
         
         with pytest.raises(ParseError, match="Failed to parse garage registry"):
-            use_case._parse_garage_registry(test_file)
+            default_use_case._parse_garage_registry(TEST_XLSX)
     
-    def test_parse_bank_statement_successful(self, use_case, mock_parser_factory, sample_transactions):
+    def test_parse_bank_statement_successful(self, default_use_case, wired_parser_factory, sample_transactions):
         """Test successful bank statement parsing"""
-        mock_parser = Mock()
-        mock_parser.parse_transactions.return_value = sample_transactions
-        mock_parser_factory.create_statement_parser.return_value = mock_parser
+        wired_parser_factory.statement_parser.parse_transactions.return_value = sample_transactions
         
-        test_file = Path("test.xlsx")
-        transactions = use_case._parse_bank_statement(test_file)
+        transactions = default_use_case._parse_bank_statement(TEST_XLSX)
         
         assert len(transactions) == 3
-        assert transactions[0].amount == Decimal("3500.00")
-        assert transactions[1].amount == Decimal("2800.00")
-        assert transactions[2].amount == Decimal("4200.00")
+        assert transactions[0].amount == AMOUNT_3500
+        assert transactions[1].amount == AMOUNT_2800
+        assert transactions[2].amount == AMOUNT_4200
     
-    def test_parse_bank_statement_parse_error(self, use_case, mock_parser_factory):
+    def test_parse_bank_statement_parse_error(self, default_use_case, wired_parser_factory):
         """Test bank statement parsing with parse error"""
-        mock_parser = Mock()
-        mock_parser.parse_transactions.side_effect = Exception("Parse failed")
-        mock_parser_factory.create_statement_parser.return_value = mock_parser
-        
-        test_file = Path("test.xlsx")
+        mock_parser = SimpleNamespace(parse_transactions=Mock(side_effect=Exception("Parse failed")))
+        wired_parser_factory.create_statement_parser.return_value = mock_parser
         
         with pytest.raises(ParseError, match="Failed to parse bank statement"):
-            use_case._parse_bank_statement(test_file)
-    
-    def test_validate_data_integrity_no_issues(self, use_case, sample_garages):
-        """Test data integrity validation with no issues"""
-        warnings = use_case._validate_data_integrity(sample_garages)
-        
-        assert len(warnings) == 0
-    
-    def test_validate_data_integrity_duplicate_amounts(self, use_case):
-        """Test data integrity validation with duplicate amounts"""
-        garages_with_duplicates = [
-            Garage("1", Decimal("3500.00"), date(2025, 1, 1), 15),
-            Garage("2", Decimal("2800.00"), date(2025, 1, 2), 16),
-            Garage("3", Decimal("3500.00"), date(2025, 1, 3), 17),  # Duplicate amount
-        ]
-        
-        warnings = use_case._validate_data_integrity(garages_with_duplicates)
-        
-        assert len(warnings) >= 1
-        assert any("Duplicate rental amount" in warning for warning in warnings)
-        assert any("3500" in warning for warning in warnings)
-        assert any("1, 3" in warning for warning in warnings)
-    
-    def test_validate_data_integrity_unusual_payment_days(self, use_case):
-        """Test data integrity validation with unusual payment days"""
-        garages_with_unusual_days = [
-            Garage("1", Decimal("3500.00"), date(2025, 1, 1), 15),
-            Garage("2", Decimal("2800.00"), date(2025, 1, 2), 29),  # Unusual day
-            Garage("3", Decimal("4200.00"), date(2025, 1, 3), 31),  # Unusual day
-        ]
-        
-        warnings = use_case._validate_data_integrity(garages_with_unusual_days)
-        
-        assert len(warnings) >= 1
-        assert any("payment days > 28" in warning for warning in warnings)
-        assert any("2, 3" in warning for warning in warnings)
+            default_use_case._parse_bank_statement(TEST_XLSX)
     
-    def test_validate_data_integrity_multiple_issues(self, use_case):
-        """Test data integrity validation with multiple issues"""
-        problematic_garages = [
-            Garage("1", Decimal("3500.00"), date(2025, 1, 1), 31),  # Unusual day
-            Garage("2", Decimal("3500.00"), date(2025, 1, 2), 29),  # Duplicate amount + unusual day
-            Garage("3", Decimal("4200.00"), date(2025, 1, 3), 30),  # Unusual day
-        ]
-        
-        warnings = use_case._validate_data_integrity(problematic_garages)
-        
-        # Should have warnings for both duplicates and unusual days
-        assert len(warnings) >= 2
-        assert any("Duplicate rental amount" in warning for warning in warnings)
-        assert any("payment days > 28" in warning for warning in warnings)
+    @pytest.mark.parametrize("garages,min_warnings,expected_substrings", [
+        pytest.param(GARAGES_OK, 0, [], id="no_issues"),
+        pytest.param(GARAGES_DUP_AMOUNTS, 1, ["Duplicate rental amount", "3500", "1, 3"], id="duplicate_amounts"),
+        pytest.param(GARAGES_UNUSUAL_DAYS, 1, ["payment days > 28", "2, 3"], id="unusual_payment_days"),
+        pytest.param(GARAGES_MIXED, 2, ["Duplicate rental amount", "payment days > 28"], id="multiple_issues"),
+    ])
+    def test_validate_data_integrity(self, default_use_case, garages, min_warnings, expected_substrings):
+        """Test data integrity validation scenarios"""
+        warnings = default_use_case._validate_data_integrity(garages)
+        
+        if not expected_substrings:
+            assert len(warnings) == 0
+        
+        assert len(warnings) >= min_warnings
+        for substring in expected_substrings:
+            assert any(substring in warning for warning in warnings)
     
     def test_execute_with_warnings_but_success(self, use_case, sample_request, mock_parser_factory, 
                                              mock_payment_matcher):
         """Test successful execution with validation warnings"""
         # Setup mocks with problematic data
-        mock_garage_parser = Mock()
-        mock_statement_parser = Mock()
+        mock_garage_parser, mock_statement_parser = mock_parser_factory.garage_parser, mock_parser_factory.statement_parser
         
         garage_data = [
-            {'id': '1', 'monthly_rent': Decimal('3500.00'), 'start_date': date(2025, 1, 1), 'payment_day': 15},
-            {'id': '2', 'monthly_rent': Decimal('3500.00'), 'start_date': date(2025, 1, 2), 'payment_day': 31},  # Duplicate + unusual day
+            {'id': '1', 'monthly_rent': AMOUNT_3500, 'start_date': date(2025, 1, 1), 'payment_day': 15},
+            {'id': '2', 'monthly_rent': AMOUNT_3500, 'start_date': date(2025, 1, 2), 'payment_day': 31},  # Duplicate + unusual day
         ]
         
         mock_garage_parser.parse_garages.return_value = garage_data
         mock_statement_parser.parse_transactions.return_value = []
         
-        mock_parser_factory.create_garage_parser.return_value = mock_garage_parser
-        mock_parser_factory.create_statement_parser.return_value = mock_statement_parser
-        
         # Mock payment matching
         payments = [
-            Payment("1", Decimal("3500.00"), date(2025, 1, 15), status=PaymentStatus.OVERDUE),
-            Payment("2", Decimal("3500.00"), date(2025, 1, 31), status=PaymentStatus.OVERDUE),
+            Payment("1", AMOUNT_3500, date(2025, 1, 15), status=PaymentStatus.OVERDUE),
+            Payment("2", AMOUNT_3500, date(2025, 1, 31), status=PaymentStatus.OVERDUE),
         ]
         mock_payment_matcher.match_payments.return_value = payments
         
@@ -322,32 +284,25 @@ class TestProcessPaymentsUseCase:
                                          mock_parser_factory, mock_payment_matcher):
         """Test that execute creates a proper PaymentReport"""
         # Setup mocks
-        mock_garage_parser = Mock()
-        mock_statement_parser = Mock()
+        mock_garage_parser, mock_statement_parser = mock_parser_factory.garage_parser, mock_parser_factory.statement_parser
         
-        garage_data = [
-            {'id': '1', 'monthly_rent': Decimal('3500.00'), 'start_date': date(2025, 1, 1), 'payment_day': 15},
-            {'id': '2', 'monthly_rent': Decimal('2800.00'), 'start_date': date(2025, 1, 2), 'payment_day': 16},
-        ]
+        garage_data = GARAGE_DATA_2
         
         mock_garage_parser.parse_garages.return_value = garage_data
         mock_statement_parser.parse_transactions.return_value = sample_transactions
         mock_payment_matcher.match_payments.return_value = sample_payments[:2]  # First two payments
         
-        mock_parser_factory.create_garage_parser.return_value = mock_garage_parser
-        mock_parser_factory.create_statement_parser.return_value = mock_statement_parser
-        
         # Execute use case
         response = use_case.execute(sample_request)
         
         # Verify report structure
         report = response.report
-        assert report.garage_file == str(sample_request.garage_file)
-        assert report.statement_file == str(sample_request.statement_file)
+        assert report.garage_file == TEST_GARAGE_FILE
+        assert report.statement_file == TEST_STATEMENT_FILE
         assert report.analysis_date == sample_request.analysis_date
         assert len(report.payments) == 2
         assert report.summary.total_garages == 2
-        assert isinstance(report.generated_at, type(report.generated_at))  # datetime
+        assert isinstance(report.generated_at, datetime)
     
     def test_execute_with_custom_configuration(self):
         """Test use case with custom configuration"""
@@ -370,16 +325,12 @@ class TestProcessPaymentsUseCase:
     def test_execute_empty_files(self, use_case, sample_request, mock_parser_factory, mock_payment_matcher):
         """Test execution with empty input files"""
         # Setup mocks for empty files
-        mock_garage_parser = Mock()
-        mock_statement_parser = Mock()
+        mock_garage_parser, mock_statement_parser = mock_parser_factory.garage_parser, mock_parser_factory.statement_parser
         
         mock_garage_parser.parse_garages.return_value = []  # Empty garage data
         mock_statement_parser.parse_transactions.return_value = []  # Empty transactions
         mock_payment_matcher.match_payments.return_value = []  # No payments
         
-        mock_parser_factory.create_garage_parser.return_value = mock_garage_parser
-        mock_parser_factory.create_statement_parser.return_value = mock_statement_parser
-        
         # Execute use case
         response = use_case.execute(sample_request)
         
@@ -2,13 +2,27 @@
 Unit tests for Payment model
 """
 
+import operator
+import re
 import pytest
+from dataclasses import replace
 from decimal import Decimal
 from datetime import date
 
 from src.core.models.payment import Payment, PaymentStatus
 
 
+AMOUNT_3500 = Decimal("3500.00")
+DATE_2025_01_15 = date(2025, 1, 15)
+
+# Validation messages, compiled once for pytest.raises(match=...)
+EMPTY_GARAGE_ID_RE = re.compile("Garage ID cannot be empty")
+NON_POSITIVE_AMOUNT_RE = re.compile("Payment amount must be positive")
+
+# Validated once; scenario tests derive variants from it with dataclasses.replace
+BASE_PAYMENT = Payment(garage_id="1", amount=AMOUNT_3500, expected_date=DATE_2025_01_15)
+
+
 class TestPayment:
     """Test cases for Payment model"""
     
@@ -16,13 +30,13 @@ class TestPayment:
         """Test creating payment with minimal required data"""
         payment = Payment(
             garage_id="1",
-            amount=Decimal("3500.00"),
-            expected_date=date(2025, 1, 15)
+            amount=AMOUNT_3500,
+            expected_date=DATE_2025_01_15
         )
         
         assert payment.garage_id == "1"
-        assert payment.amount == Decimal("3500.00")
-        assert payment.expected_date == date(2025, 1, 15)
+        assert payment.amount == AMOUNT_3500
+        assert payment.expected_date == DATE_2025_01_15
         assert payment.actual_date is None
         assert payment.status == PaymentStatus.NOT_DUE
         assert payment.days_overdue == 0
@@ -32,8 +46,8 @@ class TestPayment:
         """Test creating payment with all data"""
         payment = Payment(
             garage_id="1",
-            amount=Decimal("3500.00"),
-            expected_date=date(2025, 1, 15),
+            amount=AMOUNT_3500,
+            expected_date=DATE_2025_01_15,
             actual_date=date(2025, 1, 16),
             status=PaymentStatus.RECEIVED,
             days_overdue=1,
@@ -41,8 +55,8 @@ class TestPayment:
         )
         
         assert payment.garage_id == "1"
-        assert payment.amount == Decimal("3500.00")
-        assert payment.expected_date == date(2025, 1, 15)
+        assert payment.amount == AMOUNT_3500
+        assert payment.expected_date == DATE_2025_01_15
         assert payment.actual_date == date(2025, 1, 16)
         assert payment.status == PaymentStatus.RECEIVED
         assert payment.days_overdue == 1
@@ -50,29 +64,29 @@ class TestPayment:
     
     def test_payment_validation_empty_garage_id(self):
         """Test validation with empty garage ID"""
-        with pytest.raises(ValueError, match="Garage ID cannot be empty"):
+        with pytest.raises(ValueError, match=EMPTY_GARAGE_ID_RE):
             Payment(
                 garage_id="",
-                amount=Decimal("3500.00"),
-                expected_date=date(2025, 1, 15)
+                amount=AMOUNT_3500,
+                expected_date=DATE_2025_01_15
             )
     
     def test_payment_validation_negative_amount(self):
         """Test validation with negative amount"""
-        with pytest.raises(ValueError, match="Payment amount must be positive"):
+        with pytest.raises(ValueError, match=NON_POSITIVE_AMOUNT_RE):
             Payment(
                 garage_id="1",
                 amount=Decimal("-100.00"),
-                expected_date=date(2025, 1, 15)
+                expected_date=DATE_2025_01_15
             )
     
     def test_payment_validation_zero_amount(self):
         """Test validation with zero amount"""
-        with pytest.raises(ValueError, match="Payment amount must be positive"):
+        with pytest.raises(ValueError, match=NON_POSITIVE_AMOUNT_RE):
             Payment(
                 garage_id="1",
                 amount=Decimal("0.00"),
-                expected_date=date(2025, 1, 15)
+                expected_date=DATE_2025_01_15
             )
     
     def test_payment_status_properties(self):
@@ -80,8 +94,8 @@ class TestPayment:
         # Test received payment
         received_payment = Payment(
             garage_id="1",
-            amount=Decimal("3500.00"),
-            expected_date=date(2025, 1, 15),
+            amount=AMOUNT_3500,
+            expected_date=DATE_2025_01_15,
             status=PaymentStatus.RECEIVED
         )
         
@@ -91,8 +105,8 @@ class TestPayment:
         # Test overdue payment
         overdue_payment = Payment(
             garage_id="2",
-            amount=Decimal("3500.00"),
-            expected_date=date(2025, 1, 15),
+            amount=AMOUNT_3500,
+            expected_date=DATE_2025_01_15,
             status=PaymentStatus.OVERDUE
         )
         
@@ -102,8 +116,8 @@ class TestPayment:
         # Test pending payment
         pending_payment = Payment(
             garage_id="3",
-            amount=Decimal("3500.00"),
-            expected_date=date(2025, 1, 15),
+            amount=AMOUNT_3500,
+            expected_date=DATE_2025_01_15,
             status=PaymentStatus.PENDING
         )
         
@@ -122,8 +136,8 @@ class TestPayment:
         """Test string representation"""
         payment = Payment(
             garage_id="1",
-            amount=Decimal("3500.00"),
-            expected_date=date(2025, 1, 15),
+            amount=AMOUNT_3500,
+            expected_date=DATE_2025_01_15,
             status=PaymentStatus.RECEIVED
         )
         
@@ -133,103 +147,59 @@ class TestPayment:
         assert "amount=3500.00" in str_repr
         assert "status=received" in str_repr
     
-    def test_payment_with_notes(self):
-        """Test payment with various notes"""
-        notes_cases = [
+    @pytest.mark.parametrize("field_name,value", [
+        *[("notes", note) for note in [
             "",
             "Payment matched automatically",
             "Multiple matches found, selected closest date",
             "Amount conflict with garage #6",
             "No matching payment found in statement"
-        ]
-        
-        for note in notes_cases:
-            payment = Payment(
-                garage_id="1",
-                amount=Decimal("3500.00"),
-                expected_date=date(2025, 1, 15),
-                notes=note
-            )
-            assert payment.notes == note
-    
-    def test_payment_different_statuses(self):
-        """Test payment with different statuses"""
-        base_payment_data = {
-            "garage_id": "1",
-            "amount": Decimal("3500.00"),
-            "expected_date": date(2025, 1, 15)
-        }
-        
-        for status in PaymentStatus:
-            payment = Payment(**base_payment_data, status=status)
-            assert payment.status == status
+        ]],
+        *[("status", status) for status in PaymentStatus],
+    ])
+    def test_payment_field_roundtrip(self, field_name, value):
+        """Test payment keeps notes and status values it was created with"""
+        payment = replace(BASE_PAYMENT, **{field_name: value})
+        assert getattr(payment, field_name) == value
     
-    def test_payment_days_overdue_scenarios(self):
+    @pytest.mark.parametrize("days_overdue,status", [
+        (0, PaymentStatus.RECEIVED),
+        (0, PaymentStatus.PENDING),
+        (0, PaymentStatus.NOT_DUE),
+        (5, PaymentStatus.OVERDUE),
+        (30, PaymentStatus.OVERDUE)
+    ])
+    def test_payment_days_overdue_scenarios(self, days_overdue, status):
         """Test various days overdue scenarios"""
-        test_cases = [
-            (0, PaymentStatus.RECEIVED),
-            (0, PaymentStatus.PENDING),
-            (0, PaymentStatus.NOT_DUE),
-            (5, PaymentStatus.OVERDUE),
-            (30, PaymentStatus.OVERDUE)
-        ]
+        payment = replace(BASE_PAYMENT, status=status, days_overdue=days_overdue)
         
-        for days_overdue, status in test_cases:
-            payment = Payment(
-                garage_id="1",
-                amount=Decimal("3500.00"),
-                expected_date=date(2025, 1, 15),
-                status=status,
-                days_overdue=days_overdue
-            )
-            
-            assert payment.days_overdue == days_overdue
-            assert payment.status == status
+        assert payment.days_overdue == days_overdue
+        assert payment.status == status
     
-    def test_payment_with_actual_date_scenarios(self):
+    @pytest.mark.parametrize("actual_date,compare", [
+        pytest.param(date(2025, 1, 10), operator.lt, id="early"),
+        pytest.param(DATE_2025_01_15, operator.eq, id="ontime"),
+        pytest.param(date(2025, 1, 20), operator.gt, id="late"),
+    ])
+    def test_payment_with_actual_date_scenarios(self, actual_date, compare):
         """Test payment with different actual date scenarios"""
-        expected_date = date(2025, 1, 15)
+        payment = replace(BASE_PAYMENT, actual_date=actual_date, status=PaymentStatus.RECEIVED)
         
-        # Early payment
-        early_payment = Payment(
-            garage_id="1",
-            amount=Decimal("3500.00"),
-            expected_date=expected_date,
-            actual_date=date(2025, 1, 10),
-            status=PaymentStatus.RECEIVED
-        )
-        assert early_payment.actual_date < early_payment.expected_date
-        
-        # On-time payment  
-        ontime_payment = Payment(
-            garage_id="2",
-            amount=Decimal("3500.00"),
-            expected_date=expected_date,
-            actual_date=expected_date,
-            status=PaymentStatus.RECEIVED
-        )
-        assert ontime_payment.actual_date == ontime_payment.expected_date
-        
-        # Late payment
-        late_payment = Payment(
-            garage_id="3",
-            amount=Decimal("3500.00"),
-            expected_date=expected_date,
-            actual_date=date(2025, 1, 20),
-            status=PaymentStatus.RECEIVED
-        )
-        assert late_payment.actual_date > late_payment.expected_date
+        assert compare(payment.actual_date, payment.expected_date)
+    
+    def test_payment_has_mark_as_received(self):
+        """Test that mark_as_received is kept on the class for documentation"""
+        assert callable(getattr(Payment, "mark_as_received", None))
     
     def test_payment_mark_as_received_documentation(self):
         """Test that mark_as_received method exists for documentation"""
         payment = Payment(
             garage_id="1",
-            amount=Decimal("3500.00"),
-            expected_date=date(2025, 1, 15)
+            amount=AMOUNT_3500,
+            expected_date=DATE_2025_01_15
         )
         
-        # Method should exist but not modify the immutable object
-        assert hasattr(payment, 'mark_as_received')
+        # Method should not modify the immutable object
         payment.mark_as_received(date(2025, 1, 16), "Test note")
         
         # Original object should remain unchanged
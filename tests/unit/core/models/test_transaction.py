@@ -2,26 +2,46 @@
 Unit tests for Transaction model
 """
 
+import re
 import pytest
+from dataclasses import replace
 from decimal import Decimal
 from datetime import date
 
 from src.core.models.transaction import Transaction
 
 
+AMOUNT_3500 = Decimal("3500.00")
+DATE_2025_01_15 = date(2025, 1, 15)
+
+# Validation messages, compiled once for pytest.raises(match=...)
+NON_POSITIVE_AMOUNT_RE = re.compile("Transaction amount must be positive")
+EMPTY_CATEGORY_RE = re.compile("Transaction category cannot be empty")
+
+
+@pytest.fixture(scope="module")
+def txn_3500():
+    """Transfer of 3500.00 shared by read-only tests"""
+    return Transaction(
+        date=DATE_2025_01_15,
+        amount=AMOUNT_3500,
+        category="Transfer"
+    )
+
+
 class TestTransaction:
     """Test cases for Transaction model"""
     
     def test_transaction_creation_minimal(self):
         """Test creating transaction with minimal required data"""
         transaction = Transaction(
-            date=date(2025, 1, 15),
-            amount=Decimal("3500.00"),
+            date=DATE_2025_01_15,
+            amount=AMOUNT_3500,
             category="Transfer"
         )
         
-        assert transaction.date == date(2025, 1, 15)
-        assert transaction.amount == Decimal("3500.00")
+        assert transaction.date == DATE_2025_01_15
+        assert transaction.amount == AMOUNT_3500
         assert transaction.category == "Transfer"
         assert transaction.source == "bank_statement"
         assert transaction.description is None
@@ -29,217 +49,157 @@ class TestTransaction:
     def test_transaction_creation_complete(self):
         """Test creating transaction with all data"""
         transaction = Transaction(
-            date=date(2025, 1, 15),
-            amount=Decimal("3500.00"),
+            date=DATE_2025_01_15,
+            amount=AMOUNT_3500,
             category="Перевод СБП",
             source="sberbank_statement_row_45",
             description="Payment from mobile app"
         )
         
-        assert transaction.date == date(2025, 1, 15)
-        assert transaction.amount == Decimal("3500.00")
+        assert transaction.date == DATE_2025_01_15
+        assert transaction.amount == AMOUNT_3500
         assert transaction.category == "Перевод СБП"
         assert transaction.source == "sberbank_statement_row_45"
         assert transaction.description == "Payment from mobile app"
     
     def test_transaction_validation_negative_amount(self):
         """Test validation with negative amount"""
-        with pytest.raises(ValueError, match="Transaction amount must be positive"):
+        with pytest.raises(ValueError, match=NON_POSITIVE_AMOUNT_RE):
             Transaction(
-                date=date(2025, 1, 15),
+                date=DATE_2025_01_15,
                 amount=Decimal("-100.00"),
                 category="Transfer"
             )
     
     def test_transaction_validation_zero_amount(self):
         """Test validation with zero amount"""
-        with pytest.raises(ValueError, match="Transaction amount must be positive"):
+        with pytest.raises(ValueError, match=NON_POSITIVE_AMOUNT_RE):
             Transaction(
-                date=date(2025, 1, 15),
+                date=DATE_2025_01_15,
                 amount=Decimal("0.00"),
                 category="Transfer"
             )
     
     def test_transaction_validation_empty_category(self):
         """Test validation with empty category"""
-        with pytest.raises(ValueError, match="Transaction category cannot be empty"):
+        with pytest.raises(ValueError, match=EMPTY_CATEGORY_RE):
             Transaction(
-                date=date(2025, 1, 15),
-                amount=Decimal("3500.00"),
+                date=DATE_2025_01_15,
+                amount=AMOUNT_3500,
                 category=""
             )
     
-    def test_transaction_is_incoming_property(self):
+    def test_transaction_is_incoming_property(self, txn_3500):
         """Test is_incoming property"""
-        transaction = Transaction(
-            date=date(2025, 1, 15),
-            amount=Decimal("3500.00"),
-            category="Transfer"
-        )
-        
         # All valid transactions should be incoming (positive amounts)
-        assert transaction.is_incoming is True
+        assert txn_3500.is_incoming is True
     
-    def test_transaction_matches_amount_exact(self):
-        """Test exact amount matching"""
-        transaction = Transaction(
-            date=date(2025, 1, 15),
-            amount=Decimal("3500.00"),
-            category="Transfer"
-        )
-        
+    @pytest.mark.parametrize("candidate,tolerance,expected", [
         # Exact match
-        assert transaction.matches_amount(Decimal("3500.00")) is True
-        
-        # No match
-        assert transaction.matches_amount(Decimal("3600.00")) is False
-    
-    def test_transaction_matches_amount_with_tolerance(self):
-        """Test amount matching with tolerance"""
-        transaction = Transaction(
-            date=date(2025, 1, 15),
-            amount=Decimal("3500.00"),
-            category="Transfer"
-        )
-        
-        tolerance = Decimal("0.10")
-        
-        # Within tolerance
-        assert transaction.matches_amount(Decimal("3500.05"), tolerance) is True
-        assert transaction.matches_amount(Decimal("3499.95"), tolerance) is True
-        
-        # Outside tolerance
-        assert transaction.matches_amount(Decimal("3500.15"), tolerance) is False
-        assert transaction.matches_amount(Decimal("3499.85"), tolerance) is False
-    
-    def test_transaction_matches_amount_default_tolerance(self):
-        """Test amount matching with default tolerance"""
-        transaction = Transaction(
-            date=date(2025, 1, 15),
-            amount=Decimal("3500.00"),
-            category="Transfer"
-        )
-        
+        pytest.param(AMOUNT_3500, None, True, id="exact"),
+        pytest.param(Decimal("3600.00"), None, False, id="different"),
         # Default tolerance is 0.01
-        assert transaction.matches_amount(Decimal("3500.01")) is True
-        assert transaction.matches_amount(Decimal("3499.99")) is True
-        assert transaction.matches_amount(Decimal("3500.02")) is False
-        assert transaction.matches_amount(Decimal("3499.98")) is False
-    
-    def test_transaction_string_representation(self):
+        pytest.param(Decimal("3500.01"), None, True, id="default_tolerance_above"),
+        pytest.param(Decimal("3499.99"), None, True, id="default_tolerance_below"),
+        pytest.param(Decimal("3500.02"), None, False, id="outside_default_tolerance_above"),
+        pytest.param(Decimal("3499.98"), None, False, id="outside_default_tolerance_below"),
+        # Explicit tolerance
+        pytest.param(Decimal("3500.05"), Decimal("0.10"), True, id="tolerance_above"),
+        pytest.param(Decimal("3499.95"), Decimal("0.10"), True, id="tolerance_below"),
+        pytest.param(Decimal("3500.15"), Decimal("0.10"), False, id="outside_tolerance_above"),
+        pytest.param(Decimal("3499.85"), Decimal("0.10"), False, id="outside_tolerance_below"),
+    ])
+    def test_transaction_matches_amount(self, txn_3500, candidate, tolerance, expected):
+        """Test amount matching with default and explicit tolerance"""
+        if tolerance is None:
+            assert txn_3500.matches_amount(candidate) is expected
+        else:
+            assert txn_3500.matches_amount(candidate, tolerance) is expected
+    
+    def test_transaction_string_representation(self, txn_3500):
         """Test string representation"""
-        transaction = Transaction(
-            date=date(2025, 1, 15),
-            amount=Decimal("3500.00"),
-            category="Transfer"
-        )
-        
-        str_repr = str(transaction)
+        str_repr = str(txn_3500)
         assert "Transaction(" in str_repr
         assert "date=2025-01-15" in str_repr
         assert "amount=3500.00" in str_repr
         assert "category=Transfer" in str_repr
     
-    def test_transaction_immutability(self):
+    def test_transaction_immutability(self, txn_3500):
         """Test that transaction is immutable (frozen dataclass)"""
-        transaction = Transaction(
-            date=date(2025, 1, 15),
-            amount=Decimal("3500.00"),
-            category="Transfer"
-        )
-        
         with pytest.raises(AttributeError):
-            transaction.amount = Decimal("4000")
+            txn_3500.amount = Decimal("4000")
         
         with pytest.raises(AttributeError):
-            transaction.category = "New Category"
+            txn_3500.category = "New Category"
     
     def test_transaction_equality(self):
         """Test transaction equality comparison"""
         transaction1 = Transaction(
-            date=date(2025, 1, 15),
-            amount=Decimal("3500.00"),
+            date=DATE_2025_01_15,
+            amount=AMOUNT_3500,
             category="Transfer"
         )
         
         transaction2 = Transaction(
-            date=date(2025, 1, 15),
-            amount=Decimal("3500.00"),
+            date=DATE_2025_01_15,
+            amount=AMOUNT_3500,
             category="Transfer"
         )
         
         transaction3 = Transaction(
             date=date(2025, 1, 16),
-            amount=Decimal("3500.00"),
+            amount=AMOUNT_3500,
             category="Transfer"
         )
         
         assert transaction1 == transaction2
         assert transaction1 != transaction3
     
-    def test_transaction_different_categories(self):
-        """Test transactions with different categories"""
-        categories = [
+    @pytest.mark.parametrize("field_name,value", [
+        *[("category", category) for category in [
             "Перевод на карту",
             "Перевод СБП",
             "Transfer",
             "Mobile payment",
             "Online transfer"
-        ]
-        
-        for category in categories:
-            transaction = Transaction(
-                date=date(2025, 1, 15),
-                amount=Decimal("3500.00"),
-                category=category
-            )
-            assert transaction.category == category
-    
-    def test_transaction_different_sources(self):
-        """Test transactions with different sources"""
-        sources = [
+        ]],
+        *[("source", source) for source in [
             "bank_statement",
             "sberbank_statement_row_1",
             "manual_entry",
             "api_import",
             "csv_import"
-        ]
-        
-        for source in sources:
-            transaction = Transaction(
-                date=date(2025, 1, 15),
-                amount=Decimal("3500.00"),
-                category="Transfer",
-                source=source
-            )
-            assert transaction.source == source
+        ]],
+        *[("description", desc) for desc in [
+            None,
+            "",
+            "Simple payment",
+            "Платеж за аренду гаража №5",
+            "Payment with special characters: №1, 50% fee"
+        ]],
+    ])
+    def test_transaction_field_roundtrip(self, txn_3500, field_name, value):
+        """Test transaction keeps category, source and description values it was created with"""
+        transaction = replace(txn_3500, **{field_name: value})
+        assert getattr(transaction, field_name) == value
     
     def test_transaction_high_precision_amount(self):
         """Test transaction with high precision amount"""
         transaction = Transaction(
-            date=date(2025, 1, 15),
+            date=DATE_2025_01_15,
             amount=Decimal("3599.99"),
             category="Transfer"
         )
         
         assert transaction.amount == Decimal("3599.99")
         assert transaction.matches_amount(Decimal("3599.99")) is True
+        assert transaction.amount_cents == 359999
     
-    def test_transaction_with_description_variations(self):
-        """Test transaction with various descriptions"""
-        descriptions = [
-            None,
-            "",
-            "Simple payment",
-            "Платеж за аренду гаража №5",
-            "Payment with special characters: №1, 50% fee"
-        ]
+    def test_transaction_amount_cents_not_part_of_identity(self):
+        """Test derived kopeck amount does not affect repr or equality"""
+        transaction1 = Transaction(DATE_2025_01_15, Decimal("3500"), "Transfer")
+        transaction2 = Transaction(DATE_2025_01_15, AMOUNT_3500, "Transfer")
         
-        for desc in descriptions:
-            transaction = Transaction(
-                date=date(2025, 1, 15),
-                amount=Decimal("3500.00"),
-                category="Transfer",
-                description=desc
-            )
-            assert transaction.description == desc
+        assert transaction1.amount_cents == transaction2.amount_cents == 350000
+        assert transaction1 == transaction2
+        assert "amount_cents" not in repr(transaction1)
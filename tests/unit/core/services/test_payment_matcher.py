@@ -12,15 +12,20 @@ from src.core.models.transaction import Transaction
 from src.core.models.payment import PaymentStatus
 
 
+def by_id(payments):
+    """Index payments by garage id for lookups in assertions"""
+    return {p.garage_id: p for p in payments}
+
+
 class TestPaymentMatcher:
     """Test cases for PaymentMatcher service"""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def payment_matcher(self):
-        """Create PaymentMatcher instance for testing"""
+        """Create PaymentMatcher instance shared by the module (tests only call its methods)"""
         return PaymentMatcher(search_window_days=7, grace_period_days=3)
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_garages(self):
         """Create sample garages for testing"""
         return [
@@ -29,7 +34,7 @@ class TestPaymentMatcher:
             Garage("3", Decimal("4200.00"), date(2025, 1, 3), 17),
         ]
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_transactions(self):
         """Create sample transactions for testing"""
         return [
@@ -51,7 +56,7 @@ class TestPaymentMatcher:
         assert len(received_payments) == 3
         
         # Check specific matches
-        garage1_payment = next(p for p in payments if p.garage_id == "1")
+        garage1_payment = by_id(payments)["1"]
         assert garage1_payment.actual_date == date(2025, 1, 15)
         assert garage1_payment.amount == Decimal("3500.00")
     
@@ -105,7 +110,7 @@ class TestPaymentMatcher:
         analysis_date = date(2025, 1, 20)
         payments = payment_matcher.match_payments(sample_garages, transactions, analysis_date)
         
-        garage1_payment = next(p for p in payments if p.garage_id == "1")
+        garage1_payment = by_id(payments)["1"]
         assert garage1_payment.status == PaymentStatus.OVERDUE
         assert garage1_payment.actual_date is None
     
@@ -177,6 +182,19 @@ class TestPaymentMatcher:
         not_due_count = sum(1 for p in payments if p.status == PaymentStatus.NOT_DUE)
         assert not_due_count == 3
     
+    def test_match_payments_arrays_columns(self, payment_matcher, sample_garages, sample_transactions):
+        """Test column-wise results hold the matched values for every garage"""
+        analysis_date = date(2025, 1, 20)
+        
+        columns = payment_matcher.match_payments_arrays(sample_garages, sample_transactions, analysis_date)
+        
+        assert columns["garage_id"] == ["1", "2", "3"]
+        assert columns["status"] == [PaymentStatus.RECEIVED] * 3
+        assert columns["expected_date"] == [date(2025, 1, 15), date(2025, 1, 16), date(2025, 1, 17)]
+        assert columns["actual_date"] == [date(2025, 1, 15), date(2025, 1, 16), date(2025, 1, 18)]
+        # Garage 3 paid one day after its payment day
+        assert columns["days_overdue"] == [0, 0, 1]
+    
     def test_find_amount_conflicts(self, payment_matcher):
         """Test finding amount conflicts between garages"""
         garages = [
@@ -29,27 +29,23 @@ class TestLocalizationManager:
         assert manager.get("status.received") == "Получен"
         assert manager.get("status.overdue") == "Просрочен"
     
-    def test_get_message_with_formatting(self):
+    def test_get_message_with_formatting(self, ru_localization_manager):
         """Test getting message with format parameters"""
-        manager = LocalizationManager("ru")
-        
         # Test with parameters
-        result = manager.get("summary.total_garages", count=15)
+        result = ru_localization_manager.get("summary.total_garages", count=15)
         assert result == "Всего гаражей: 15"
         
-        result = manager.get("cli.report.generated", filename="test.xlsx")
+        result = ru_localization_manager.get("cli.report.generated", filename="test.xlsx")
         assert result == "Отчет создан: test.xlsx"
     
-    def test_get_message_fallback(self):
+    def test_get_message_fallback(self, localization_manager):
         """Test fallback behavior for missing keys"""
-        manager = LocalizationManager("en")
-        
         # Non-existent key should return the key itself
-        result = manager.get("non.existent.key")
+        result = localization_manager.get("non.existent.key")
         assert result == "non.existent.key"
         
         # With default value
-        result = manager.get("non.existent.key", default="Default Value")
+        result = localization_manager.get("non.existent.key", default="Default Value")
         assert result == "Default Value"
     
     def test_switch_language(self):
@@ -67,10 +63,22 @@ class TestLocalizationManager:
         assert manager.language == "en"
         assert manager.get("status.received") == "Received"
     
-    def test_get_available_languages(self):
-        """Test getting available languages"""
+    def test_switch_language_reuses_loaded_catalog(self):
+        """Test switching back to a language does not reload its message file"""
         manager = LocalizationManager("en")
-        languages = manager.get_available_languages()
+        english = manager.messages
+        manager.switch_language("ru")
+        
+        with patch('builtins.open') as mock_open:
+            manager.switch_language("en")
+            mock_open.assert_not_called()
+        
+        assert manager.messages is english
+        assert LocalizationManager("en").messages is english
+    
+    def test_get_available_languages(self, localization_manager):
+        """Test getting available languages"""
+        languages = localization_manager.get_available_languages()
         
         assert "en" in languages
         assert "ru" in languages
@@ -78,6 +86,9 @@ class TestLocalizationManager:
     
     def test_fallback_to_english_for_unsupported_language(self):
         """Test fallback to English for unsupported language"""
+        # Loaded catalogs would bypass the file existence check
+        LocalizationManager.clear_cache()
+        
         with patch('src.infrastructure.localization.i18n.Path.exists') as mock_exists:
             # Mock that the unsupported language file doesn't exist
             mock_exists.return_value = False
@@ -94,19 +105,15 @@ class TestLocalizationManager:
         assert len(manager.messages) > 0
         assert manager.get("status.received") == "Received"
     
-    def test_format_error_handling(self):
+    def test_format_error_handling(self, localization_manager):
         """Test error handling when message formatting fails"""
-        manager = LocalizationManager("en")
-        
         # Try to format a message that doesn't accept parameters
-        result = manager.get("status.received", invalid_param="test")
+        result = localization_manager.get("status.received", invalid_param="test")
         # Should return the unformatted message
         assert result == "Received"
     
-    def test_russian_specific_messages(self):
+    def test_russian_specific_messages(self, ru_localization_manager):
         """Test specific Russian translations"""
-        manager = LocalizationManager("ru")
-        
         # Test status translations
         status_tests = {
             "status.received": "Получен",
@@ -117,7 +124,7 @@ class TestLocalizationManager:
         }
         
         for key, expected in status_tests.items():
-            assert manager.get(key) == expected
+            assert ru_localization_manager.get(key) == expected
         
         # Test report headers
         header_tests = {
@@ -128,12 +135,10 @@ class TestLocalizationManager:
         }
         
         for key, expected in header_tests.items():
-            assert manager.get(key) == expected
+            assert ru_localization_manager.get(key) == expected
     
-    def test_cli_messages_in_russian(self):
+    def test_cli_messages_in_russian(self, ru_localization_manager):
         """Test CLI messages in Russian"""
-        manager = LocalizationManager("ru")
-        
         cli_tests = {
             "cli.process.start": "Обработка платежей...",
             "cli.process.complete": "Обработка завершена успешно",
@@ -141,14 +146,12 @@ class TestLocalizationManager:
         }
         
         for key, expected in cli_tests.items():
-            assert manager.get(key) == expected
+            assert ru_localization_manager.get(key) == expected
     
-    def test_summary_messages_with_formatting(self):
+    def test_summary_messages_with_formatting(self, ru_localization_manager):
         """Test summary messages with formatting in Russian"""
-        manager = LocalizationManager("ru")
-        
         # Test formatted summary messages
-        assert manager.get("summary.total_garages", count=10) == "Всего гаражей: 10"
-        assert manager.get("summary.received", count=5) == "Получено: 5"
-        assert manager.get("summary.collection_rate", rate="75.0%") == "Процент сбора: 75.0%"
-        assert manager.get("summary.expected_amount", amount="100000.00") == "Ожидаемая сумма: 100000.00 руб."
\ No newline at end of file
+        assert ru_localization_manager.get("summary.total_garages", count=10) == "Всего гаражей: 10"
+        assert ru_localization_manager.get("summary.received", count=5) == "Получено: 5"
+        assert ru_localization_manager.get("summary.collection_rate", rate="75.0%") == "Процент сбора: 75.0%"
+        assert ru_localization_manager.get("summary.expected_amount", amount="100000.00") == "Ожидаемая сумма: 100000.00 руб."
\ No newline at end of file
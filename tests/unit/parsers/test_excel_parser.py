@@ -3,21 +3,30 @@ Unit tests for ExcelGarageParser
 """
 
 import pytest
+import zipfile
+from collections import namedtuple
 from pathlib import Path
 from decimal import Decimal
 from datetime import date, datetime
 from unittest.mock import Mock, patch, MagicMock
 
-from src.parsers.file_parsers.excel_parser import ExcelGarageParser
+from openpyxl import Workbook
+
+from src.parsers.file_parsers.excel_parser import ExcelGarageParser, GarageRow, HEADER_SCAN_ROWS, _parse_date_str
 from src.core.exceptions import ParseError
+from src.utils.validation import DataValidator
+
+
+# Lightweight stand-in for an openpyxl cell, only .value is read by the parser
+Cell = namedtuple('Cell', ['value'])
 
 
 class TestExcelGarageParser:
     """Test cases for ExcelGarageParser"""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def excel_parser(self):
-        """Create ExcelGarageParser instance for testing"""
+        """Create ExcelGarageParser instance shared by the module (parser is stateless)"""
         return ExcelGarageParser()
     
     def test_get_supported_formats(self, excel_parser):
@@ -26,20 +35,20 @@ class TestExcelGarageParser:
         assert '.xlsx' in formats
         assert '.xls' in formats
     
-    @patch('src.parsers.file_parsers.excel_parser.load_workbook')
-    def test_validate_source_valid_file(self, mock_load_workbook, excel_parser):
+    def test_validate_source_valid_file(self, excel_parser, tmp_path):
         """Test source validation for valid Excel file"""
-        mock_workbook = Mock()
-        mock_load_workbook.return_value = mock_workbook
-        
-        test_file = Path("test.xlsx")
+        test_file = tmp_path / "test.xlsx"
+        Workbook().save(test_file)
         
-        with patch.object(test_file, 'exists', return_value=True):
-            with patch.object(test_file, 'suffix', '.xlsx'):
-                result = excel_parser.validate_source(test_file)
-                assert result is True
+        assert excel_parser.validate_source(test_file) is True
+    
+    def test_validate_source_zip_without_workbook(self, excel_parser, tmp_path):
+        """Test source validation for zip archive that is not a workbook"""
+        test_file = tmp_path / "archive.xlsx"
+        with zipfile.ZipFile(test_file, 'w') as archive:
+            archive.writestr('readme.txt', 'not a workbook')
         
-        mock_workbook.close.assert_called_once()
+        assert excel_parser.validate_source(test_file) is False
     
     def test_validate_source_nonexistent_file(self, excel_parser):
         """Test source validation for nonexistent file"""
@@ -55,25 +64,20 @@ class TestExcelGarageParser:
             result = excel_parser.validate_source(test_file)
             assert result is False
     
-    @patch('src.parsers.file_parsers.excel_parser.load_workbook')
-    def test_validate_source_corrupted_file(self, mock_load_workbook, excel_parser):
+    def test_validate_source_corrupted_file(self, excel_parser, tmp_path):
         """Test source validation for corrupted Excel file"""
-        mock_load_workbook.side_effect = Exception("Corrupted file")
-        
-        test_file = Path("corrupted.xlsx")
+        test_file = tmp_path / "corrupted.xlsx"
+        test_file.write_bytes(b"not a zip archive")
         
-        with patch.object(test_file, 'exists', return_value=True):
-            with patch.object(test_file, 'suffix', '.xlsx'):
-                result = excel_parser.validate_source(test_file)
-                assert result is False
+        assert excel_parser.validate_source(test_file) is False
     
     def test_is_header_row_valid_headers(self, excel_parser):
         """Test header row detection with valid headers"""
         # Mock row with Russian headers
         mock_row = [
-            Mock(value="Гараж"),
-            Mock(value="Сумма"),
-            Mock(value="Первоначальная дата")
+            Cell("Гараж"),
+            Cell("Сумма"),
+            Cell("Первоначальная дата")
         ]
         
         result = excel_parser._is_header_row(mock_row)
@@ -83,9 +87,9 @@ class TestExcelGarageParser:
         """Test header row detection with partial headers"""
         # Mock row with some headers
         mock_row = [
-            Mock(value="Номер гаража"),
-            Mock(value="Арендная плата"),
-            Mock(value="Другое")
+            Cell("Номер гаража"),
+            Cell("Арендная плата"),
+            Cell("Другое")
         ]
         
         result = excel_parser._is_header_row(mock_row)
@@ -94,9 +98,9 @@ class TestExcelGarageParser:
     def test_is_header_row_no_headers(self, excel_parser):
         """Test header row detection with no headers"""
         mock_row = [
-            Mock(value="1"),
-            Mock(value="3500.00"),
-            Mock(value="01.01.2025")
+            Cell("1"),
+            Cell("3500.00"),
+            Cell("01.01.2025")
         ]
         
         result = excel_parser._is_header_row(mock_row)
@@ -104,7 +108,7 @@ class TestExcelGarageParser:
     
     def test_is_header_row_insufficient_columns(self, excel_parser):
         """Test header row detection with insufficient columns"""
-        mock_row = [Mock(value="Гараж"), Mock(value="Сумма")]  # Only 2 columns
+        mock_row = [Cell("Гараж"), Cell("Сумма")]  # Only 2 columns
         
         result = excel_parser._is_header_row(mock_row)
         assert result is False
@@ -112,9 +116,9 @@ class TestExcelGarageParser:
     def test_parse_garage_row_valid_data(self, excel_parser):
         """Test parsing valid garage row"""
         mock_row = [
-            Mock(value="1"),
-            Mock(value=3500.0),
-            Mock(value=datetime(2025, 1, 15))
+            Cell("1"),
+            Cell(3500.0),
+            Cell(datetime(2025, 1, 15))
         ]
         
         garage_data = excel_parser._parse_garage_row(mock_row, 2)
@@ -125,12 +129,65 @@ class TestExcelGarageParser:
         assert garage_data['start_date'] == date(2025, 1, 15)
         assert garage_data['payment_day'] == 15
     
+    def test_parse_garage_row_returns_garage_row(self, excel_parser):
+        """Test parsed row is a GarageRow that still supports key access"""
+        garage_data = excel_parser._parse_garage_row([Cell("1"), Cell(3500.0), Cell(datetime(2025, 1, 15))], 2)
+        
+        assert garage_data == GarageRow(id="1", monthly_rent=Decimal("3500"), start_date=date(2025, 1, 15), payment_day=15)
+        assert garage_data['monthly_rent'] == garage_data.monthly_rent
+        with pytest.raises(KeyError):
+            garage_data['rent']
+    
+    def test_parse_garage_row_behaves_as_mapping(self, excel_parser):
+        """Test parsed row supports the read-only dict protocol"""
+        garage_data = excel_parser._parse_garage_row([Cell("1"), Cell(3500.0), Cell(datetime(2025, 1, 15))], 2)
+        
+        assert 'id' in garage_data
+        assert 'rent' not in garage_data
+        assert garage_data.get('rent') is None
+        
+        expected = {
+            'id': "1",
+            'monthly_rent': Decimal("3500"),
+            'start_date': date(2025, 1, 15),
+            'payment_day': 15,
+        }
+        assert dict(garage_data) == expected
+        assert garage_data == expected
+        assert expected == garage_data
+    
+    def test_parsed_row_passes_data_validator(self, excel_parser):
+        """Test parsed row is accepted by DataValidator like a dict row"""
+        garage_data = excel_parser._parse_garage_row([Cell("1"), Cell(3500.0), Cell(datetime(2025, 1, 15))], 2)
+        
+        validated = DataValidator.validate_garage_data(garage_data)
+        
+        assert validated == dict(garage_data)
+    
+    def test_parse_garage_row_plain_values(self, excel_parser):
+        """Test parsing row of plain values as produced by values_only iteration"""
+        garage_data = excel_parser._parse_garage_row(("1", 3500.0, datetime(2025, 1, 15)), 2)
+        
+        assert garage_data is not None
+        assert garage_data['id'] == "1"
+        assert garage_data['monthly_rent'] == Decimal("3500.0")
+        assert garage_data['payment_day'] == 15
+        assert excel_parser._is_header_row(("Гараж", "Сумма", "Дата")) is True
+    
+    def test_parse_garage_row_id_interned(self, excel_parser):
+        """Test rows with the same garage ID share one string"""
+        first = excel_parser._parse_garage_row([Cell(17), Cell(3500.0), Cell(datetime(2025, 1, 15))], 1)
+        second = excel_parser._parse_garage_row([Cell(17), Cell(3500.0), Cell(datetime(2025, 2, 15))], 2)
+        
+        assert first['id'] == "17"
+        assert first['id'] is second['id']
+    
     def test_parse_garage_row_string_amount(self, excel_parser):
         """Test parsing garage row with string amount"""
         mock_row = [
-            Mock(value="garage_2"),
-            Mock(value="2,800.50"),  # String with comma
-            Mock(value=datetime(2025, 2, 10))
+            Cell("garage_2"),
+            Cell("2,800.50"),  # String with comma
+            Cell(datetime(2025, 2, 10))
         ]
         
         garage_data = excel_parser._parse_garage_row(mock_row, 3)
@@ -143,9 +200,9 @@ class TestExcelGarageParser:
     def test_parse_garage_row_string_date(self, excel_parser):
         """Test parsing garage row with string date"""
         mock_row = [
-            Mock(value="3"),
-            Mock(value=4200.0),
-            Mock(value="15.03.2025")  # String date
+            Cell("3"),
+            Cell(4200.0),
+            Cell("15.03.2025")  # String date
         ]
         
         garage_data = excel_parser._parse_garage_row(mock_row, 4)
@@ -158,9 +215,9 @@ class TestExcelGarageParser:
     def test_parse_garage_row_missing_data(self, excel_parser):
         """Test parsing garage row with missing data"""
         mock_row = [
-            Mock(value="1"),
-            Mock(value=None),  # Missing amount
-            Mock(value=datetime(2025, 1, 15))
+            Cell("1"),
+            Cell(None),  # Missing amount
+            Cell(datetime(2025, 1, 15))
         ]
         
         garage_data = excel_parser._parse_garage_row(mock_row, 2)
@@ -169,9 +226,9 @@ class TestExcelGarageParser:
     def test_parse_garage_row_invalid_amount(self, excel_parser):
         """Test parsing garage row with invalid amount"""
         mock_row = [
-            Mock(value="1"),
-            Mock(value="invalid_amount"),
-            Mock(value=datetime(2025, 1, 15))
+            Cell("1"),
+            Cell("invalid_amount"),
+            Cell(datetime(2025, 1, 15))
         ]
         
         garage_data = excel_parser._parse_garage_row(mock_row, 2)
@@ -180,9 +237,9 @@ class TestExcelGarageParser:
     def test_parse_garage_row_negative_amount(self, excel_parser):
         """Test parsing garage row with negative amount"""
         mock_row = [
-            Mock(value="1"),
-            Mock(value=-3500.0),
-            Mock(value=datetime(2025, 1, 15))
+            Cell("1"),
+            Cell(-3500.0),
+            Cell(datetime(2025, 1, 15))
         ]
         
         garage_data = excel_parser._parse_garage_row(mock_row, 2)
@@ -191,9 +248,9 @@ class TestExcelGarageParser:
     def test_parse_garage_row_invalid_date(self, excel_parser):
         """Test parsing garage row with invalid date"""
         mock_row = [
-            Mock(value="1"),
-            Mock(value=3500.0),
-            Mock(value="invalid_date")
+            Cell("1"),
+            Cell(3500.0),
+            Cell("invalid_date")
         ]
         
         garage_data = excel_parser._parse_garage_row(mock_row, 2)
@@ -201,7 +258,7 @@ class TestExcelGarageParser:
     
     def test_parse_garage_row_insufficient_columns(self, excel_parser):
         """Test parsing garage row with insufficient columns"""
-        mock_row = [Mock(value="1"), Mock(value=3500.0)]  # Only 2 columns
+        mock_row = [Cell("1"), Cell(3500.0)]  # Only 2 columns
         
         garage_data = excel_parser._parse_garage_row(mock_row, 2)
         assert garage_data is None
@@ -218,22 +275,22 @@ class TestExcelGarageParser:
         # Mock rows with header and data
         mock_rows = [
             # Header row
-            [Mock(value="Гараж"), Mock(value="Сумма"), Mock(value="Дата")],
+            [Cell("Гараж"), Cell("Сумма"), Cell("Дата")],
             # Data rows
-            [Mock(value="1"), Mock(value=3500.0), Mock(value=datetime(2025, 1, 15))],
-            [Mock(value="2"), Mock(value=2800.0), Mock(value=datetime(2025, 1, 16))],
+            [Cell("1"), Cell(3500.0), Cell(datetime(2025, 1, 15))],
+            [Cell("2"), Cell(2800.0), Cell(datetime(2025, 1, 16))],
         ]
         mock_worksheet.iter_rows.return_value = mock_rows
         
         test_file = Path("test.xlsx")
         
-        with patch.object(excel_parser, 'validate_source', return_value=True):
-            garages = excel_parser.parse_garages(test_file)
+        garages = excel_parser.parse_garages(test_file)
         
         assert len(garages) == 2
         assert garages[0]['id'] == "1"
         assert garages[1]['id'] == "2"
         mock_workbook.close.assert_called_once()
+        assert mock_load_workbook.call_args.kwargs == {'read_only': True, 'data_only': True}
     
     @patch('src.parsers.file_parsers.excel_parser.load_workbook')
     def test_parse_garages_empty_rows(self, mock_load_workbook, excel_parser):
@@ -246,31 +303,73 @@ class TestExcelGarageParser:
         # Mock rows with empty rows
         mock_rows = [
             # Empty row
-            [Mock(value=None), Mock(value=None), Mock(value=None)],
+            [Cell(None), Cell(None), Cell(None)],
             # Header row
-            [Mock(value="Гараж"), Mock(value="Сумма"), Mock(value="Дата")],
+            [Cell("Гараж"), Cell("Сумма"), Cell("Дата")],
             # Empty row
-            [Mock(value=None), Mock(value=None), Mock(value=None)],
+            [Cell(None), Cell(None), Cell(None)],
             # Data row
-            [Mock(value="1"), Mock(value=3500.0), Mock(value=datetime(2025, 1, 15))],
+            [Cell("1"), Cell(3500.0), Cell(datetime(2025, 1, 15))],
         ]
         mock_worksheet.iter_rows.return_value = mock_rows
         
         test_file = Path("test.xlsx")
         
-        with patch.object(excel_parser, 'validate_source', return_value=True):
-            garages = excel_parser.parse_garages(test_file)
+        garages = excel_parser.parse_garages(test_file)
         
         assert len(garages) == 1
         assert garages[0]['id'] == "1"
     
-    def test_parse_garages_invalid_file(self, excel_parser):
+    @patch('src.parsers.file_parsers.excel_parser.load_workbook')
+    def test_parse_garages_header_scan_limited(self, mock_load_workbook, excel_parser):
+        """Test header detection stops after the first HEADER_SCAN_ROWS rows"""
+        mock_workbook = Mock()
+        mock_worksheet = Mock()
+        mock_workbook.active = mock_worksheet
+        mock_load_workbook.return_value = mock_workbook
+        
+        # Registry without header row
+        mock_worksheet.iter_rows.return_value = [
+            [Cell(str(i)), Cell(3500.0), Cell(datetime(2025, 1, 15))]
+            for i in range(1, HEADER_SCAN_ROWS + 11)
+        ]
+        
+        with patch.object(excel_parser, '_is_header_row', return_value=False) as is_header_row:
+            garages = excel_parser.parse_garages(Path("test.xlsx"))
+        
+        assert len(garages) == HEADER_SCAN_ROWS + 10
+        assert is_header_row.call_count == HEADER_SCAN_ROWS
+    
+    @patch('src.parsers.file_parsers.excel_parser.load_workbook')
+    def test_iter_garages_is_lazy(self, mock_load_workbook, excel_parser):
+        """Test garages are yielded while rows are still being read"""
+        mock_workbook = Mock()
+        mock_worksheet = Mock()
+        mock_workbook.active = mock_worksheet
+        mock_load_workbook.return_value = mock_workbook
+        
+        rows = iter([
+            [Cell("1"), Cell(3500.0), Cell(datetime(2025, 1, 15))],
+            [Cell("2"), Cell(4000.0), Cell(datetime(2025, 1, 20))],
+        ])
+        mock_worksheet.iter_rows.return_value = rows
+        
+        garages = excel_parser.iter_garages(Path("test.xlsx"))
+        
+        assert next(garages)['id'] == "1"
+        assert [row[0].value for row in rows] == ["2"]
+        
+        garages.close()
+        
+        mock_workbook.close.assert_called_once()
+    
+    def test_parse_garages_invalid_file(self, excel_parser, tmp_path):
         """Test garage parsing with invalid file"""
-        test_file = Path("invalid.xlsx")
+        test_file = tmp_path / "invalid.xlsx"
+        test_file.write_bytes(b"not a zip package")
         
-        with patch.object(excel_parser, 'validate_source', return_value=False):
-            with pytest.raises(ParseError, match="Invalid Excel file"):
-                excel_parser.parse_garages(test_file)
+        with pytest.raises(ParseError, match="Invalid Excel file format"):
+            excel_parser.parse_garages(test_file)
     
     @patch('src.parsers.file_parsers.excel_parser.load_workbook')
     def test_parse_garages_no_data(self, mock_load_workbook, excel_parser):
@@ -282,15 +381,14 @@ class TestExcelGarageParser:
         
         # Mock rows with only header
         mock_rows = [
-            [Mock(value="Гараж"), Mock(value="Сумма"), Mock(value="Дата")],
+            [Cell("Гараж"), Cell("Сумма"), Cell("Дата")],
         ]
         mock_worksheet.iter_rows.return_value = mock_rows
         
         test_file = Path("test.xlsx")
         
-        with patch.object(excel_parser, 'validate_source', return_value=True):
-            with pytest.raises(ParseError, match="No valid garage data found"):
-                excel_parser.parse_garages(test_file)
+        with pytest.raises(ParseError, match="No valid garage data found"):
+            excel_parser.parse_garages(test_file)
     
     @patch('src.parsers.file_parsers.excel_parser.load_workbook')
     def test_parse_garages_workbook_error(self, mock_load_workbook, excel_parser):
@@ -300,49 +398,53 @@ class TestExcelGarageParser:
         
         test_file = Path("test.xlsx")
         
-        with patch.object(excel_parser, 'validate_source', return_value=True):
-            with pytest.raises(ParseError, match="Invalid Excel file format"):
-                excel_parser.parse_garages(test_file)
+        with pytest.raises(ParseError, match="Invalid Excel file format"):
+            excel_parser.parse_garages(test_file)
     
-    def test_parse_garage_row_various_date_formats(self, excel_parser):
+    @pytest.mark.parametrize("date_str, expected_date", [
+        pytest.param("15.01.2025", date(2025, 1, 15), id="dotted"),
+        pytest.param("15/01/2025", date(2025, 1, 15), id="slashed"),
+        pytest.param("2025-01-15", date(2025, 1, 15), id="iso"),
+        pytest.param("15-01-2025", date(2025, 1, 15), id="dashed"),
+    ])
+    def test_parse_garage_row_various_date_formats(self, excel_parser, date_str, expected_date):
         """Test parsing garage row with various date formats"""
-        date_test_cases = [
-            ("15.01.2025", date(2025, 1, 15)),
-            ("15/01/2025", date(2025, 1, 15)),
-            ("2025-01-15", date(2025, 1, 15)),
-            ("15-01-2025", date(2025, 1, 15)),
+        mock_row = [
+            Cell("1"),
+            Cell(3500.0),
+            Cell(date_str)
         ]
         
-        for date_str, expected_date in date_test_cases:
-            mock_row = [
-                Mock(value="1"),
-                Mock(value=3500.0),
-                Mock(value=date_str)
-            ]
-            
-            garage_data = excel_parser._parse_garage_row(mock_row, 1)
-            
-            assert garage_data is not None, f"Failed to parse date: {date_str}"
-            assert garage_data['start_date'] == expected_date
-            assert garage_data['payment_day'] == expected_date.day
-    
-    def test_parse_garage_row_edge_case_amounts(self, excel_parser):
+        garage_data = excel_parser._parse_garage_row(mock_row, 1)
+        
+        assert garage_data is not None, f"Failed to parse date: {date_str}"
+        assert garage_data['start_date'] == expected_date
+        assert garage_data['payment_day'] == expected_date.day
+    
+    def test_parse_date_str_cached(self):
+        """Test repeated date strings are parsed once"""
+        _parse_date_str.cache_clear()
+        
+        assert _parse_date_str("15.01.2025") == date(2025, 1, 15)
+        assert _parse_date_str("15.01.2025") == date(2025, 1, 15)
+        assert _parse_date_str.cache_info().hits > 0
+    
+    @pytest.mark.parametrize("amount_input, expected_amount", [
+        pytest.param(0.01, Decimal("0.01"), id="one_kopeck"),
+        pytest.param(999999.99, Decimal("999999.99"), id="large"),
+        pytest.param(0.1 + 0.2, Decimal("0.30"), id="float_noise"),
+        pytest.param("1,234.56", Decimal("1234.56"), id="thousands_separator"),
+        pytest.param("5000,00", Decimal("5000.00"), id="european"),
+    ])
+    def test_parse_garage_row_edge_case_amounts(self, excel_parser, amount_input, expected_amount):
         """Test parsing garage row with edge case amounts"""
-        amount_test_cases = [
-            (0.01, Decimal("0.01")),
-            (999999.99, Decimal("999999.99")),
-            ("1,234.56", Decimal("1234.56")),
-            ("5000,00", Decimal("5000.00")),  # European format
+        mock_row = [
+            Cell("1"),
+            Cell(amount_input),
+            Cell(datetime(2025, 1, 15))
         ]
         
-        for amount_input, expected_amount in amount_test_cases:
-            mock_row = [
-                Mock(value="1"),
-                Mock(value=amount_input),
-                Mock(value=datetime(2025, 1, 15))
-            ]
-            
-            garage_data = excel_parser._parse_garage_row(mock_row, 1)
-            
-            assert garage_data is not None, f"Failed to parse amount: {amount_input}"
-            assert garage_data['monthly_rent'] == expected_amount
+        garage_data = excel_parser._parse_garage_row(mock_row, 1)
+        
+        assert garage_data is not None, f"Failed to parse amount: {amount_input}"
+        assert garage_data['monthly_rent'] == expected_amount
@@ -3,15 +3,22 @@ Unit tests for SberbankStatementParser
 """
 
 import pytest
+from collections import namedtuple
 from pathlib import Path
 from decimal import Decimal
 from datetime import date, datetime
 from unittest.mock import Mock, patch
 
-from src.parsers.file_parsers.sberbank_parser import SberbankStatementParser
+from src.parsers.file_parsers.sberbank_parser import (
+    AMOUNT_PATTERN, DATE_PATTERN, VALIDATION_SCAN_ROWS, SberbankStatementParser
+)
 from src.core.exceptions import ParseError
 
 
+# Worksheet cell stand-in, the parser reads nothing but .value
+Cell = namedtuple('Cell', ['value'])
+
+
 class TestSberbankStatementParser:
     """Test cases for SberbankStatementParser"""
     
@@ -25,12 +32,13 @@ class TestSberbankStatementParser:
         formats = sberbank_parser.get_supported_formats()
         assert '.xlsx' in formats
         assert '.xls' in formats
+        assert isinstance(formats, frozenset)
     
     def test_extract_date_from_datetime_cell(self, sberbank_parser):
         """Test date extraction from datetime cell"""
         mock_row = [
-            Mock(value=datetime(2025, 1, 15, 14, 30)),
-            Mock(value=None)
+            Cell(datetime(2025, 1, 15, 14, 30)),
+            Cell(None)
         ]
         
         extracted_date = sberbank_parser._extract_date(mock_row)
@@ -39,8 +47,8 @@ class TestSberbankStatementParser:
     def test_extract_date_from_string_cell(self, sberbank_parser):
         """Test date extraction from string cell"""
         mock_row = [
-            Mock(value="15.01.2025 14:30"),
-            Mock(value=None)
+            Cell("15.01.2025 14:30"),
+            Cell(None)
         ]
         
         extracted_date = sberbank_parser._extract_date(mock_row)
@@ -49,9 +57,9 @@ class TestSberbankStatementParser:
     def test_extract_date_from_multiple_columns(self, sberbank_parser):
         """Test date extraction from multiple columns"""
         mock_row = [
-            Mock(value=None),
-            Mock(value="15.01.2025"),
-            Mock(value=None)
+            Cell(None),
+            Cell("15.01.2025"),
+            Cell(None)
         ]
         
         extracted_date = sberbank_parser._extract_date(mock_row)
@@ -60,9 +68,9 @@ class TestSberbankStatementParser:
     def test_extract_date_no_date_found(self, sberbank_parser):
         """Test date extraction when no date found"""
         mock_row = [
-            Mock(value="Some text"),
-            Mock(value=123.45),
-            Mock(value=None)
+            Cell("Some text"),
+            Cell(123.45),
+            Cell(None)
         ]
         
         extracted_date = sberbank_parser._extract_date(mock_row)
@@ -71,11 +79,11 @@ class TestSberbankStatementParser:
     def test_extract_amount_standard_format(self, sberbank_parser):
         """Test amount extraction from standard format"""
         mock_row = [
-            Mock(value="15.01.2025"),
-            Mock(value=None),
-            Mock(value=None),
-            Mock(value="Перевод"),
-            Mock(value="+3 500,00")
+            Cell("15.01.2025"),
+            Cell(None),
+            Cell(None),
+            Cell("Перевод"),
+            Cell("+3 500,00")
         ]
         
         extracted_amount = sberbank_parser._extract_amount(mock_row)
@@ -84,11 +92,11 @@ class TestSberbankStatementParser:
     def test_extract_amount_with_spaces(self, sberbank_parser):
         """Test amount extraction with spaces"""
         mock_row = [
-            Mock(value=None),
-            Mock(value=None),
-            Mock(value=None),
-            Mock(value=None),
-            Mock(value="+ 2 800,50")
+            Cell(None),
+            Cell(None),
+            Cell(None),
+            Cell(None),
+            Cell("+ 2 800,50")
         ]
         
         extracted_amount = sberbank_parser._extract_amount(mock_row)
@@ -97,11 +105,11 @@ class TestSberbankStatementParser:
     def test_extract_amount_simple_format(self, sberbank_parser):
         """Test amount extraction from simple format"""
         mock_row = [
-            Mock(value=None),
-            Mock(value=None),
-            Mock(value="+4200.00"),
-            Mock(value=None),
-            Mock(value=None)
+            Cell(None),
+            Cell(None),
+            Cell("+4200.00"),
+            Cell(None),
+            Cell(None)
         ]
         
         extracted_amount = sberbank_parser._extract_amount(mock_row)
@@ -110,11 +118,11 @@ class TestSberbankStatementParser:
     def test_extract_amount_no_plus_sign(self, sberbank_parser):
         """Test amount extraction without plus sign (should return None)"""
         mock_row = [
-            Mock(value="15.01.2025"),
-            Mock(value=None),
-            Mock(value=None),
-            Mock(value="Перевод"),
-            Mock(value="3500,00")  # No plus sign
+            Cell("15.01.2025"),
+            Cell(None),
+            Cell(None),
+            Cell("Перевод"),
+            Cell("3500,00")  # No plus sign
         ]
         
         extracted_amount = sberbank_parser._extract_amount(mock_row)
@@ -123,11 +131,11 @@ class TestSberbankStatementParser:
     def test_extract_amount_no_amount_found(self, sberbank_parser):
         """Test amount extraction when no amount found"""
         mock_row = [
-            Mock(value="15.01.2025"),
-            Mock(value="Text"),
-            Mock(value="More text"),
-            Mock(value="Category"),
-            Mock(value="No amount here")
+            Cell("15.01.2025"),
+            Cell("Text"),
+            Cell("More text"),
+            Cell("Category"),
+            Cell("No amount here")
         ]
         
         extracted_amount = sberbank_parser._extract_amount(mock_row)
@@ -136,11 +144,11 @@ class TestSberbankStatementParser:
     def test_extract_category_standard(self, sberbank_parser):
         """Test category extraction"""
         mock_row = [
-            Mock(value="15.01.2025"),
-            Mock(value=None),
-            Mock(value=None),
-            Mock(value="Перевод СБП"),
-            Mock(value="+3500,00")
+            Cell("15.01.2025"),
+            Cell(None),
+            Cell(None),
+            Cell("Перевод СБП"),
+            Cell("+3500,00")
         ]
         
         extracted_category = sberbank_parser._extract_category(mock_row)
@@ -149,11 +157,11 @@ class TestSberbankStatementParser:
     def test_extract_category_from_different_column(self, sberbank_parser):
         """Test category extraction from different column"""
         mock_row = [
-            Mock(value="15.01.2025"),
-            Mock(value="Перевод на карту"),
-            Mock(value=None),
-            Mock(value="Other text"),
-            Mock(value="+3500,00")
+            Cell("15.01.2025"),
+            Cell("Перевод на карту"),
+            Cell(None),
+            Cell("Other text"),
+            Cell("+3500,00")
         ]
         
         extracted_category = sberbank_parser._extract_category(mock_row)
@@ -162,16 +170,38 @@ class TestSberbankStatementParser:
     def test_extract_category_no_keywords(self, sberbank_parser):
         """Test category extraction with no transfer keywords"""
         mock_row = [
-            Mock(value="15.01.2025"),
-            Mock(value="Some text"),
-            Mock(value="Other text"),
-            Mock(value="Random category"),
-            Mock(value="+3500,00")
+            Cell("15.01.2025"),
+            Cell("Some text"),
+            Cell("Other text"),
+            Cell("Random category"),
+            Cell("+3500,00")
         ]
         
         extracted_category = sberbank_parser._extract_category(mock_row)
         assert extracted_category == "Unknown Transfer"
     
+    def test_scan_row_matches_separate_extractors(self, sberbank_parser):
+        """Test single-pass row scan finds the same fields as the extractors"""
+        mock_row = [
+            Cell("15.01.2025 14:30"),
+            Cell(None),
+            Cell(None),
+            Cell("Перевод СБП"),
+            Cell("+3 500,00")
+        ]
+        
+        assert sberbank_parser._scan_row(mock_row) == (
+            sberbank_parser._extract_date(mock_row),
+            sberbank_parser._extract_amount(mock_row),
+            sberbank_parser._extract_category(mock_row),
+        ) == (date(2025, 1, 15), Decimal("3500.00"), "Перевод СБП")
+    
+    def test_scan_row_without_transfer_keyword(self, sberbank_parser):
+        """Test row scan leaves category empty when no keyword is present"""
+        mock_row = [Cell("15.01.2025"), Cell("Оплата услуг"), Cell("+3500,00")]
+        
+        assert sberbank_parser._scan_row(mock_row) == (date(2025, 1, 15), Decimal("3500.00"), None)
+    
     def test_is_transfer_category_valid_keywords(self, sberbank_parser):
         """Test transfer category validation with valid keywords"""
         valid_categories = [
@@ -181,8 +211,8 @@ class TestSberbankStatementParser:
             "Mobile transfer"
         ]
         
-        for category in valid_categories:
-            assert sberbank_parser._is_transfer_category(category) is True
+        results = {category: sberbank_parser._is_transfer_category(category) for category in valid_categories}
+        assert results == dict.fromkeys(valid_categories, True)
     
     def test_is_transfer_category_invalid_keywords(self, sberbank_parser):
         """Test transfer category validation with invalid keywords"""
@@ -195,17 +225,17 @@ class TestSberbankStatementParser:
             ""
         ]
         
-        for category in invalid_categories:
-            assert sberbank_parser._is_transfer_category(category) is False
+        results = {category: sberbank_parser._is_transfer_category(category) for category in invalid_categories}
+        assert results == dict.fromkeys(invalid_categories, False)
     
     def test_parse_transaction_row_valid(self, sberbank_parser):
         """Test parsing valid transaction row"""
         mock_row = [
-            Mock(value="15.01.2025 14:30"),
-            Mock(value="14:30"),
-            Mock(value=None),
-            Mock(value="Перевод СБП"),
-            Mock(value="+3 500,00")
+            Cell("15.01.2025 14:30"),
+            Cell("14:30"),
+            Cell(None),
+            Cell("Перевод СБП"),
+            Cell("+3 500,00")
         ]
         
         transaction = sberbank_parser._parse_transaction_row(mock_row, 5)
@@ -216,14 +246,41 @@ class TestSberbankStatementParser:
         assert transaction.category == "Перевод СБП"
         assert "row_5" in transaction.source
     
+    def test_parse_transaction_row_plain_values(self, sberbank_parser):
+        """Test parsing row given as plain values (iter_rows values_only)"""
+        row = ("15.01.2025 14:30", "14:30", None, "Перевод СБП", "+3 500,00")
+        
+        transaction = sberbank_parser._parse_transaction_row(row, 5)
+        
+        assert transaction is not None
+        assert (transaction.date, transaction.amount, transaction.category) == (
+            date(2025, 1, 15), Decimal("3500.00"), "Перевод СБП"
+        )
+    
+    def test_parse_transaction_row_repeated_category(self, sberbank_parser):
+        """Test repeated category text is classified the same on every row"""
+        rows = [
+            ("15.01.2025 14:30", None, None, "Перевод СБП", "+3 500,00"),
+            ("16.01.2025 10:05", None, None, "ПЕРЕВОД СБП", "+2 800,00"),
+            ("17.01.2025 11:00", None, None, "Перевод СБП", "+1 200,00"),
+        ]
+        
+        transactions = [sberbank_parser._parse_transaction_row(row, row_num) for row_num, row in enumerate(rows, 1)]
+        
+        assert [(transaction.category, transaction.amount) for transaction in transactions] == [
+            ("Перевод СБП", Decimal("3500.00")),
+            ("ПЕРЕВОД СБП", Decimal("2800.00")),
+            ("Перевод СБП", Decimal("1200.00")),
+        ]
+    
     def test_parse_transaction_row_missing_date(self, sberbank_parser):
         """Test parsing transaction row with missing date"""
         mock_row = [
-            Mock(value=None),
-            Mock(value=None),
-            Mock(value=None),
-            Mock(value="Перевод СБП"),
-            Mock(value="+3500,00")
+            Cell(None),
+            Cell(None),
+            Cell(None),
+            Cell("Перевод СБП"),
+            Cell("+3500,00")
         ]
         
         transaction = sberbank_parser._parse_transaction_row(mock_row, 5)
@@ -232,11 +289,11 @@ class TestSberbankStatementParser:
     def test_parse_transaction_row_missing_amount(self, sberbank_parser):
         """Test parsing transaction row with missing amount"""
         mock_row = [
-            Mock(value="15.01.2025"),
-            Mock(value=None),
-            Mock(value=None),
-            Mock(value="Перевод СБП"),
-            Mock(value="No amount")
+            Cell("15.01.2025"),
+            Cell(None),
+            Cell(None),
+            Cell("Перевод СБП"),
+            Cell("No amount")
         ]
         
         transaction = sberbank_parser._parse_transaction_row(mock_row, 5)
@@ -245,11 +302,11 @@ class TestSberbankStatementParser:
     def test_parse_transaction_row_negative_amount(self, sberbank_parser):
         """Test parsing transaction row with negative amount (outgoing)"""
         mock_row = [
-            Mock(value="15.01.2025"),
-            Mock(value=None),
-            Mock(value=None),
-            Mock(value="Перевод СБП"),
-            Mock(value="-3500,00")  # Negative amount
+            Cell("15.01.2025"),
+            Cell(None),
+            Cell(None),
+            Cell("Перевод СБП"),
+            Cell("-3500,00")  # Negative amount
         ]
         
         # This should return None because we only want incoming transactions
@@ -259,11 +316,11 @@ class TestSberbankStatementParser:
     def test_parse_transaction_row_invalid_category(self, sberbank_parser):
         """Test parsing transaction row with invalid category"""
         mock_row = [
-            Mock(value="15.01.2025"),
-            Mock(value=None),
-            Mock(value=None),
-            Mock(value="Покупка"),  # Not a transfer
-            Mock(value="+3500,00")
+            Cell("15.01.2025"),
+            Cell(None),
+            Cell(None),
+            Cell("Покупка"),  # Not a transfer
+            Cell("+3500,00")
         ]
         
         transaction = sberbank_parser._parse_transaction_row(mock_row, 5)
@@ -272,17 +329,17 @@ class TestSberbankStatementParser:
     def test_looks_like_sberbank_row_valid(self, sberbank_parser):
         """Test Sberbank row detection with valid patterns"""
         # Row with date pattern
-        mock_row = [Mock(value="15.01.2025 14:30"), Mock(value="Text")]
+        mock_row = [Cell("15.01.2025 14:30"), Cell("Text")]
         assert sberbank_parser._looks_like_sberbank_row(mock_row) is True
         
         # Row with amount pattern
-        mock_row = [Mock(value="Text"), Mock(value="+3500,00")]
+        mock_row = [Cell("Text"), Cell("+3500,00")]
         assert sberbank_parser._looks_like_sberbank_row(mock_row) is True
     
     def test_looks_like_sberbank_row_invalid(self, sberbank_parser):
         """Test Sberbank row detection with invalid patterns"""
         # Row without patterns
-        mock_row = [Mock(value="Random text"), Mock(value="More text")]
+        mock_row = [Cell("Random text"), Cell("More text")]
         assert sberbank_parser._looks_like_sberbank_row(mock_row) is False
         
         # Empty row
@@ -290,9 +347,65 @@ class TestSberbankStatementParser:
         assert sberbank_parser._looks_like_sberbank_row(mock_row) is False
         
         # Row with single cell
-        mock_row = [Mock(value="Text")]
+        mock_row = [Cell("Text")]
         assert sberbank_parser._looks_like_sberbank_row(mock_row) is False
     
+    def test_looks_like_sberbank_row_numeric_cells(self, sberbank_parser):
+        """Test numeric cells are not taken for signed statement amounts"""
+        mock_row = [Cell("Text"), Cell(1.5e+20)]
+        assert sberbank_parser._looks_like_sberbank_row(mock_row) is False
+    
+    def test_is_summary_row(self, sberbank_parser):
+        """Test detection of the statement summary line"""
+        mock_row = [Cell(None), Cell("Итого по операциям с 01.05.2025 по 12.06.2025")]
+        assert sberbank_parser._is_summary_row(mock_row) is True
+        
+        mock_row = [Cell("15.01.2025 14:30"), Cell("Перевод СБП"), Cell("+3500,00")]
+        assert sberbank_parser._is_summary_row(mock_row) is False
+    
+    def test_is_closing_summary_row(self, sberbank_parser):
+        """Test only the full period summary counts as the end of the statement"""
+        mock_row = [Cell(None), Cell("Итого по операциям с 01.05.2025 по 12.06.2025"), Cell("+6 300,50")]
+        assert sberbank_parser._is_closing_summary_row(mock_row) is True
+        
+        # Per-day and per-page subtotals are summary lines but do not close the statement
+        for subtotal in ("Итого за 15.01.2025", "Итого по странице"):
+            mock_row = [Cell(subtotal), Cell(None), Cell("+3 500,00")]
+            assert sberbank_parser._is_summary_row(mock_row) is True
+            assert sberbank_parser._is_closing_summary_row(mock_row) is False
+    
+    @pytest.mark.parametrize("subtotal", [
+        pytest.param("Итого по странице", id="page_subtotal"),
+        pytest.param("Итого за 15.01.2025", id="day_subtotal"),
+    ])
+    @pytest.mark.parametrize("collect", [
+        pytest.param(lambda parser, source: parser.parse_transactions(source), id="parse_transactions"),
+        pytest.param(lambda parser, source: list(parser.iter_transactions(source)), id="iter_transactions"),
+    ])
+    @patch('src.parsers.file_parsers.sberbank_parser.load_workbook')
+    def test_transactions_stop_at_closing_summary_only(self, mock_load_workbook, sberbank_parser, collect, subtotal):
+        """Test intermediate "Итого" subtotal does not end the statement, the closing summary does"""
+        mock_workbook = Mock()
+        mock_worksheet = Mock()
+        mock_workbook.active = mock_worksheet
+        mock_load_workbook.return_value = mock_workbook
+        
+        mock_worksheet.iter_rows.return_value = [
+            ("15.01.2025 14:30", "14:30", None, "Перевод СБП", "+3 500,00"),
+            (subtotal, None, None, None, "+3 500,00"),
+            ("16.01.2025 15:00", "15:00", None, "Перевод на карту", "+2 800,50"),
+            ("Итого по операциям с 15.01.2025 по 16.01.2025", None, None, None, "+6 300,50"),
+            ("17.01.2025 16:00", "16:00", None, "Перевод СБП", "+1 000,00"),
+        ]
+        
+        with patch.object(sberbank_parser, 'validate_source', return_value=True):
+            transactions = collect(sberbank_parser, Path("test.xlsx"))
+        
+        assert [(transaction.date, transaction.amount) for transaction in transactions] == [
+            (date(2025, 1, 15), Decimal("3500.00")),
+            (date(2025, 1, 16), Decimal("2800.50")),
+        ]
+    
     @patch('src.parsers.file_parsers.sberbank_parser.load_workbook')
     def test_validate_source_valid_sberbank_file(self, mock_load_workbook, sberbank_parser):
         """Test source validation for valid Sberbank file"""
@@ -303,8 +416,8 @@ class TestSberbankStatementParser:
         
         # Mock rows that look like Sberbank data
         mock_rows = [
-            [Mock(value="15.01.2025 14:30"), Mock(value="Text")],
-            [Mock(value="16.01.2025 15:00"), Mock(value="+3500,00")],
+            [Cell("15.01.2025 14:30"), Cell("Text")],
+            [Cell("16.01.2025 15:00"), Cell("+3500,00")],
         ]
         mock_worksheet.iter_rows.return_value = mock_rows
         
@@ -317,6 +430,27 @@ class TestSberbankStatementParser:
         
         mock_workbook.close.assert_called_once()
     
+    @patch('src.parsers.file_parsers.sberbank_parser.load_workbook')
+    def test_validate_source_stops_at_first_match(self, mock_load_workbook, sberbank_parser, tmp_path):
+        """Test validation reads a bounded number of rows and stops at the first statement row"""
+        mock_workbook = Mock()
+        mock_worksheet = Mock()
+        mock_workbook.active = mock_worksheet
+        mock_load_workbook.return_value = mock_workbook
+        
+        rows = iter([
+            ("15.01.2025 14:30", "Перевод СБП", "+3 500,00"),
+            ("16.01.2025 15:00", "Перевод СБП", "+2 800,00"),
+        ])
+        mock_worksheet.iter_rows.return_value = rows
+        
+        test_file = tmp_path / "statement.xlsx"
+        test_file.touch()
+        
+        assert sberbank_parser.validate_source(test_file) is True
+        assert mock_worksheet.iter_rows.call_args.kwargs['max_row'] == VALIDATION_SCAN_ROWS
+        assert len(list(rows)) == 1
+    
     @patch('src.parsers.file_parsers.sberbank_parser.load_workbook')
     def test_validate_source_non_sberbank_file(self, mock_load_workbook, sberbank_parser):
         """Test source validation for non-Sberbank Excel file"""
@@ -327,8 +461,8 @@ class TestSberbankStatementParser:
         
         # Mock rows that don't look like Sberbank data
         mock_rows = [
-            [Mock(value="Random text"), Mock(value="More text")],
-            [Mock(value="No patterns"), Mock(value="Here either")],
+            [Cell("Random text"), Cell("More text")],
+            [Cell("No patterns"), Cell("Here either")],
         ]
         mock_worksheet.iter_rows.return_value = mock_rows
         
@@ -351,12 +485,12 @@ class TestSberbankStatementParser:
         
         # Mock rows with valid transaction data
         mock_rows = [
-            [Mock(value="15.01.2025 14:30"), Mock(value="14:30"), Mock(value=None), 
-             Mock(value="Перевод СБП"), Mock(value="+3 500,00")],
-            [Mock(value="16.01.2025 15:00"), Mock(value="15:00"), Mock(value=None),
-             Mock(value="Перевод на карту"), Mock(value="+2 800,50")],
-            [Mock(value="17.01.2025 16:00"), Mock(value="16:00"), Mock(value=None),
-             Mock(value="Покупка"), Mock(value="-1000,00")],  # Outgoing - should be filtered
+            [Cell("15.01.2025 14:30"), Cell("14:30"), Cell(None), 
+             Cell("Перевод СБП"), Cell("+3 500,00")],
+            [Cell("16.01.2025 15:00"), Cell("15:00"), Cell(None),
+             Cell("Перевод на карту"), Cell("+2 800,50")],
+            [Cell("17.01.2025 16:00"), Cell("16:00"), Cell(None),
+             Cell("Покупка"), Cell("-1000,00")],  # Outgoing - should be filtered
         ]
         mock_worksheet.iter_rows.return_value = mock_rows
         
@@ -372,6 +506,30 @@ class TestSberbankStatementParser:
         
         mock_workbook.close.assert_called_once()
     
+    @patch('src.parsers.file_parsers.sberbank_parser.load_workbook')
+    def test_iter_transactions_is_lazy(self, mock_load_workbook, sberbank_parser):
+        """Test first transaction is yielded before the rest of the sheet is read"""
+        mock_workbook = Mock()
+        mock_worksheet = Mock()
+        mock_workbook.active = mock_worksheet
+        mock_load_workbook.return_value = mock_workbook
+        
+        rows = iter([
+            ("15.01.2025 14:30", "14:30", None, "Перевод СБП", "+3 500,00"),
+            ("16.01.2025 15:00", "15:00", None, "Перевод на карту", "+2 800,50"),
+        ])
+        mock_worksheet.iter_rows.return_value = rows
+        
+        with patch.object(sberbank_parser, 'validate_source', return_value=True):
+            transactions = sberbank_parser.iter_transactions(Path("test.xlsx"))
+            
+            assert next(transactions).amount == Decimal("3500.00")
+            assert len(list(rows)) == 1
+            
+            transactions.close()
+        
+        mock_workbook.close.assert_called_once()
+    
     @patch('src.parsers.file_parsers.sberbank_parser.load_workbook')
     def test_parse_transactions_empty_file(self, mock_load_workbook, sberbank_parser):
         """Test transaction parsing with empty file"""
@@ -382,7 +540,7 @@ class TestSberbankStatementParser:
         
         # Mock empty rows
         mock_rows = [
-            [Mock(value=None), Mock(value=None), Mock(value=None)],
+            [Cell(None), Cell(None), Cell(None)],
         ]
         mock_worksheet.iter_rows.return_value = mock_rows
         
@@ -423,10 +581,10 @@ class TestSberbankStatementParser:
             ("+ 10 000,00", Decimal("10000.00")),
         ]
         
-        for amount_text, expected_amount in amount_test_cases:
-            mock_row = [Mock(value=amount_text)]
-            extracted_amount = sberbank_parser._extract_amount(mock_row)
-            assert extracted_amount == expected_amount, f"Failed for amount: {amount_text}"
+        # Pairs keep the input next to the result, so one comparison names the failing case
+        extracted = [(amount_text, sberbank_parser._extract_amount([Cell(amount_text)]))
+                     for amount_text, _ in amount_test_cases]
+        assert extracted == amount_test_cases
     
     def test_date_pattern_matching(self, sberbank_parser):
         """Test various date pattern matching scenarios"""
@@ -436,7 +594,13 @@ class TestSberbankStatementParser:
             ("31.03.2025 23:59", date(2025, 3, 31)),
         ]
         
-        for date_text, expected_date in date_test_cases:
-            mock_row = [Mock(value=date_text)]
-            extracted_date = sberbank_parser._extract_date(mock_row)
-            assert extracted_date == expected_date, f"Failed for date: {date_text}"
+        extracted = [(date_text, sberbank_parser._extract_date([Cell(date_text)]))
+                     for date_text, _ in date_test_cases]
+        assert extracted == date_test_cases
+    
+    def test_patterns_compiled_once(self, sberbank_parser):
+        """Test parser instances share the module-level compiled patterns"""
+        other_parser = SberbankStatementParser()
+        
+        assert sberbank_parser.date_pattern is other_parser.date_pattern is DATE_PATTERN
+        assert sberbank_parser.amount_pattern is other_parser.amount_pattern is AMOUNT_PATTERN
@@ -13,12 +13,18 @@ sys.path.insert(0, str(src_path))
 
 from src.interfaces.web.app import create_app
 
+# Working directories for uploads, generated reports and logs
+RUNTIME_DIRS = ('uploads', 'output', 'logs')
+
+# Waitress worker threads when WEB_THREADS is not set
+DEFAULT_WEB_THREADS = 8
+
 def main():
     """Main entry point for web application"""
-    # Create required directories
-    os.makedirs('uploads', exist_ok=True)
-    os.makedirs('output', exist_ok=True)
-    os.makedirs('logs', exist_ok=True)
+    # Create required directories, a single stat when they already exist
+    for directory in map(Path, RUNTIME_DIRS):
+        if not directory.is_dir():
+            directory.mkdir(parents=True, exist_ok=True)
     
     # Create Flask app
     app = create_app()
@@ -42,9 +48,40 @@ def main():
     
     # Run the application
     try:
-        app.run(host=host, port=port, debug=debug)
+        if debug:
+            app.run(host=host, port=port, debug=True)
+        else:
+            serve(app, host, port)
     except KeyboardInterrupt:
         print("\n🛑 Сервер остановлен")
 
+def web_threads() -> int:
+    """Waitress thread count from WEB_THREADS, exits with a message on a malformed value"""
+    raw = os.getenv('WEB_THREADS', str(DEFAULT_WEB_THREADS))
+    try:
+        threads = int(raw)
+    except ValueError:
+        threads = 0
+    
+    if threads < 1:
+        sys.exit(f"❌ WEB_THREADS должно быть положительным целым числом, получено: {raw!r}")
+    return threads
+
+def serve(app, host: str, port: int):
+    """Serve app with waitress when it is installed, Werkzeug server otherwise"""
+    threads = web_threads()
+    
+    try:
+        from waitress import serve as waitress_serve
+    except ImportError:
+        app.logger.warning(
+            "waitress is not installed, falling back to the Werkzeug development server; "
+            "install waitress for production use"
+        )
+        app.run(host=host, port=port, debug=False, threaded=True)
+        return
+    
+    waitress_serve(app, host=host, port=port, threads=threads)
+
 if __name__ == '__main__':
     main()
\ No newline at end of file